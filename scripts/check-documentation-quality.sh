@@ -111,208 +111,12 @@ fi
 
 echo ""
 
-# Check 4: Check for duplicate headings
-echo "4. Checking for duplicate content..."
-$PYTHON_CMD << 'EOF'
-import os
-import re
-import glob
-import hashlib
-
-duplicates_found = False
-
-# Check main documentation files for duplicate headings
-main_files = ['README.md', 'USAGE_EXAMPLES.md', 'CONTRIBUTING.md']
-for file in main_files:
-    if not os.path.exists(file):
-        continue
-    
-    with open(file, 'r') as f:
-        content = f.read()
-        
-    # Find all H2 headings
-    headings = re.findall(r'^## (.+)$', content, re.MULTILINE)
-    seen = {}
-    for heading in headings:
-        if heading in seen:
-            print(f"⚠ Duplicate heading in {file}: '{heading}'")
-            duplicates_found = True
-        else:
-            seen[heading] = 1
-
-# Check for duplicate file content across repository
-md_files = [f for f in glob.glob('**/*.md', recursive=True) if '.git' not in f]
-file_hashes = {}
-for f in md_files:
-    try:
-        with open(f, 'rb') as file:
-            content = file.read()
-            if len(content) > 0:
-                content_hash = hashlib.sha256(content).hexdigest()
-                if content_hash not in file_hashes:
-                    file_hashes[content_hash] = []
-                file_hashes[content_hash].append(f)
-    except (OSError, UnicodeDecodeError):
-        continue
-
-# Report duplicate files
-for hash_val, files in file_hashes.items():
-    if len(files) > 1:
-        print(f"⚠ Duplicate file content detected:")
-        for f in files:
-            print(f"    {f}")
-        duplicates_found = True
-
-if not duplicates_found:
-    print("✓ No duplicate headings or file content found")
-EOF
-
-echo ""
-
-# Check 5: Check for broken internal links
-echo "5. Checking for broken internal links..."
-$PYTHON_CMD << 'EOF'
-import os
-import re
-import glob
-
-link_pattern = re.compile(r'\[.*?\]\(([^)]*\.md)\)')
-md_files = glob.glob('**/*.md', recursive=True)
-md_files = [f for f in md_files if '.git' not in f]
-
-broken_links = []
-for md_file in md_files:
-    if not os.path.isfile(md_file):
-        continue
-    
-    try:
-        with open(md_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-    except:
-        continue
-        
-    for match in link_pattern.finditer(content):
-        link = match.group(1)
-        
-        # Skip external links
-        if link.startswith('http'):
-            continue
-        
-        # Resolve relative path
-        link_path = os.path.normpath(os.path.join(os.path.dirname(md_file), link.lstrip('./')))
-        
-        if not os.path.exists(link_path):
-            broken_links.append((md_file, link))
-
-if broken_links:
-    print(f"⚠ Found {len(broken_links)} broken link(s):")
-    for file, link in broken_links[:5]:
-        print(f"  {file} -> {link}")
-    if len(broken_links) > 5:
-        print(f"  ... and {len(broken_links) - 5} more")
-else:
-    print("✓ No broken internal links found")
-EOF
-
-echo ""
-
-# Check 6: Check for small/stub files
-echo "6. Checking for small or stub files..."
-$PYTHON_CMD << 'EOF'
-import os
-import glob
-
-small_files = []
-md_files = [f for f in glob.glob('**/*.md', recursive=True) if '.git' not in f]
-
-# Define minimum file size threshold (500 bytes)
-MIN_FILE_SIZE = 500
-# Define minimum content lines (excluding headings and empty lines)
-MIN_CONTENT_LINES = 10
-
-for f in md_files:
-    file_size = os.path.getsize(f)
-    
-    # Check file size
-    if file_size < MIN_FILE_SIZE:
-        try:
-            with open(f, 'r', encoding='utf-8', errors='ignore') as file:
-                lines = file.readlines()
-                # Count non-empty, non-heading lines
-                content_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
-                
-                if len(content_lines) < MIN_CONTENT_LINES:
-                    small_files.append((f, file_size, len(content_lines)))
-        except (OSError, UnicodeDecodeError):
-            continue
-
-if small_files:
-    print(f"⚠ Found {len(small_files)} small or stub file(s) that may need content:")
-    for f, size, lines in sorted(small_files, key=lambda x: x[1])[:10]:
-        print(f"    {f} ({size} bytes, {lines} content lines)")
-    if len(small_files) > 10:
-        print(f"    ... and {len(small_files) - 10} more")
-    print("  Consider adding more content or consolidating with related documents")
-else:
-    print("✓ No small or stub files detected")
-EOF
-
-echo ""
-
-# Check 7: Validate file organization
-echo "7. Checking file organization..."
-$PYTHON_CMD << 'EOF'
-import os
-import glob
-
-# Check for design documents in root that should be in proper folders
-root_md_files = glob.glob('*.md')
-expected_root_files = [
-    'README.md', 
-    'CONTRIBUTING.md', 
-    'DOCUMENTATION_BEST_PRACTICES.md',
-    'USAGE_EXAMPLES.md',
-    'LICENSE.md'
-]
-
-misplaced_files = []
-for f in root_md_files:
-    basename = os.path.basename(f)
-    if basename not in expected_root_files:
-        # Check if it's a design document that should be in docs/ or design/
-        if any(keyword in basename.lower() for keyword in ['design', 'gdd', 'outline', 'spec', 'plan']):
-            misplaced_files.append(f)
-
-# Check for proper README files in directories
-expected_readme_dirs = [
-    'docs', 'docs/core', 'docs/gameplay', 'docs/systems', 'docs/world',
-    'docs/ui-ux', 'docs/audio', 'docs/research',
-    'templates', 'assets', 'design', 'research', 'roadmap', 'scripts'
-]
-
-missing_readmes = []
-for dir_path in expected_readme_dirs:
-    readme_path = os.path.join(dir_path, 'README.md')
-    if os.path.isdir(dir_path) and not os.path.exists(readme_path):
-        missing_readmes.append(dir_path)
-
-issues_found = False
-
-if misplaced_files:
-    print(f"⚠ Found {len(misplaced_files)} design document(s) in root that should be organized:")
-    for f in misplaced_files:
-        print(f"    {f} -> Consider moving to docs/, design/, or templates/")
-    issues_found = True
-
-if missing_readmes:
-    print(f"⚠ Found {len(missing_readmes)} directories without README.md:")
-    for d in missing_readmes:
-        print(f"    {d}/")
-    issues_found = True
-
-if not issues_found:
-    print("✓ File organization looks good")
-EOF
+# Checks 4-7: duplicate content, broken internal links, small/stub files and
+# file organization run in one pass of the quality engine (research-tools quality),
+# which walks the repository once and reads each changed markdown file once.
+# Pass file names to limit findings to those documents, e.g. from a pre-commit hook:
+#   ./scripts/check-documentation-quality.sh docs/new-page.md
+$PYTHON_CMD scripts/research_tools quality ${1:+--files "$@"}
 
 echo ""
 
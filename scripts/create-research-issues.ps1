@@ -1,17 +1,24 @@
 #!/usr/bin/env pwsh
 <#
 .SYNOPSIS
-    Creates GitHub issues for all 40 research assignment groups using GitHub CLI.
+    Publishes new or changed research assignment issues using GitHub CLI.
 
 .DESCRIPTION
     This PowerShell script automates the creation of GitHub issues for the BlueMarble
-    research assignment groups. It creates:
+    research assignment groups. On a first run it creates:
     - 1 parent issue for Phase 1
     - 40 individual group issues
     - 1 Phase 2 planning issue
     
-    The script adds a 120-second delay between group issue creation to avoid
-    rate limiting and allow for proper issue processing.
+    Only the issues listed in changes.json (written by generate-research-issues.py)
+    are published. Each successful publish is recorded in published-manifest.json,
+    and entries whose hash is already recorded there are skipped, so a rerun after
+    an interruption continues where it stopped and a rerun without changes exits
+    immediately. Every issue is looked up by title first: an existing issue is
+    edited in place, and only a missing one is created.
+    
+    The script adds a 120-second delay between issues to avoid rate limiting and
+    allow for proper issue processing.
 
 .PARAMETER OutputDir
     Directory containing the generated issue files. 
@@ -23,6 +30,11 @@
 .PARAMETER SkipDelay
     Skip the 120-second delay between issues (not recommended for production use).
 
+.PARAMETER All
+    Publish every issue in manifest.json instead of only those in changes.json,
+    ignoring published-manifest.json. Existing issues are still edited, not
+    duplicated.
+
 .EXAMPLE
     .\create-research-issues.ps1
     
@@ -42,7 +54,8 @@
 param(
     [string]$OutputDir = $(if ($IsWindows -or $env:OS -match "Windows") { "C:\tmp\research-issues" } else { "/tmp/research-issues" }),
     [string]$Assignee = "",
-    [switch]$SkipDelay = $false
+    [switch]$SkipDelay = $false,
+    [switch]$All = $false
 )
 
 # Color output functions
@@ -104,18 +117,83 @@ function Test-Prerequisites {
     }
     Write-Success "Output directory exists: $OutputDir"
     
-    # Check if issue files exist
-    $parentIssue = Join-Path $OutputDir "issue-parent-phase-1.md"
-    if (-not (Test-Path $parentIssue)) {
-        Write-Error "Issue files not found in: $OutputDir"
+    # Check if issue files and the change list exist
+    $manifestFile = Join-Path $OutputDir "manifest.json"
+    $changesFile = Join-Path $OutputDir "changes.json"
+    if (-not (Test-Path $manifestFile) -or -not (Test-Path $changesFile)) {
+        Write-Error "manifest.json/changes.json not found in: $OutputDir"
         Write-Info "Run: python3 scripts/generate-research-issues.py"
         return $false
     }
-    Write-Success "Issue files found"
+    Write-Success "Issue manifest found"
     
     return $true
 }
 
+# Find the number of an existing issue by its exact title
+function Find-GitHubIssue {
+    param([string]$Title)
+    
+    $json = gh issue list --state all --search "`"$Title`" in:title" --json number,title 2>&1
+    if ($LASTEXITCODE -ne 0) {
+        return $null
+    }
+    $match = $json | ConvertFrom-Json | Where-Object { $_.title -eq $Title } | Select-Object -First 1
+    if ($match) { return $match.number }
+    return $null
+}
+
+# Edit the existing issue with this title, or create it if there is none. Looking
+# the title up even for added issues keeps a rerun from duplicating issues that were
+# created before an interruption kept them out of published-manifest.json
+function Publish-GitHubIssue {
+    param(
+        [string]$Title,
+        [string]$BodyFile,
+        [string]$Labels,
+        [string]$Assignee,
+        [string]$Status
+    )
+    
+    $number = Find-GitHubIssue -Title $Title
+    if (-not $number) {
+        if ($Status -eq "changed") {
+            Write-Warning "No existing issue titled '$Title'; creating it instead"
+        }
+        return New-GitHubIssue -Title $Title -BodyFile $BodyFile -Labels $Labels -Assignee $Assignee
+    }
+    
+    Write-Info "Updating #${number}: $Title"
+    $result = gh issue edit $number --body-file "$BodyFile" --add-label "$Labels" 2>&1
+    if ($LASTEXITCODE -eq 0) {
+        Write-Success "Updated: $Title"
+        Write-Host "  URL: $result"
+        return $true
+    }
+    Write-Error "Failed to update: $Title"
+    Write-Host "  Error: $result" -ForegroundColor Red
+    return $false
+}
+
+# Record a published issue so it is skipped on the next run
+function Save-PublishedEntry {
+    param(
+        [string]$File,
+        [object]$Entry
+    )
+    
+    $publishedFile = Join-Path $OutputDir "published-manifest.json"
+    if (Test-Path $publishedFile) {
+        $published = Get-Content $publishedFile -Raw | ConvertFrom-Json
+    } else {
+        $published = [PSCustomObject]@{ issues = [PSCustomObject]@{} }
+    }
+    
+    $record = [PSCustomObject]@{ sha256 = $Entry.sha256; title = $Entry.title; labels = $Entry.labels }
+    $published.issues | Add-Member -NotePropertyName $File -NotePropertyValue $record -Force
+    $published | ConvertTo-Json -Depth 5 | Set-Content -Path $publishedFile -Encoding UTF8
+}
+
 # Create a single issue
 function New-GitHubIssue {
     param(
@@ -165,101 +243,95 @@ if (-not (Test-Prerequisites)) {
     exit 1
 }
 
+# Build the publish list from changes.json (or the whole manifest with -All)
+if ($All) {
+    $manifest = Get-Content (Join-Path $OutputDir "manifest.json") -Raw | ConvertFrom-Json
+    $toPublish = @(foreach ($property in $manifest.issues.PSObject.Properties) {
+        $property.Value | Add-Member -NotePropertyName file -NotePropertyValue $property.Name -Force -PassThru |
+            Add-Member -NotePropertyName status -NotePropertyValue "added" -Force -PassThru
+    })
+} else {
+    $changes = Get-Content (Join-Path $OutputDir "changes.json") -Raw | ConvertFrom-Json
+    $toPublish = @($changes.publish)
+    
+    # changes.json is not rewritten while publishing; skip what an earlier run published
+    $publishedFile = Join-Path $OutputDir "published-manifest.json"
+    $publishedIssues = $null
+    if (Test-Path $publishedFile) {
+        $publishedIssues = (Get-Content $publishedFile -Raw | ConvertFrom-Json).issues
+    }
+    if ($publishedIssues) {
+        $toPublish = @($toPublish | Where-Object {
+            $record = $publishedIssues.PSObject.Properties[$_.file]
+            -not ($record -and $record.Value.sha256 -eq $_.sha256)
+        })
+    }
+}
+
+if ($toPublish.Count -eq 0) {
+    Write-Success "Nothing to publish: all issues match published-manifest.json"
+    exit 0
+}
+
+$added = @($toPublish | Where-Object { $_.status -eq "added" }).Count
+$changed = @($toPublish | Where-Object { $_.status -eq "changed" }).Count
+
 Write-Host ""
-$response = Read-Host "This will create 42 issues (1 parent + 40 groups + 1 phase 2). Continue? (y/n)"
+$response = Read-Host "This will publish $($toPublish.Count) issue(s) ($added added, $changed changed; existing issues are edited). Continue? (y/n)"
 if ($response -ne 'y' -and $response -ne 'Y') {
     Write-Info "Operation cancelled by user."
     exit 0
 }
 
-Write-Header "Creating Issues"
-
-# Step 1: Create parent issue
-Write-Info "Step 1: Creating parent Phase 1 issue..."
-$parentFile = Join-Path $OutputDir "issue-parent-phase-1.md"
-$success = New-GitHubIssue `
-    -Title "Research Phase 1: 40 Parallel Assignment Groups" `
-    -BodyFile $parentFile `
-    -Labels "research,phase-1,epic" `
-    -Assignee $Assignee
-
-if (-not $success) {
-    Write-Error "Failed to create parent issue. Aborting."
-    exit 1
+Write-Header "Publishing Issues"
+if (-not $SkipDelay -and $toPublish.Count -gt 1) {
+    Write-Warning "This will take approximately $([math]::Ceiling(($toPublish.Count - 1) * 2)) minutes due to rate limiting delays..."
+    Write-Host ""
 }
 
-Write-Host ""
-Write-Info "Parent issue created. Press Enter to continue with group issues..."
-Read-Host
-
-# Step 2: Create all 40 group issues
-Write-Info "Step 2: Creating 40 group issues..."
-Write-Warning "This will take approximately 80 minutes due to rate limiting delays..."
-Write-Host ""
-
 $failedIssues = @()
-$createdCount = 0
+$publishedCount = 0
 
-for ($i = 1; $i -le 40; $i++) {
-    $num = $i.ToString("00")
-    $groupFile = Join-Path $OutputDir "issue-group-$num.md"
+for ($i = 0; $i -lt $toPublish.Count; $i++) {
+    $entry = $toPublish[$i]
+    $bodyFile = Join-Path $OutputDir $entry.file
+    $labels = $entry.labels -join ","
     
-    if (-not (Test-Path $groupFile)) {
-        Write-Warning "Group file not found: $groupFile (skipping)"
+    if (-not (Test-Path $bodyFile)) {
+        Write-Warning "Issue file not found: $bodyFile (skipping)"
         continue
     }
     
-    # Read the file to extract title and priority
-    $content = Get-Content $groupFile -Raw
-    $titleMatch = $content -match "# Research Assignment Group \d+\s*\n\s*\*\*Labels:\*\*.*priority-(\w+)"
-    $priority = if ($matches) { $matches[1] } else { "medium" }
-    
-    $success = New-GitHubIssue `
-        -Title "Research Assignment Group $num" `
-        -BodyFile $groupFile `
-        -Labels "research,assignment-group-$num,priority-$priority,phase-1" `
-        -Assignee $Assignee
+    $success = Publish-GitHubIssue -Title $entry.title -BodyFile $bodyFile -Labels $labels -Assignee $Assignee -Status $entry.status
     
     if ($success) {
-        $createdCount++
+        $publishedCount++
+        Save-PublishedEntry -File $entry.file -Entry $entry
     } else {
-        $failedIssues += $num
+        $failedIssues += $entry.file
     }
     
-    # Add delay between issues (except for the last one)
-    if ($i -lt 40 -and -not $SkipDelay) {
+    # Add delay between issues (except after the last one)
+    if ($i -lt $toPublish.Count - 1 -and -not $SkipDelay) {
         Write-Info "Waiting 120 seconds before next issue to avoid rate limiting..."
-        Write-Host "  Progress: $createdCount of 40 issues created" -ForegroundColor Cyan
+        Write-Host "  Progress: $publishedCount of $($toPublish.Count) issues published" -ForegroundColor Cyan
         Start-Sleep -Seconds 120
         Write-Host ""
     }
 }
 
-Write-Host ""
-Write-Success "Created $createdCount of 40 group issues"
-
-if ($failedIssues.Count -gt 0) {
-    Write-Warning "Failed to create issues: $($failedIssues -join ', ')"
-}
-
-# Step 3: Create Phase 2 planning issue
-Write-Host ""
-Write-Info "Step 3: Creating Phase 2 planning issue..."
-$phase2File = Join-Path $OutputDir "issue-phase-2-planning.md"
-$success = New-GitHubIssue `
-    -Title "Research Phase 2: Planning and New Assignment Creation" `
-    -BodyFile $phase2File `
-    -Labels "research,phase-2,planning" `
-    -Assignee $Assignee
-
 # Final summary
 Write-Header "Summary"
-Write-Success "Issue creation complete!"
-Write-Info "Total issues created: $(42 - $failedIssues.Count) of 42"
+Write-Success "Issue publishing complete!"
+Write-Info "Total issues published: $publishedCount of $($toPublish.Count)"
+
+if ($changes -and $changes.removed.Count -gt 0) {
+    Write-Warning "Issues no longer generated (close manually if needed): $($changes.removed -join ', ')"
+}
 
 if ($failedIssues.Count -gt 0) {
-    Write-Warning "Some issues failed to create. Please create them manually."
-    Write-Info "Failed groups: $($failedIssues -join ', ')"
+    Write-Warning "Some issues failed to publish. Rerun the script to retry them."
+    Write-Info "Failed files: $($failedIssues -join ', ')"
 }
 
 Write-Host ""
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Research Issue Publisher
+========================
+
+Compatibility wrapper; the implementation lives in research_tools.publish.
+Equivalent to:
+
+    research-tools publish-issues [options]
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from research_tools.cli import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main(["publish-issues", *sys.argv[1:]]))
@@ -0,0 +1,14 @@
+"""
+BlueMarble Research Tools
+=========================
+
+Importable package behind the research automation scripts: corpus index,
+source discovery, issue generation and publishing, search, documentation
+quality and phase validation. Run `research-tools --help` (or
+`python3 scripts/research_tools --help` from a checkout) for the commands.
+
+Submodules are not imported here so that the CLI starts fast; import the
+one you need, e.g. `from research_tools.corpus_index import open_index`.
+"""
+
+__version__ = "0.1.0"
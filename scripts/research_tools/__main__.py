@@ -0,0 +1,17 @@
+"""Allow `python3 -m research_tools` and `python3 scripts/research_tools`"""
+
+import os
+import sys
+
+if not __package__:
+    # Run as a directory: make the package importable from its parent
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    if sys.path and os.path.abspath(sys.path[0]) == package_dir:
+        sys.path[0] = os.path.dirname(package_dir)
+    else:
+        sys.path.insert(0, os.path.dirname(package_dir))
+
+from research_tools.cli import main  # noqa: E402
+
+if __name__ == "__main__":
+    sys.exit(main())
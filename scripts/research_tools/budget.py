@@ -0,0 +1,162 @@
+"""
+Per-Document Extraction Budget
+==============================
+
+Runs document extraction in worker processes that can be killed, so one
+pathological document (a huge file, a YAML frontmatter bomb, a line that
+sends a regex quadratic) costs at most its time budget instead of stalling
+the whole run.
+
+`run_isolated(func, jobs, workers, seconds)` hands jobs to a small pool of
+long-lived worker processes over pipes. The parent waits on all pipes with
+the earliest deadline as timeout; a worker still busy when its job's
+deadline passes is killed and replaced, and the job is reported as a
+timeout. A worker that dies (e.g. out of memory) is reported as crashed
+and replaced the same way. Jobs that finish in time cost one pipe round
+trip more than running in-process.
+
+ExtractionBudget holds the limits (seconds and bytes per document) and the
+rule for when a quarantined document deserves another full extraction:
+only once the limit it broke has been raised, or when the file changes.
+
+Usage:
+    from research_tools.budget import ExtractionBudget
+    index.update(budget=ExtractionBudget(seconds=5, max_bytes=1024 * 1024))
+
+    research-tools index --doc-timeout 5 --max-doc-kb 1024
+    research-tools discover --doc-timeout 5 --max-doc-kb 1024
+"""
+
+import time
+from typing import Callable, Iterable, List, Tuple
+
+DEFAULT_SECONDS = 5.0
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+
+class ExtractionBudget:
+    """Wall-clock seconds and input bytes allowed for extracting one document"""
+
+    def __init__(self, seconds: float = DEFAULT_SECONDS, max_bytes: int = DEFAULT_MAX_BYTES):
+        if seconds <= 0 or max_bytes <= 0:
+            raise ValueError("extraction budget limits must be positive")
+        self.seconds = seconds
+        self.max_bytes = max_bytes
+
+    def to_dict(self):
+        return {"seconds": self.seconds, "max_bytes": self.max_bytes}
+
+    def retry(self, quarantine: dict) -> bool:
+        """Whether an unchanged, quarantined document should be extracted in full again"""
+        previous = quarantine.get("budget") or {}
+        if quarantine.get("reason") == "size":
+            return self.max_bytes > previous.get("max_bytes", 0)
+        if quarantine.get("reason") == "timeout":
+            return self.seconds > previous.get("seconds", 0)
+        return False
+
+    def __repr__(self):
+        return f"ExtractionBudget(seconds={self.seconds:g}, max_bytes={self.max_bytes})"
+
+
+def _worker(conn, func):
+    """Worker loop: run func(*job) for each job received until None"""
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if job is None:
+            return
+        started = time.perf_counter()
+        try:
+            value = func(*job)
+        except Exception as e:
+            conn.send(("error", f"{type(e).__name__}: {e}", time.perf_counter() - started))
+        else:
+            conn.send(("ok", value, time.perf_counter() - started))
+
+
+def run_isolated(func: Callable, jobs: Iterable[Tuple], workers: int,
+                 seconds: float) -> List[Tuple[str, object, float]]:
+    """Run func(*job) for every job in killable worker processes.
+
+    `jobs` may be a lazy iterator (e.g. fed by a read-ahead prefetcher); the
+    next job is only taken when a worker is free. Returns, in job order,
+    (status, value, elapsed seconds) where status is "ok" (value is the
+    result), "error" (value is the exception text), "timeout" or "crashed"
+    (value is None or the exit status). Elapsed is the worker's own time for
+    finished jobs and the wall time since dispatch otherwise. func and its
+    arguments must be picklable.
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    pending = enumerate(jobs)
+    following = next(pending, None)
+    if following is None:
+        return []
+    results = {}
+    context = multiprocessing.get_context()
+
+    def spawn():
+        parent, child = context.Pipe()
+        process = context.Process(target=_worker, args=(child, func), daemon=True)
+        process.start()
+        child.close()
+        return process, parent
+
+    idle = [spawn() for _ in range(max(1, workers))]
+    # connection -> (process, job index, start time)
+    busy = {}
+    try:
+        while following is not None or busy:
+            while following is not None and idle:
+                process, conn = idle.pop()
+                index, job = following
+                conn.send(job)
+                busy[conn] = (process, index, time.monotonic())
+                following = next(pending, None)
+
+            deadline = min(started for _, _, started in busy.values()) + seconds
+            ready = wait(list(busy), timeout=max(0.0, deadline - time.monotonic()))
+
+            for conn in ready:
+                process, index, started = busy.pop(conn)
+                elapsed = time.monotonic() - started
+                try:
+                    status, value, elapsed = conn.recv()
+                except (EOFError, OSError):
+                    process.join(1)
+                    results[index] = ("crashed", process.exitcode, elapsed)
+                    conn.close()
+                    if following is not None:
+                        idle.append(spawn())
+                    continue
+                results[index] = (status, value, elapsed)
+                idle.append((process, conn))
+
+            now = time.monotonic()
+            for conn, (process, index, started) in list(busy.items()):
+                if now - started < seconds:
+                    continue
+                del busy[conn]
+                process.kill()
+                process.join()
+                conn.close()
+                results[index] = ("timeout", None, now - started)
+                if following is not None:
+                    idle.append(spawn())
+    finally:
+        for process, conn in idle:
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+        for process, conn in [*idle, *((p, c) for c, (p, _, _) in busy.items())]:
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+                process.join()
+            conn.close()
+    return [results[index] for index in range(len(results))]
@@ -0,0 +1,381 @@
+"""
+Streaming Catalog Formats
+=========================
+
+Writers and readers for discovered-source catalogs that handle one record
+at a time instead of building the whole report in memory:
+
+    jsonl   JSON Lines: a header record, then one source per line
+    yaml    a YAML document whose `sources` sequence is emitted per record
+    json    the original single-object report (kept for compatibility)
+
+Any of them can be compressed with gzip or xz (stdlib), chosen explicitly
+or from a `.gz` / `.xz` suffix. Records are serialized with orjson when it
+is installed, otherwise with json's C encoder (compact, no indent). The old
+`json.dump(report, f, indent=2)` ran the pure-Python encoder over the whole
+report.
+
+JSON Lines header:
+
+    {"format": "bluemarble-source-catalog", "version": 1, "generated": "...",
+     "total_sources": N, "categories": [...], "priorities": [...]}
+
+Reading back (`open_catalog` / `iter_sources`) streams JSONL record by
+record, whatever the compression; `.json` and `.yaml` files are loaded whole.
+
+Usage:
+    research-tools discover --format jsonl --output auto-discovered-sources.jsonl.gz
+    research-tools catalog-io research/literature/auto-discovered-sources.jsonl.gz --head 3
+    research-tools catalog-io --benchmark 100000
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+CATALOG_FORMAT = "bluemarble-source-catalog"
+CATALOG_VERSION = 1
+
+COMPRESSIONS = ("gzip", "xz")
+SUFFIXES = {".gz": "gzip", ".xz": "xz"}
+EXTENSIONS = {"json": ".json", "jsonl": ".jsonl", "yaml": ".yaml"}
+
+# None until first use; then (name, dumps-to-bytes, loads)
+_codec = None
+
+
+def json_codec() -> Tuple[str, object, object]:
+    """The fastest available compact JSON encoder (returning bytes) and decoder"""
+    global _codec
+    if _codec is None:
+        try:
+            import orjson
+            _codec = ("orjson", orjson.dumps, orjson.loads)
+        except ImportError:
+            encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+            _codec = ("json", lambda value: encode(value).encode("utf-8"), json.loads)
+    return _codec
+
+
+def compression_for(path: str, compression: Optional[str] = None) -> Optional[str]:
+    """Explicit compression, else the one implied by the file suffix"""
+    if compression in (None, "auto"):
+        return SUFFIXES.get(os.path.splitext(str(path))[1])
+    if compression == "none":
+        return None
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"unknown compression '{compression}' (expected gzip or xz)")
+    return compression
+
+
+def output_path(path: str, output_format: str, compression: Optional[str] = None) -> str:
+    """Report path for a format: replace a .md suffix, then add the compression suffix"""
+    path = str(path)
+    extension = EXTENSIONS[output_format]
+    if path.endswith(".md"):
+        path = path[:-3] + extension
+    suffix = {v: k for k, v in SUFFIXES.items()}.get(compression)
+    if suffix and not path.endswith(suffix):
+        path += suffix
+    return path
+
+
+def open_binary(path: str, mode: str, compression: Optional[str] = None):
+    """Open a file for binary reading or writing, compressed if asked or implied"""
+    compression = compression_for(path, compression)
+    if compression == "gzip":
+        import gzip
+        # Level 6 writes twice as fast as the default 9 and is ~5% larger
+        return gzip.open(path, mode, compresslevel=6) if "w" in mode else gzip.open(path, mode)
+    if compression == "xz":
+        import lzma
+        # The default preset 6 was >10x slower than 1 on catalogs, for no smaller output
+        return lzma.open(path, mode, preset=1) if "w" in mode else lzma.open(path, mode)
+    return open(path, mode)
+
+
+def catalog_header(generated: str, total_sources: Optional[int] = None,
+                   categories=(), priorities=(), quarantined=()) -> Dict:
+    """Header record of a streamed catalog"""
+    return {
+        "format": CATALOG_FORMAT,
+        "version": CATALOG_VERSION,
+        "generated": generated,
+        "total_sources": total_sources,
+        "categories": sorted(categories),
+        "priorities": sorted(priorities),
+        "quarantined": list(quarantined),
+    }
+
+
+def write_jsonl(path: str, header: Dict, records: Iterable[Dict],
+                compression: Optional[str] = None) -> int:
+    """Write a header line and one line per record; returns the record count"""
+    _, dumps, _ = json_codec()
+    count = 0
+    with open_binary(path, "wb", compression) as f:
+        f.write(dumps(header) + b"\n")
+        for record in records:
+            f.write(dumps(record) + b"\n")
+            count += 1
+    return count
+
+
+def write_json(path: str, report: Dict, compression: Optional[str] = None):
+    """The single-object JSON report (indented, as before)"""
+    name, _, _ = json_codec()
+    if name == "orjson":
+        import orjson
+        data = orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    else:
+        # The C encoder only handles indent=None; this is still one write, not thousands
+        data = json.dumps(report, indent=2).encode("utf-8")
+    with open_binary(path, "wb", compression) as f:
+        f.write(data)
+
+
+# Plain YAML scalars that would not load back as the same string
+_YAML_PLAIN = re.compile(r"[A-Za-z_./][A-Za-z0-9 _./()+-]*\Z")
+_YAML_SPECIAL = re.compile(
+    r"(?i)(?:y|n|yes|no|true|false|on|off|null|~|\.nan|\.inf|[-+]?\.inf)\Z"
+    r"|[-+]?(?:\.[0-9]|[0-9])|[0-9:]+\Z")
+
+
+def yaml_scalar(value) -> str:
+    """One scalar in YAML syntax; strings stay plain only when that is unambiguous"""
+    if type(value) is str:
+        return _yaml_string(value)
+    if value is None:
+        return "null"
+    if value is True or value is False:
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    return _yaml_string(str(value))
+
+
+@lru_cache(maxsize=8192)
+def _yaml_string(text: str) -> str:
+    """Plain or double-quoted form of a string (categories, dates and file names repeat a lot)"""
+    if _YAML_PLAIN.match(text) and not _YAML_SPECIAL.match(text) and not text.endswith(" ") \
+            and " #" not in text and ": " not in text:
+        return text
+    # A JSON string is a valid YAML double-quoted scalar
+    return json.dumps(text, ensure_ascii=False)
+
+
+def yaml_lines(value, indent: str = "") -> Iterator[str]:
+    """Block-style YAML lines for a mapping whose values are scalars, lists or mappings"""
+    for key, item in value.items():
+        name = yaml_scalar(key)
+        # Strings first: they are nearly every value of a catalog record
+        if type(item) is str:
+            yield f"{indent}{name}: {_yaml_string(item)}"
+        elif isinstance(item, dict):
+            if item:
+                yield f"{indent}{name}:"
+                yield from yaml_lines(item, indent + "  ")
+            else:
+                yield f"{indent}{name}: {{}}"
+        elif isinstance(item, (list, tuple)):
+            if not item:
+                yield f"{indent}{name}: []"
+                continue
+            yield f"{indent}{name}:"
+            for element in item:
+                if isinstance(element, dict):
+                    yield from _yaml_sequence_mapping(element, indent)
+                else:
+                    yield f"{indent}- {yaml_scalar(element)}"
+        else:
+            yield f"{indent}{name}: {yaml_scalar(item)}"
+
+
+def _yaml_sequence_mapping(mapping: Dict, indent: str) -> Iterator[str]:
+    """A mapping as one item of a block sequence ("- key: value" then "  key: value")"""
+    if not mapping:
+        yield f"{indent}- {{}}"
+        return
+    for number, line in enumerate(yaml_lines(mapping, indent + "  ")):
+        yield f"{indent}- {line[len(indent) + 2:]}" if number == 0 else line
+
+
+def write_yaml(path: str, header: Dict, records: Iterable[Dict],
+               compression: Optional[str] = None) -> int:
+    """Write the header fields and then each record as an item of `sources`"""
+    count = 0
+    with open_binary(path, "wb", compression) as f:
+        f.write(("\n".join(yaml_lines(header)) + "\n").encode("utf-8"))
+        f.write(b"sources:")
+        for record in records:
+            f.write(("\n" + "\n".join(_yaml_sequence_mapping(record, ""))).encode("utf-8"))
+            count += 1
+        f.write(b" []\n" if count == 0 else b"\n")
+    return count
+
+
+def open_catalog(path: str, compression: Optional[str] = None) -> Tuple[Dict, Iterator[Dict]]:
+    """Header and a lazy iterator over the sources of a catalog file.
+
+    JSON Lines is read one line at a time; JSON and YAML reports are loaded
+    whole. The iterator owns the open file and closes it when exhausted.
+    """
+    name = str(path)
+    # The format comes from the name without its compression suffix, if any;
+    # an explicit compression does not imply one
+    base, suffix = os.path.splitext(name)
+    if suffix not in SUFFIXES:
+        base = name
+    if base.endswith(".jsonl"):
+        _, _, loads = json_codec()
+        f = open_binary(name, "rb", compression)
+        first = f.readline()
+        header = loads(first) if first.strip() else {}
+        if header.get("format") != CATALOG_FORMAT:
+            f.close()
+            raise ValueError(f"{name} is not a {CATALOG_FORMAT} JSON Lines file")
+
+        def records():
+            with f:
+                for line in f:
+                    if line.strip():
+                        yield loads(line)
+
+        return header, records()
+
+    with open_binary(name, "rb", compression) as f:
+        raw = f.read()
+    if base.endswith((".yaml", ".yml")):
+        from .frontmatter import load_yaml
+
+        state = load_yaml()
+        if state is None:
+            raise ValueError("reading YAML catalogs requires PyYAML")
+        yaml, loader, _ = state
+        data = yaml.load(raw, Loader=loader)
+    else:
+        data = json.loads(raw)
+    sources = data.pop("sources", None) or []
+    return data, iter(sources)
+
+
+def iter_sources(path: str, compression: Optional[str] = None) -> Iterator[Dict]:
+    """Just the sources of a catalog file, streamed where the format allows"""
+    return open_catalog(path, compression)[1]
+
+
+def synthetic_sources(count: int) -> Iterator[Dict]:
+    """Deterministic catalog records shaped like SourceDiscovery's"""
+    priorities = ["critical", "high", "medium", "low"]
+    categories = ["gamedev-tech", "gamedev-design", "gamedev-art", "survival", "networking", "general"]
+    efforts = ["8-12 hours", "2-4 hours", "1-3 hours", "4-6 hours"]
+    for n in range(count):
+        yield {
+            "title": f"Source {n}: Game Engine Architecture, edition {n % 7 + 1}",
+            "description": "Comprehensive reference on engine subsystems, memory management and "
+                           f"multiplayer synchronization (entry {n})",
+            "priority": priorities[n % 4],
+            "category": categories[n % 6],
+            "references": [f"game-dev-analysis-{n % 300:03d}.md", f"research-note-{n % 97:02d}.md"],
+            "discovered_date": "2025-01-01T00:00:00",
+            "status": "discovered",
+            "estimated_effort": efforts[n % 4],
+        }
+
+
+def benchmark(count: int, directory: str) -> list:
+    """Time and size of each format for a synthetic catalog of `count` sources"""
+    sources = list(synthetic_sources(count))
+    header = catalog_header("2025-01-01T00:00:00", count,
+                            {s["category"] for s in sources}, {s["priority"] for s in sources})
+    report = dict(header, sources=sources)
+    cases = [
+        ("json.dump indent=2 (before)", "catalog.json", None),
+        ("json", "catalog.json", None),
+        ("jsonl", "catalog.jsonl", None),
+        ("jsonl + gzip", "catalog.jsonl.gz", "gzip"),
+        ("jsonl + xz", "catalog.jsonl.xz", "xz"),
+        ("yaml", "catalog.yaml", None),
+        ("yaml + gzip", "catalog.yaml.gz", "gzip"),
+    ]
+    results = []
+    for label, name, compression in cases:
+        path = os.path.join(directory, name)
+        started = time.perf_counter()
+        if label.endswith("(before)"):
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+        elif name.startswith("catalog.json") and not name.startswith("catalog.jsonl"):
+            write_json(path, report, compression)
+        elif ".jsonl" in name:
+            write_jsonl(path, header, sources, compression)
+        else:
+            write_yaml(path, header, sources, compression)
+        write_seconds = time.perf_counter() - started
+
+        read_seconds = None
+        if ".jsonl" in name:
+            started = time.perf_counter()
+            read = sum(1 for _ in iter_sources(path))
+            read_seconds = time.perf_counter() - started
+            assert read == count, (label, read)
+        results.append({
+            "format": label,
+            "bytes": os.path.getsize(path),
+            "write_ms": round(write_seconds * 1000, 1),
+            "stream_read_ms": round(read_seconds * 1000, 1) if read_seconds is not None else None,
+        })
+        os.unlink(path)
+    return results
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Read catalog files or benchmark the output formats")
+    parser.add_argument("file", nargs="?", help="Catalog file to read (.jsonl[.gz|.xz], .json, .yaml)")
+    parser.add_argument("--head", type=int, default=0, help="Print the first N sources")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="Write and read a synthetic catalog of N sources in every format")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmp:
+            results = benchmark(args.benchmark, tmp)
+        baseline = results[0]
+        print(f"{args.benchmark} sources, encoder: {json_codec()[0]}")
+        print(f"{'format':<30} {'size':>12} {'vs before':>10} {'write ms':>10} {'read ms':>9}")
+        for row in results:
+            read = f"{row['stream_read_ms']:.1f}" if row["stream_read_ms"] is not None else "-"
+            print(f"{row['format']:<30} {row['bytes']:>12,} {row['bytes'] / baseline['bytes']:>9.0%} "
+                  f"{row['write_ms']:>10.1f} {read:>9}")
+        return 0
+
+    if not args.file:
+        parser.error("a catalog file or --benchmark is required")
+    try:
+        header, sources = open_catalog(args.file)
+        counts = {}
+        shown = 0
+        for source in sources:
+            counts[source.get("priority")] = counts.get(source.get("priority"), 0) + 1
+            if shown < args.head:
+                print(json.dumps(source, indent=2, ensure_ascii=False))
+                shown += 1
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+    print(f"{args.file}: {sum(counts.values())} sources (generated {header.get('generated')})")
+    for priority, count in sorted(counts.items(), key=lambda item: str(item[0])):
+        print(f"  {priority}: {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
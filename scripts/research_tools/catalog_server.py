@@ -0,0 +1,480 @@
+"""
+Discovered-Source Catalog Server
+================================
+
+A long-running local service that keeps the SourceDiscovery catalog in
+memory, so editor integrations and scripts can ask "is this source already
+discovered?" without spawning a full discovery scan.
+
+The catalog is held as an immutable snapshot with secondary indexes on
+normalized title, category, priority and referencing document. A watcher
+thread polls research/literature (one scandir per interval). When a
+document changes, it refreshes only those documents in the corpus index,
+replays the in-memory records into a new snapshot and swaps it in.
+Lookups never wait for a reload.
+
+Endpoints (JSON over HTTP on 127.0.0.1, or over a Unix socket with --socket):
+
+    GET  /lookup?title=T          {"found": bool, "source": {...} | null}
+    GET  /sources?title=&category=&priority=&document=&q=&limit=
+                                  matching sources (filters combine; q is a
+                                  substring of the title)
+    GET  /documents?name=N        sources and references cited by a document
+    GET  /stats                   catalog size, reload count and timings
+    POST /reload                  reload now
+
+Usage:
+    research-tools catalog serve                      # http://127.0.0.1:8766
+    research-tools catalog serve --socket /tmp/catalog.sock
+    research-tools catalog query --title "Game Programming Patterns"
+    research-tools catalog query --category networking --priority high
+    research-tools catalog benchmark                  # in-process vs. socket latency
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import defaultdict
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlencode, urlparse
+
+from .corpus_index import CorpusIndex
+from .discovery import SourceDiscovery
+
+DEFAULT_PORT = 8766
+DEFAULT_LIMIT = 100
+
+
+def normalize_title(title: str) -> str:
+    """Lookup key of a title: case-insensitive as in _add_discovered_source, whitespace collapsed"""
+    return " ".join(title.lower().split())
+
+
+class CatalogSnapshot:
+    """One discovery scan with secondary indexes; never modified after construction"""
+
+    def __init__(self, discovery: SourceDiscovery):
+        self.sources = discovery.discovered_sources
+        self.documents_scanned = discovery.documents_scanned
+        self.by_title = {}
+        self.by_category = defaultdict(list)
+        self.by_priority = defaultdict(list)
+        self.by_document = defaultdict(list)
+        for source in self.sources:
+            self.by_title.setdefault(normalize_title(source['title']), source)
+            self.by_category[source['category']].append(source)
+            self.by_priority[source['priority']].append(source)
+            for document in dict.fromkeys(source['references']):
+                self.by_document[document].append(source)
+
+        self.references_by_document = defaultdict(list)
+        for reference, entries in discovery.source_references.items():
+            for entry in entries:
+                self.references_by_document[entry['document']].append(
+                    {'reference': reference, 'pattern': entry['pattern']})
+
+    def lookup(self, title: str) -> Optional[Dict]:
+        """The source with this title, if discovered"""
+        return self.by_title.get(normalize_title(title))
+
+    def find(self, title: Optional[str] = None, category: Optional[str] = None,
+             priority: Optional[str] = None, document: Optional[str] = None,
+             query: Optional[str] = None, limit: Optional[int] = DEFAULT_LIMIT) -> List[Dict]:
+        """Sources matching every given filter, in discovery order"""
+        if title is not None:
+            source = self.lookup(title)
+            candidates = [source] if source else []
+        else:
+            # Start from the smallest index that applies, then filter the rest
+            lists = [index.get(value, []) for index, value in (
+                (self.by_category, category), (self.by_priority, priority),
+                (self.by_document, document)) if value is not None]
+            candidates = min(lists, key=len) if lists else self.sources
+
+        needle = normalize_title(query) if query else None
+        results = []
+        for source in candidates:
+            if category is not None and source['category'] != category:
+                continue
+            if priority is not None and source['priority'] != priority:
+                continue
+            if document is not None and document not in source['references']:
+                continue
+            if needle and needle not in normalize_title(source['title']):
+                continue
+            results.append(source)
+            if limit and len(results) >= limit:
+                break
+        return results
+
+    def document(self, name: str) -> Dict:
+        """Sources and references found in one document"""
+        return {
+            'document': name,
+            'sources': self.by_document.get(name, []),
+            'references': self.references_by_document.get(name, []),
+        }
+
+
+class CatalogService:
+    """Current snapshot plus the index and watcher that keep it fresh"""
+
+    def __init__(self, research_dir: str = "research/literature", root: Optional[str] = None,
+                 index_path: Optional[str] = None, poll: float = 1.0):
+        self.index = CorpusIndex(root, index_path).load()
+        directory = Path(research_dir)
+        self.research_dir = directory if directory.is_absolute() else self.index.root / directory
+        self.poll = poll
+        self.snapshot = None
+        self.stats = {'reloads': 0, 'last_reload_ms': 0.0, 'last_reload_parsed': 0,
+                      'last_reload_at': None, 'requests': 0}
+        self._fingerprint = None
+        self._reload_lock = threading.Lock()
+        # Guards the request counter, bumped by every handler thread
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _scan_fingerprint(self):
+        """(name, size, mtime) of every markdown file directly in the research directory"""
+        entries = []
+        with os.scandir(self.research_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".md") and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((entry.name, stat.st_size, stat.st_mtime_ns))
+        entries.sort()
+        return entries
+
+    def reload(self, force: bool = False) -> bool:
+        """Re-read changed documents and swap in a new snapshot; False if nothing changed"""
+        with self._reload_lock:
+            fingerprint = self._scan_fingerprint()
+            if not force and fingerprint == self._fingerprint and self.snapshot is not None:
+                return False
+            started = time.perf_counter()
+            prefix = self.index._relative(self.research_dir) + "/"
+            before = self.index.stats['parsed']
+            # Persisted on stop(): rewriting the whole index would dominate each reload
+            self.index.update(select=lambda path: path.startswith(prefix))
+
+            discovery = SourceDiscovery(str(self.research_dir), index=self.index)
+            # Quiet rather than redirecting stdout, which would swallow the
+            # output of every other thread while the scan runs
+            discovery.scan_research_documents(quiet=True)
+            self.snapshot = CatalogSnapshot(discovery)
+            self._fingerprint = fingerprint
+
+            self.stats['reloads'] += 1
+            self.stats['last_reload_ms'] = round((time.perf_counter() - started) * 1000, 1)
+            self.stats['last_reload_parsed'] = self.index.stats['parsed'] - before
+            self.stats['last_reload_at'] = time.strftime("%Y-%m-%dT%H:%M:%S")
+            return True
+
+    def watch(self):
+        """Start the polling thread that reloads on changes"""
+        def run():
+            while not self._stop.wait(self.poll):
+                try:
+                    if self.reload():
+                        print(f"Reloaded: {len(self.snapshot.sources)} sources "
+                              f"({self.stats['last_reload_parsed']} document(s) re-parsed, "
+                              f"{self.stats['last_reload_ms']} ms)")
+                except Exception as e:
+                    # Keep polling: the next change may well reload fine
+                    print(f"⚠ Reload failed: {type(e).__name__}: {e}")
+
+        thread = threading.Thread(target=run, name="catalog-watch", daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self):
+        """Stop watching and persist the refreshed index for other tools"""
+        self._stop.set()
+        with self._reload_lock:
+            self.index.save()
+
+    def count_request(self):
+        with self._stats_lock:
+            self.stats['requests'] += 1
+
+    def describe(self) -> Dict:
+        """Catalog size and reload statistics"""
+        snapshot = self.snapshot
+        with self._stats_lock:
+            stats = dict(self.stats)
+        return dict(stats, sources=len(snapshot.sources),
+                    documents_scanned=snapshot.documents_scanned,
+                    categories=sorted(snapshot.by_category), priorities=sorted(snapshot.by_priority))
+
+
+class CatalogHandler(BaseHTTPRequestHandler):
+    """JSON endpoints over the service's current snapshot"""
+
+    service = None
+    # Keep-alive, so a client pays for the connection once
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        snapshot = self.service.snapshot
+        self.service.count_request()
+
+        if parsed.path == "/lookup":
+            if "title" not in params:
+                self._send(400, {"message": "title is required"})
+                return
+            source = snapshot.lookup(params["title"])
+            self._send(200, {"found": source is not None, "source": source})
+        elif parsed.path == "/sources":
+            try:
+                limit = int(params.get("limit", DEFAULT_LIMIT))
+            except ValueError:
+                self._send(400, {"message": "limit must be an integer"})
+                return
+            results = snapshot.find(params.get("title"), params.get("category"), params.get("priority"),
+                                    params.get("document"), params.get("q"), limit)
+            self._send(200, {"count": len(results), "sources": results})
+        elif parsed.path == "/documents":
+            if "name" not in params:
+                self._send(400, {"message": "name is required"})
+                return
+            self._send(200, snapshot.document(params["name"]))
+        elif parsed.path == "/stats":
+            self._send(200, self.service.describe())
+        else:
+            self._send(404, {"message": "Not Found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if urlparse(self.path).path == "/reload":
+            changed = self.service.reload(force=True)
+            self._send(200, dict(self.service.describe(), reloaded=changed))
+        else:
+            self._send(404, {"message": "Not Found"})
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix domain socket"""
+
+    daemon_threads = True
+
+
+def make_server(service: CatalogService, host: str = "127.0.0.1", port: int = 0,
+                socket_path: Optional[str] = None):
+    """HTTP server over TCP (port=0 picks a free port) or a Unix socket"""
+    if socket_path:
+        handler = type("BoundCatalogHandler", (CatalogHandler,), {"service": service})
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        return ThreadingUnixHTTPServer(socket_path, handler)
+    # Headers and body go out in separate writes; without TCP_NODELAY the
+    # body waits for the client's delayed ACK (~40 ms per request)
+    handler = type("BoundCatalogHandler", (CatalogHandler,),
+                   {"service": service, "disable_nagle_algorithm": True})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """http.client connection over a Unix domain socket"""
+
+    def __init__(self, socket_path: str, timeout: float = 10):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class CatalogClient:
+    """Keep-alive JSON client for a running catalog server"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT,
+                 socket_path: Optional[str] = None, timeout: float = 10):
+        if socket_path:
+            self.connection = UnixHTTPConnection(socket_path, timeout)
+        else:
+            self.connection = HTTPConnection(host, port, timeout=timeout)
+
+    def request(self, method: str, path: str, params: Optional[Dict] = None) -> Dict:
+        query = urlencode({k: v for k, v in (params or {}).items() if v is not None})
+        self.connection.request(method, f"{path}?{query}" if query else path,
+                                body=b"" if method == "POST" else None)
+        response = self.connection.getresponse()
+        payload = json.loads(response.read())
+        if response.status >= 400:
+            raise ValueError(payload.get("message", f"HTTP {response.status}"))
+        return payload
+
+    def close(self):
+        self.connection.close()
+
+
+def _percentiles(samples: List[float]) -> Dict:
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))]
+    return {"p50_us": round(pick(0.50) * 1e6, 1), "p99_us": round(pick(0.99) * 1e6, 1)}
+
+
+def benchmark(service: CatalogService, requests: int) -> Dict:
+    """Lookup latency in-process, over TCP and over a Unix socket"""
+    import tempfile
+
+    snapshot = service.snapshot
+    titles = [source['title'] for source in snapshot.sources] or ["missing title"]
+    probes = [titles[i % len(titles)] if i % 2 else f"not discovered {i}" for i in range(requests)]
+
+    def timed(call):
+        samples = []
+        for title in probes:
+            started = time.perf_counter()
+            call(title)
+            samples.append(time.perf_counter() - started)
+        return _percentiles(samples)
+
+    results = {"sources": len(snapshot.sources), "requests": requests,
+               "in_process": timed(snapshot.lookup)}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, kwargs in (("tcp", {}), ("unix_socket", {"socket_path": os.path.join(tmp, "catalog.sock")})):
+            if name == "unix_socket" and not hasattr(socket, "AF_UNIX"):
+                continue
+            server = make_server(service, **kwargs)
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            if kwargs:
+                client = CatalogClient(socket_path=kwargs["socket_path"])
+            else:
+                client = CatalogClient(*server.server_address[:2])
+            try:
+                results[name] = timed(lambda title: client.request("GET", "/lookup", {"title": title}))
+            finally:
+                client.close()
+                server.shutdown()
+                server.server_close()
+    return results
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Local query server for the discovered-source catalog")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_endpoint(command):
+        command.add_argument("--host", default="127.0.0.1")
+        command.add_argument("--port", type=int, default=DEFAULT_PORT)
+        command.add_argument("--socket", metavar="PATH", help="Unix socket instead of TCP")
+
+    serve = commands.add_parser("serve", help="Run the server")
+    add_endpoint(serve)
+    serve.add_argument("--research-dir", default="research/literature")
+    serve.add_argument("--poll", type=float, default=1.0,
+                       help="Seconds between checks for changed documents (default: 1)")
+
+    query = commands.add_parser("query", help="Query a running server")
+    add_endpoint(query)
+    query.add_argument("--title", help="Exact title (case-insensitive)")
+    query.add_argument("--category")
+    query.add_argument("--priority")
+    query.add_argument("--document", help="Referencing document file name")
+    query.add_argument("-q", "--contains", help="Substring of the title")
+    query.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    query.add_argument("--stats", action="store_true", help="Show server statistics instead")
+    query.add_argument("--reload", action="store_true", help="Ask the server to reload now")
+
+    bench = commands.add_parser("benchmark", help="Measure lookup latency in-process and over sockets")
+    bench.add_argument("--research-dir", default="research/literature")
+    bench.add_argument("--requests", type=int, default=2000)
+
+    args = parser.parse_args()
+
+    if args.command == "query":
+        client = CatalogClient(args.host, args.port, args.socket)
+        try:
+            if args.reload:
+                payload = client.request("POST", "/reload")
+            elif args.stats:
+                payload = client.request("GET", "/stats")
+            elif args.document and not (args.title or args.category or args.priority or args.contains):
+                payload = client.request("GET", "/documents", {"name": args.document})
+            else:
+                payload = client.request("GET", "/sources", {
+                    "title": args.title, "category": args.category, "priority": args.priority,
+                    "document": args.document, "q": args.contains, "limit": args.limit})
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            return 1
+        finally:
+            client.close()
+        print(json.dumps(payload, indent=2, ensure_ascii=False))
+        return 0
+
+    service = CatalogService(args.research_dir)
+    service.reload(force=True)
+    print(f"Catalog loaded: {len(service.snapshot.sources)} sources from "
+          f"{service.snapshot.documents_scanned} documents in {service.stats['last_reload_ms']} ms")
+
+    if args.command == "benchmark":
+        results = benchmark(service, max(1, args.requests))
+        print(f"{results['requests']} lookups (half hits, half misses):")
+        for name in ("in_process", "tcp", "unix_socket"):
+            if name in results:
+                print(f"  {name:<12} p50 {results[name]['p50_us']:>8.1f} µs   "
+                      f"p99 {results[name]['p99_us']:>8.1f} µs")
+        return 0
+
+    server = make_server(service, args.host, args.port, args.socket)
+    service.watch()
+
+    import signal
+
+    def terminate(signum, frame):
+        # Shut down as on Ctrl+C (socket removed, index saved) when a supervisor stops us
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, terminate)
+    if args.socket:
+        print(f"Catalog server listening on unix:{args.socket}")
+    else:
+        host, port = server.server_address[:2]
+        print(f"Catalog server listening on http://{host}:{port}")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.stop()
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.unlink(args.socket)
+        print(f"\nRequests served: {service.stats['requests']}, reloads: {service.stats['reloads']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""
+research-tools Command Line
+===========================
+
+One entry point for all research tooling:
+
+    research-tools <command> [options]
+    research-tools <command> --help
+
+Only the module of the chosen command is imported, and top-level `--help`
+imports nothing beyond this file, so startup stays in the tens of
+milliseconds. Each command module exposes `main()` that parses sys.argv.
+"""
+
+import sys
+
+# command -> (module, summary); modules are imported only when run
+COMMANDS = {
+    "discover": ("research_tools.discovery", "Discover sources referenced by research documents"),
+    "generate-issues": ("research_tools.issues", "Generate research assignment issue files"),
+    "schedule": ("research_tools.scheduler", "Pack discovered sources into effort-balanced groups"),
+    "publish-issues": ("research_tools.publish", "Create/update generated issues via the GitHub API"),
+    "github-stub": ("research_tools.github_stub", "Run a local rate-limited GitHub Issues API stub"),
+    "check-urls": ("research_tools.link_check", "Find dead and redirected citation links"),
+    "url-stub": ("research_tools.url_stub", "Run a local stub server for link checking"),
+    "wiki-sources": ("research_tools.wiki_sources", "Create BibTeX entries for Wikipedia sources"),
+    "wiki-load": ("research_tools.wiki_load", "Load-test the wiki fetch path against a faulty stub"),
+    "wiki-stub": ("research_tools.wiki_stub", "Run a fault-injecting local Wikipedia stub"),
+    "catalog": ("research_tools.catalog_server", "Serve or query the discovered-source catalog"),
+    "catalog-io": ("research_tools.catalog_io", "Read catalog files or benchmark output formats"),
+    "search": ("research_tools.search", "Full-text search over research/"),
+    "index": ("research_tools.corpus_index", "Build or update the shared corpus index"),
+    "sections": ("research_tools.markdown_sections", "Print a document's section tree"),
+    "frontmatter": ("research_tools.frontmatter", "Parse document frontmatter"),
+    "duplicates": ("research_tools.near_duplicates", "Find near-duplicate documents"),
+    "quality": ("research_tools.doc_quality", "Run documentation quality checks"),
+    "validate-phase": ("research_tools.phase_validation", "Validate research phase completion"),
+    "startup-benchmark": ("research_tools.startup_benchmark", "Measure CLI startup and import cost"),
+}
+
+PROG = "research-tools"
+
+
+def print_help(stream=sys.stdout):
+    """Top-level usage with the command list"""
+    width = max(len(name) for name in COMMANDS)
+    lines = [
+        f"usage: {PROG} <command> [options]",
+        "",
+        "BlueMarble research tooling.",
+        "",
+        "commands:",
+    ]
+    lines.extend(f"  {name:<{width}}  {summary}" for name, (_, summary) in COMMANDS.items())
+    lines.extend(["", f"Run '{PROG} <command> --help' for the options of a command."])
+    stream.write("\n".join(lines) + "\n")
+
+
+def main(argv=None) -> int:
+    """Dispatch to a command's main() without importing the others"""
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print_help()
+        return 0
+    if argv[0] == "--version":
+        from research_tools import __version__
+        print(f"{PROG} {__version__}")
+        return 0
+
+    command = argv[0]
+    if command not in COMMANDS:
+        sys.stderr.write(f"{PROG}: unknown command '{command}'\n\n")
+        print_help(sys.stderr)
+        return 2
+
+    from importlib import import_module
+
+    module = import_module(COMMANDS[command][0])
+    # Command parsers read sys.argv; make their usage read "research-tools <command>"
+    sys.argv = [f"{PROG} {command}", *argv[1:]]
+    result = module.main()
+    return result if isinstance(result, int) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,546 @@
+"""
+Shared Corpus Index for BlueMarble Research Tooling
+====================================================
+
+Builds, once, a per-document record for every markdown file in the repository
+and persists it on disk so that autosources-discovery.py,
+generate-research-issues.py and check-documentation-quality.sh can query the
+same parsed data instead of each re-reading and re-parsing the corpus.
+
+Each record holds:
+    path            Repository-relative path (forward slashes)
+    size, mtime_ns  Stat fingerprint used to skip unchanged files
+    sha256          Content hash (also used for duplicate detection)
+    frontmatter     Parsed YAML frontmatter (None if absent or unparseable)
+    frontmatter_error  Why the frontmatter could not be parsed, else None
+    headings        Heading tree: [{"level", "text", "line", "children"}]
+    links           Markdown link targets
+    citations       Citation/reference matches: [{"text", "pattern"}]
+    discovered      "Discovered Sources" entries: [{"title", "description"}]
+    content_lines   Non-empty, non-heading line count
+    quarantine      Only on records from the degraded extractor: why the
+                    document broke its extraction budget, with timings
+
+Updates are incremental: files whose size and mtime are unchanged are not
+opened, and files whose content hash is unchanged are not re-parsed. A CI job
+running all tools therefore reads each file at most once.
+
+With an extraction budget (see budget.py), documents are parsed in worker
+processes that are killed once a document exceeds its time limit, and
+documents over the size limit are not handed to the full parser at all.
+Both are re-extracted by a degraded, strictly line-based extractor over at
+most the size limit (no YAML, no link regex, long lines cut) and marked
+with a `quarantine` entry, so one bad document costs at most its budget.
+
+Reading and extraction are pipelined (see prefetch.py): reader threads
+fetch the next documents into a bounded window while the current one is
+parsed, and the stats report read time, time spent waiting on reads and
+compute time.
+
+Usage:
+    research-tools index            # build or update the index
+    research-tools index --rebuild  # discard and rebuild
+    research-tools index --doc-timeout 5 --max-doc-kb 1024
+    research-tools index --readers 4 --queue-depth 16   # read-ahead pipeline
+    research-tools index --show research/literature/example-topic.md
+
+Output:
+    .cache/corpus-index.json (override with --index or $CORPUS_INDEX_PATH)
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .budget import ExtractionBudget
+from .frontmatter import parse_frontmatter
+from .lazy import LazyRegex
+from .markdown_sections import discovered_source_entries, parse_sections
+from .prefetch import DEFAULT_DEPTH, DEFAULT_READERS, Prefetcher
+
+
+
+def find_repo_root() -> Path:
+    """The checkout containing this package, else the nearest parent of cwd with research/"""
+    checkout = Path(__file__).resolve().parents[2]
+    if (checkout / "research").is_dir():
+        return checkout
+    cwd = Path.cwd().resolve()
+    for candidate in (cwd, *cwd.parents):
+        if (candidate / "research").is_dir():
+            return candidate
+    return cwd
+
+
+REPO_ROOT = find_repo_root()
+
+# Bump when the record layout or extraction rules change
+INDEX_VERSION = 2
+
+# Below this many stale documents a worker pool costs more than it saves
+PARALLEL_MIN_DOCUMENTS = 32
+
+# Degraded extraction cuts lines to this many characters
+MAX_DEGRADED_LINE = 2000
+
+# Citation and cross-reference patterns harvested by source discovery
+CITATION_PATTERNS = [
+    # Citation patterns
+    r'\*\*(?:Title|Source):\*\*\s+(.+)',
+    r'\*\*Author:\*\*\s+(.+)',
+    r'\*\*Publisher:\*\*\s+(.+)',
+    r'ISBN:\s*(\d{3}-\d{10}|\d{13})',
+    r'URL:\s*(https?://[^\s\)]+)',
+
+    # Discovered from patterns
+    r'Discovered From:\s*(.+)',
+    r'Referenced in:\s*(.+)',
+
+    # Next steps / future research patterns
+    r'Future research:\s*(.+)',
+    r'Additional sources:\s*(.+)',
+    r'Recommended reading:\s*(.+)',
+    r'See also:\s*(.+)',
+]
+
+_citation_regexes = [LazyRegex(p, re.MULTILINE | re.IGNORECASE) for p in CITATION_PATTERNS]
+_link_regex = LazyRegex(r'\[.*?\]\(([^)]*)\)')
+
+
+def parse_headings(content: str) -> List[Dict]:
+    """Build the heading tree (see markdown_sections.parse_sections)"""
+    return [section.to_dict() for section in parse_sections(content)]
+
+
+def parse_citations(content: str) -> List[Dict]:
+    """Match every citation pattern against the document"""
+    citations = []
+    for pattern, regex in zip(CITATION_PATTERNS, _citation_regexes):
+        for match in regex.finditer(content):
+            citations.append({"text": match.group(1), "pattern": pattern})
+    return citations
+
+
+def build_record(path: str, raw: bytes, stat: os.stat_result) -> Dict:
+    """Parse one document into an index record"""
+    content = raw.decode("utf-8", errors="replace")
+    frontmatter, frontmatter_error = parse_frontmatter(content)
+    sections = parse_sections(content)
+    return {
+        "path": path,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(raw).hexdigest(),
+        "frontmatter": frontmatter,
+        "frontmatter_error": frontmatter_error,
+        "headings": [section.to_dict() for section in sections],
+        "links": [m.group(1) for m in _link_regex.finditer(content)],
+        "citations": parse_citations(content),
+        "discovered": discovered_source_entries(sections),
+        "content_lines": sum(
+            1 for line in content.splitlines()
+            if line.strip() and not line.strip().startswith("#")
+        ),
+    }
+
+
+def build_degraded_record(path: str, head: bytes, digest: str, stat: os.stat_result,
+                          quarantine: Dict) -> Dict:
+    """Record from the line-based fallback extractor for a quarantined document.
+
+    `head` is at most the budget's size limit. Frontmatter YAML and links
+    are skipped and every line is cut to MAX_DEGRADED_LINE characters, so
+    the work is linear in len(head) whatever the document contains.
+    """
+    content = head.decode("utf-8", errors="ignore")
+    lines = [line[:MAX_DEGRADED_LINE] for line in content.splitlines()]
+    content = "\n".join(lines)
+    sections = parse_sections(content)
+    return {
+        "path": path,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest,
+        "frontmatter": None,
+        "frontmatter_error": "not parsed: document quarantined",
+        "headings": [section.to_dict() for section in sections],
+        "links": [],
+        "citations": parse_citations(content),
+        "discovered": discovered_source_entries(sections),
+        "content_lines": sum(1 for line in lines if line.strip() and not line.strip().startswith("#")),
+        "quarantine": quarantine,
+    }
+
+
+def read_capped(path: Path, max_bytes: int) -> Tuple[bytes, str]:
+    """First max_bytes of a file and the SHA-256 of all of it"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        head = f.read(max_bytes)
+        digest.update(head)
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return head, digest.hexdigest()
+
+
+def read_document(root: str, rel_path: str, stat: os.stat_result,
+                  previous_sha: Optional[str], hook: Optional[Callable] = None,
+                  raw: Optional[bytes] = None) -> Tuple:
+    """Read one document and parse it unless its content hash is unchanged.
+
+    Returns (sha256, record or None, hook result, error). Runs in worker
+    processes, so it and any hook must be module-level functions; the hook
+    receives the raw bytes so callers can derive more data from the same read.
+    Pass `raw` when the bytes were already read (e.g. by a Prefetcher).
+    """
+    if raw is None:
+        try:
+            with open(os.path.join(root, rel_path), "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            return None, None, None, str(e)
+    digest = hashlib.sha256(raw).hexdigest()
+    record = None if digest == previous_sha else build_record(rel_path, raw, stat)
+    return digest, record, hook(raw) if hook else None, None
+
+
+def iter_headings(nodes: List[Dict]) -> Iterator[Dict]:
+    """Depth-first iteration over a heading tree"""
+    for node in nodes:
+        yield node
+        yield from iter_headings(node["children"])
+
+
+class CorpusIndex:
+    """Persisted, incrementally updated index of every markdown document"""
+
+    def __init__(self, root: Optional[str] = None, index_path: Optional[str] = None):
+        self.root = Path(root).resolve() if root else REPO_ROOT
+        self.index_path = Path(
+            index_path or os.environ.get("CORPUS_INDEX_PATH")
+            or (self.root / ".cache" / "corpus-index.json")
+        )
+        self.records: Dict[str, Dict] = {}
+        # Every file and directory seen by the last walk (repository-relative)
+        self.paths = set()
+        # Hook results for documents read by the last update
+        self.hook_results: Dict[str, object] = {}
+        self.stats = {"documents": 0, "read": 0, "parsed": 0, "removed": 0, "quarantined": 0}
+        # Documents given degraded records by the last update
+        self.quarantined: List[str] = []
+        # Read-ahead pipeline for in-process and budgeted extraction (see prefetch.py);
+        # read_latency adds seconds per read to emulate cold storage
+        self.readers = DEFAULT_READERS
+        self.queue_depth = DEFAULT_DEPTH
+        self.read_latency = 0.0
+        # Prefetcher stats plus compute_s/wall_s of the last pipelined update, else None
+        self.pipeline_stats: Optional[Dict] = None
+        self._dirty = False
+
+    def load(self) -> "CorpusIndex":
+        """Load the persisted index if it exists and matches INDEX_VERSION"""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if data.get("version") == INDEX_VERSION:
+            self.records = data.get("documents", {})
+        return self
+
+    def save(self):
+        """Write the index atomically if anything changed"""
+        if not self._dirty:
+            return
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            # dumps() uses the C encoder; dump() streams through the pure-Python one
+            f.write(json.dumps({"version": INDEX_VERSION, "documents": self.records}, separators=(",", ":")))
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def _walk(self) -> Iterator[str]:
+        """Yield repository-relative paths of markdown files, skipping dot-directories"""
+        self.paths = set()
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            rel_dir = os.path.relpath(dirpath, self.root)
+            prefix = "" if rel_dir == "." else rel_dir.replace(os.sep, "/") + "/"
+            self.paths.update(prefix + d for d in dirnames)
+            for name in sorted(filenames):
+                self.paths.add(prefix + name)
+                if name.endswith(".md"):
+                    yield prefix + name
+
+    def update(self, workers: Optional[int] = None, hook: Optional[Callable] = None,
+               select: Optional[Callable[[str], bool]] = None,
+               budget: Optional[ExtractionBudget] = None) -> Dict:
+        """Refresh records for new, changed and deleted documents.
+
+        Stale documents are read and parsed by a pool of `workers` processes
+        (default: one per CPU) when there are enough of them to pay off.
+        `hook(raw_bytes)` is called on every document read and its results
+        are kept in hook_results. With `select(rel_path)`, only selected
+        documents are refreshed; the others keep their (possibly stale)
+        records until a later full update. With a `budget`, extraction runs
+        in killable workers and offenders get a degraded, quarantined record
+        (listed in self.quarantined); their hook results are left out.
+        """
+        seen = set()
+        stale = []
+        for rel_path in self._walk():
+            seen.add(rel_path)
+            if select is not None and not select(rel_path):
+                continue
+            try:
+                stat = (self.root / rel_path).stat()
+            except OSError:
+                continue
+            record = self.records.get(rel_path)
+            previous_sha = record["sha256"] if record else None
+            if record and record["size"] == stat.st_size and record["mtime_ns"] == stat.st_mtime_ns:
+                quarantine = record.get("quarantine")
+                if not (quarantine and budget is not None and budget.retry(quarantine)):
+                    continue
+                # Raised limit: give the unchanged document a full extraction again
+                previous_sha = None
+            stale.append((rel_path, stat, previous_sha))
+
+        workers = workers or os.cpu_count() or 1
+        jobs = [(str(self.root), rel_path, stat, previous_sha, hook)
+                for rel_path, stat, previous_sha in stale]
+        self.hook_results = {}
+        self.quarantined = []
+        self.pipeline_stats = None
+        started = time.perf_counter()
+        if budget is not None:
+            results = self._extract_within_budget(jobs, workers, budget)
+        elif workers > 1 and len(jobs) >= PARALLEL_MIN_DOCUMENTS:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(workers) as pool:
+                results = list(pool.map(read_document, *zip(*jobs), chunksize=16))
+        else:
+            results = self._extract_pipelined(jobs)
+        if self.pipeline_stats is not None:
+            self.pipeline_stats["wall_s"] = time.perf_counter() - started
+
+        for (rel_path, stat, previous_sha), (digest, record, hook_result, error) in zip(stale, results):
+            if error is not None:
+                print(f"Error reading {rel_path}: {error}")
+                continue
+            self.stats["read"] += 1
+            if hook is not None and not (record and "quarantine" in record):
+                self.hook_results[rel_path] = hook_result
+            if record is None:
+                self.records[rel_path]["size"] = stat.st_size
+                self.records[rel_path]["mtime_ns"] = stat.st_mtime_ns
+            else:
+                self.records[rel_path] = record
+                self.stats["parsed"] += 1
+            self._dirty = True
+
+        for rel_path in list(self.records):
+            if rel_path not in seen:
+                del self.records[rel_path]
+                self.stats["removed"] += 1
+                self._dirty = True
+
+        self.stats["documents"] = len(self.records)
+        self.stats["quarantined"] = len(self.quarantined)
+        return self.stats
+
+    def _prefetcher(self, jobs: List[Tuple]) -> Prefetcher:
+        return Prefetcher([self.root / job[1] for job in jobs], self.readers,
+                          self.queue_depth, self.read_latency)
+
+    def _extract_pipelined(self, jobs: List[Tuple]) -> List[Tuple]:
+        """read_document() results in-process, with reads running ahead on threads"""
+        prefetcher = self._prefetcher(jobs)
+        results = []
+        compute = 0.0
+        for job, (_, raw, error) in zip(jobs, prefetcher):
+            if error is not None:
+                results.append((None, None, None, error))
+                continue
+            started = time.perf_counter()
+            results.append(read_document(*job, raw=raw))
+            compute += time.perf_counter() - started
+        self.pipeline_stats = {**prefetcher.stats, "compute_s": compute}
+        return results
+
+    def _extract_within_budget(self, jobs: List[Tuple], workers: int,
+                               budget: ExtractionBudget) -> List[Tuple]:
+        """read_document() results for jobs, falling back to degraded records for offenders"""
+        from .budget import run_isolated
+
+        isolated = [job for job in jobs if job[2].st_size <= budget.max_bytes]
+        pool_size = min(workers, len(isolated)) if len(isolated) >= PARALLEL_MIN_DOCUMENTS else 1
+        # The parent reads ahead and ships the bytes, so workers only compute;
+        # on a failed read the worker retries it and reports the error
+        prefetcher = self._prefetcher(isolated)
+        prefetched = ((*job, raw) for job, (_, raw, _) in zip(isolated, prefetcher))
+        outcomes = run_isolated(read_document, prefetched, pool_size, budget.seconds)
+        self.pipeline_stats = {**prefetcher.stats,
+                               "compute_s": sum(elapsed for _, _, elapsed in outcomes)}
+        outcomes = iter(outcomes)
+
+        results = []
+        for root, rel_path, stat, previous_sha, hook in jobs:
+            if stat.st_size > budget.max_bytes:
+                reason, detail, elapsed = "size", f"{stat.st_size} bytes > {budget.max_bytes}", 0.0
+            else:
+                status, value, elapsed = next(outcomes)
+                if status == "ok":
+                    results.append(value)
+                    continue
+                reason = status
+                detail = {"timeout": f"extraction exceeded {budget.seconds:g}s",
+                          "crashed": f"worker died (exit status {value})"}.get(status, value)
+            results.append(self._degraded(rel_path, stat, budget, reason, detail, elapsed))
+        return results
+
+    def _degraded(self, rel_path: str, stat: os.stat_result, budget: ExtractionBudget,
+                  reason: str, detail: str, elapsed: float) -> Tuple:
+        """read_document()-shaped result from the degraded extractor"""
+        started = time.perf_counter()
+        try:
+            head, digest = read_capped(self.root / rel_path, budget.max_bytes)
+        except OSError as e:
+            return None, None, None, str(e)
+        quarantine = {
+            "reason": reason,
+            "detail": detail,
+            "extract_ms": round(elapsed * 1000, 1),
+            "budget": budget.to_dict(),
+        }
+        record = build_degraded_record(rel_path, head, digest, stat, quarantine)
+        quarantine["degraded_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        print(f"⚠ Quarantined {rel_path}: {detail}; used line-based extraction")
+        self.quarantined.append(rel_path)
+        return digest, record, None, None
+
+    def _relative(self, path) -> str:
+        path = Path(path)
+        if path.is_absolute():
+            path = path.resolve().relative_to(self.root)
+        rel_path = path.as_posix().strip("/")
+        return "" if rel_path == "." else rel_path
+
+    def get(self, path) -> Optional[Dict]:
+        """Return the record for a document, or None"""
+        return self.records.get(self._relative(path))
+
+    def documents(self, directory=None, recursive: bool = True) -> List[Dict]:
+        """Return records under a directory (relative to root), sorted by path"""
+        prefix = self._relative(directory) if directory is not None else ""
+        prefix = f"{prefix}/" if prefix else ""
+        results = []
+        for rel_path in sorted(self.records):
+            if not rel_path.startswith(prefix):
+                continue
+            if not recursive and "/" in rel_path[len(prefix):]:
+                continue
+            results.append(self.records[rel_path])
+        return results
+
+
+_shared_indexes: Dict[str, CorpusIndex] = {}
+
+
+def open_index(root=None, index_path=None, budget: Optional[ExtractionBudget] = None) -> CorpusIndex:
+    """Load, update and save the index, reusing it within one process"""
+    key = f"{root}|{index_path}"
+    if key not in _shared_indexes:
+        index = CorpusIndex(root, index_path).load()
+        index.update(budget=budget)
+        index.save()
+        _shared_indexes[key] = index
+    return _shared_indexes[key]
+
+
+def add_budget_arguments(parser):
+    """--doc-timeout/--max-doc-kb options, shared with discovery"""
+    from .budget import DEFAULT_MAX_BYTES, DEFAULT_SECONDS
+
+    parser.add_argument("--doc-timeout", type=float, default=DEFAULT_SECONDS, metavar="SECONDS",
+                        help=f"Extraction time budget per document; 0 disables isolation "
+                             f"(default: {DEFAULT_SECONDS:g})")
+    parser.add_argument("--max-doc-kb", type=int, default=DEFAULT_MAX_BYTES // 1024, metavar="KB",
+                        help="Larger documents get degraded extraction only "
+                             f"(default: {DEFAULT_MAX_BYTES // 1024})")
+
+
+def budget_from_args(parser, args) -> Optional[ExtractionBudget]:
+    if not args.doc_timeout:
+        return None
+    try:
+        return ExtractionBudget(args.doc_timeout, args.max_doc_kb * 1024)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build or update the shared research corpus index")
+    parser.add_argument("--root", help="Repository root (default: parent of scripts/)")
+    parser.add_argument("--index", help="Index file (default: .cache/corpus-index.json)")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the existing index first")
+    parser.add_argument("--show", metavar="PATH", help="Print the record for one document")
+    parser.add_argument("--workers", type=int, help="Parser processes (default: one per CPU)")
+    parser.add_argument("--readers", type=int, default=DEFAULT_READERS,
+                        help=f"Read-ahead threads; 0 reads inline (default: {DEFAULT_READERS})")
+    parser.add_argument("--queue-depth", type=int, default=DEFAULT_DEPTH,
+                        help=f"Documents read ahead at most (default: {DEFAULT_DEPTH})")
+    parser.add_argument("--read-latency-ms", type=float, default=0.0,
+                        help="Add latency to every read to emulate cold storage (benchmarking)")
+    add_budget_arguments(parser)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = CorpusIndex(args.root, args.index)
+    index.readers = args.readers
+    index.queue_depth = args.queue_depth
+    index.read_latency = args.read_latency_ms / 1000
+    if not args.rebuild:
+        index.load()
+    stats = index.update(args.workers, budget=budget_from_args(parser, args))
+    index.save()
+    elapsed = time.perf_counter() - started
+
+    if args.show:
+        record = index.get(args.show)
+        print(json.dumps(record, indent=2) if record else f"Not indexed: {args.show}")
+        return
+
+    print(f"✓ Corpus index: {index.index_path}")
+    print(f"  Documents: {stats['documents']}, read: {stats['read']}, "
+          f"parsed: {stats['parsed']}, removed: {stats['removed']} ({elapsed:.2f}s)")
+    pipeline = index.pipeline_stats
+    if pipeline:
+        print(f"  Pipeline: {pipeline['readers']} reader(s), depth {pipeline['depth']}: "
+              f"reads {pipeline['read_s']:.2f}s, waited for reads {pipeline['read_wait_s']:.2f}s "
+              f"({pipeline['stalls']} stalls), compute {pipeline['compute_s']:.2f}s, "
+              f"wall {pipeline['wall_s']:.2f}s")
+
+    quarantined = [r for r in index.documents() if r.get("quarantine")]
+    if quarantined:
+        print(f"⚠ {len(quarantined)} document(s) quarantined (degraded extraction):")
+        for record in quarantined:
+            print(f"    {record['path']}: {record['quarantine']['detail']}")
+
+    errors = [(r["path"], r["frontmatter_error"]) for r in index.documents() if r["frontmatter_error"]]
+    if errors:
+        print(f"⚠ Frontmatter could not be parsed in {len(errors)} document(s):")
+        for path, error in errors:
+            print(f"    {path}: {error}")
+
+
+if __name__ == "__main__":
+    main()
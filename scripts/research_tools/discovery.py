@@ -0,0 +1,789 @@
+"""
+Automated Source Discovery Tool for BlueMarble Research
+========================================================
+
+This tool automatically discovers and catalogs research sources from:
+1. Existing research documents (citations and references)
+2. Related source recommendations
+3. Cross-references within completed research
+4. (Planned) Academic and industry databases (future enhancement; not yet implemented)
+
+Usage:
+    python autosources-discovery.py [options]
+
+Options:
+    --scan-all          Scan all existing research documents
+    --phase N           Focus on Phase N documents only
+    --priority LEVEL    Filter by priority (critical, high, medium, low)
+    --category CAT      Filter by category (gamedev-tech, gamedev-design, etc.)
+    --output FILE       Output file for discovered sources (default: auto-discovered-sources.md)
+    --format FORMAT     Output format: markdown, json, jsonl, yaml (default: markdown)
+    --compress ALGO     Compress json/jsonl/yaml output with gzip or xz
+    --shard I/N         Scan only shard I of N (1-based) and write a partial result
+    --partial FILE      Partial result file (default: discovery-shard-I-of-N.json)
+    --doc-timeout S     Extraction time budget per document (default: 5, 0 disables)
+    --max-doc-kb KB     Larger documents get degraded extraction only (default: 1024)
+    --snapshot FILE     Also write a sorted snapshot for comparing runs
+
+Comparing runs (see snapshot.py):
+    research-tools discover --snapshot new.jsonl
+    research-tools discover diff old.jsonl new.jsonl [--format json] [--output FILE]
+
+Documents that break the extraction budget are parsed by a line-based
+fallback instead of stalling the run, and listed with their timings in the
+report's "Quarantined Documents" section (`quarantined` in JSON and in the
+JSON Lines/YAML header).
+
+Sharded runs:
+    research-tools discover --shard 1/4        # on each of 4 machines, I = 1..4
+    research-tools discover merge discovery-shard-*.json [--format json]
+
+Documents are assigned to shards by a CRC-32 of their repository-relative
+path, so every machine agrees on the split without coordination. A partial
+records each source occurrence with its (document path, entry position);
+`merge` replays them in global document order, so the first occurrence keeps
+its description and priority and later ones append references exactly as in
+a single-machine run. Partials can themselves be merged into a partial
+(`merge --partial`), so reduction can be done in stages.
+
+Link checking (same as `research-tools check-urls`):
+    research-tools discover check-urls [--strict] [--json]
+"""
+
+import os
+import re
+import sys
+import json
+import zlib
+from pathlib import Path
+from datetime import datetime
+from typing import List, Dict, Set, Optional, Tuple
+from collections import defaultdict
+
+from .budget import ExtractionBudget
+from .corpus_index import CorpusIndex, add_budget_arguments, budget_from_args, open_index
+
+PARTIAL_FORMAT = "bluemarble-discovery-partial"
+PARTIAL_VERSION = 1
+
+
+class Shard:
+    """Shard I of N (1-based) of the documents, chosen by a stable path hash"""
+
+    def __init__(self, number: int, count: int):
+        if count < 1 or not 1 <= number <= count:
+            raise ValueError(f"invalid shard {number}/{count}: expected 1 <= I <= N")
+        self.number = number
+        self.count = count
+
+    @classmethod
+    def parse(cls, spec: str) -> "Shard":
+        """Parse "I/N" as given to --shard"""
+        try:
+            number, count = (int(part) for part in spec.split("/"))
+        except ValueError:
+            raise ValueError(f"invalid shard '{spec}': expected I/N, e.g. 1/4")
+        return cls(number, count)
+
+    def contains(self, rel_path: str) -> bool:
+        """True if the repository-relative path belongs to this shard"""
+        # crc32 rather than hash(): str hashes are salted per process
+        return zlib.crc32(rel_path.encode("utf-8")) % self.count == self.number - 1
+
+    def __str__(self):
+        return f"{self.number}/{self.count}"
+
+
+def quarantine_entry(record: Dict) -> Dict:
+    """Report entry for a document with a degraded (quarantined) index record"""
+    quarantine = record['quarantine']
+    return {
+        'document': record['path'],
+        'reason': quarantine['reason'],
+        'detail': quarantine['detail'],
+        'extract_ms': quarantine['extract_ms'],
+        'degraded_ms': quarantine['degraded_ms'],
+    }
+
+
+class SourceDiscovery:
+    """Automated source discovery engine"""
+    
+    def __init__(self, research_dir: str = "research/literature", index: Optional[CorpusIndex] = None,
+                 shard: Optional[Shard] = None, budget: Optional[ExtractionBudget] = None):
+        self.research_dir = Path(research_dir)
+        self.index = index
+        self.shard = shard
+        self.budget = budget
+        self.discovered_sources = []
+        self.source_references = defaultdict(list)
+        self.categories = set()
+        self.priorities = set()
+        self.documents_scanned = 0
+        # Scanned documents that only got degraded extraction, with timings
+        self.quarantined = []
+        # Lower-case title -> source, and (document path, entry number) of every
+        # occurrence, so partial results can be merged in global document order
+        self._sources_by_title = {}
+        self._source_positions = defaultdict(list)
+        self._reference_positions = defaultdict(list)
+        
+    def scan_research_documents(self, phase_filter: Optional[int] = None,
+                                quiet: bool = False) -> List[Dict]:
+        """Scan all research documents for source references; `quiet` skips progress output"""
+        if not quiet:
+            print(f"Scanning research documents in {self.research_dir}...")
+        
+        if self.index is None:
+            if self.shard is None:
+                self.index = open_index(budget=self.budget)
+            else:
+                # Only this shard's documents need to be read
+                self.index = CorpusIndex().load()
+                self.index.update(select=self.shard.contains, budget=self.budget)
+                self.index.save()
+        
+        for record in self.index.documents(self.research_dir.resolve(), recursive=False):
+            if self.shard is not None and not self.shard.contains(record['path']):
+                continue
+            doc_name = Path(record['path']).name
+            
+            # If phase_filter is set, check both filename and frontmatter for phase info
+            if phase_filter:
+                phase_in_name = f"phase-{phase_filter}" in doc_name
+                frontmatter = record['frontmatter']
+                if record['frontmatter_error'] and not quiet:
+                    print(f"⚠️  Frontmatter not parsed in {doc_name}: {record['frontmatter_error']}")
+                phase_in_frontmatter = False
+                # Accept both int and str for phase in frontmatter
+                if frontmatter and "phase" in frontmatter:
+                    phase_value = frontmatter["phase"]
+                    # Try to normalize to int for comparison
+                    try:
+                        phase_in_frontmatter = int(phase_value) == int(phase_filter)
+                    except (TypeError, ValueError):
+                        phase_in_frontmatter = str(phase_value) == str(phase_filter)
+                if not (phase_in_name or phase_in_frontmatter):
+                    continue
+                
+            self._scan_record(doc_name, record)
+        
+        return self.discovered_sources
+    
+    def _scan_record(self, doc_name: str, record: Dict):
+        """Collect source references and discovered sources from an index record"""
+        self.documents_scanned += 1
+        if record.get('quarantine'):
+            self.quarantined.append(quarantine_entry(record))
+        
+        for number, citation in enumerate(record['citations']):
+            self._add_source_reference(doc_name, citation['text'], citation['pattern'],
+                                       position=(record['path'], number))
+        
+        # Entries from "Discovered Sources" sections
+        for number, entry in enumerate(record['discovered']):
+            self._add_discovered_source(
+                title=entry['title'],
+                description=entry['description'],
+                source_document=doc_name,
+                priority=self._infer_priority(entry['description']),
+                category=self._infer_category(entry['description']),
+                position=(record['path'], number)
+            )
+    
+    def _add_source_reference(self, doc_name: str, reference: str, pattern_type: str,
+                              position: Optional[Tuple[str, int]] = None):
+        """Add a source reference to the tracking system"""
+        self.source_references[reference].append({
+            'document': doc_name,
+            'pattern': pattern_type
+        })
+        self._reference_positions[reference].append(position)
+    
+    def _add_discovered_source(self, title: str, description: str, source_document: str,
+                                priority: str = 'medium', category: str = 'general',
+                                position: Optional[Tuple[str, int]] = None):
+        """Add a discovered source to the collection"""
+        key = title.lower()
+        self._source_positions[key].append(position)
+        
+        # Check if source already exists
+        source = self._sources_by_title.get(key)
+        if source is not None:
+            source['references'].append(source_document)
+            return
+        
+        # Add new source
+        source = {
+            'title': title,
+            'description': description,
+            'priority': priority,
+            'category': category,
+            'references': [source_document],
+            'discovered_date': datetime.now().isoformat(),
+            'status': 'discovered',
+            'estimated_effort': self._estimate_effort(description)
+        }
+        self.discovered_sources.append(source)
+        self._sources_by_title[key] = source
+        
+        self.priorities.add(priority)
+        self.categories.add(category)
+    
+    def partial_result(self, phase: Optional[int] = None) -> Dict:
+        """Mergeable result of this scan: sources and references with positions, plus stats"""
+        shard = self.shard or Shard(1, 1)
+        sources = []
+        for source in self.discovered_sources:
+            positions = self._source_positions[source['title'].lower()]
+            sources.append({
+                'title': source['title'],
+                'description': source['description'],
+                'priority': source['priority'],
+                'category': source['category'],
+                'estimated_effort': source['estimated_effort'],
+                'occurrences': [[path, number, document] for (path, number), document
+                                in zip(positions, source['references'])],
+            })
+        references = {
+            reference: [[path, number, entry['document'], entry['pattern']]
+                        for (path, number), entry in zip(self._reference_positions[reference], entries)]
+            for reference, entries in self.source_references.items()
+        }
+        return {
+            'format': PARTIAL_FORMAT,
+            'version': PARTIAL_VERSION,
+            'research_dir': self.research_dir.as_posix(),
+            'phase': phase,
+            'shards': {'count': shard.count, 'covered': [shard.number]},
+            'stats': {'documents_scanned': self.documents_scanned},
+            'quarantined': self.quarantined,
+            'sources': sources,
+            'references': references,
+        }
+    
+    def write_partial(self, output_file: str, phase: Optional[int] = None) -> Path:
+        """Write partial_result() as JSON (path relative to the working directory)"""
+        output_path = Path(output_file)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(self.partial_result(phase), indent=1, ensure_ascii=False))
+        print(f"✅ Partial result written: {output_path}")
+        return output_path
+    
+    @classmethod
+    def merge_partials(cls, partials: List[Dict]) -> Tuple["SourceDiscovery", Dict]:
+        """Combine partial results into the state of a single scan over all their shards.
+        
+        Occurrences are replayed in (document path, entry number) order, which
+        is the order a single run visits them in, so the result does not depend
+        on the order or grouping of the partials. Returns the discovery and the
+        merged partial header (research_dir, phase, shards).
+        """
+        if not partials:
+            raise ValueError("no partial results to merge")
+        
+        header = None
+        covered = set()
+        for partial in partials:
+            if partial.get('format') != PARTIAL_FORMAT or partial.get('version') != PARTIAL_VERSION:
+                raise ValueError(f"not a version {PARTIAL_VERSION} discovery partial")
+            key = (partial['research_dir'], partial['phase'], partial['shards']['count'])
+            if header is None:
+                header = key
+            elif key != header:
+                raise ValueError(
+                    "partials come from different runs "
+                    f"(research dir, phase, shard count): {header} vs {key}")
+            overlap = covered.intersection(partial['shards']['covered'])
+            if overlap:
+                raise ValueError(f"shard(s) {sorted(overlap)} appear in more than one partial")
+            covered.update(partial['shards']['covered'])
+        
+        research_dir, phase, count = header
+        discovery = cls(research_dir)
+        
+        # Replay every occurrence in global order through the normal dedup path;
+        # the first occurrence of a title supplies its description and priority
+        occurrences = []
+        for partial in partials:
+            discovery.documents_scanned += partial['stats']['documents_scanned']
+            # Partials written before quarantine existed have no such key
+            discovery.quarantined.extend(partial.get('quarantined', []))
+            for source in partial['sources']:
+                occurrences.extend((path, number, document, source)
+                                   for path, number, document in source['occurrences'])
+        occurrences.sort(key=lambda item: (item[0], item[1]))
+        for path, number, document, source in occurrences:
+            discovery._add_discovered_source(
+                title=source['title'],
+                description=source['description'],
+                source_document=document,
+                priority=source['priority'],
+                category=source['category'],
+                position=(path, number)
+            )
+        
+        references = []
+        for partial in partials:
+            for reference, entries in partial['references'].items():
+                references.extend((path, number, reference, document, pattern)
+                                  for path, number, document, pattern in entries)
+        references.sort(key=lambda item: (item[0], item[1]))
+        for path, number, reference, document, pattern in references:
+            discovery._add_source_reference(document, reference, pattern, position=(path, number))
+        
+        discovery.quarantined.sort(key=lambda entry: entry['document'])
+        merged = {'research_dir': research_dir, 'phase': phase,
+                  'shards': {'count': count, 'covered': sorted(covered)}}
+        return discovery, merged
+    
+    def _infer_priority(self, text: str) -> str:
+        """Infer priority from description text"""
+        text_lower = text.lower()
+        
+        if any(word in text_lower for word in ['critical', 'essential', 'must-read', 'fundamental']):
+            return 'critical'
+        elif any(word in text_lower for word in ['important', 'high', 'recommended']):
+            return 'high'
+        elif any(word in text_lower for word in ['useful', 'helpful', 'medium']):
+            return 'medium'
+        else:
+            return 'low'
+    
+    def _infer_category(self, text: str) -> str:
+        """Infer category from description text"""
+        text_lower = text.lower()
+        
+        categories = {
+            'gamedev-tech': ['technical', 'architecture', 'engine', 'performance', 'optimization'],
+            'gamedev-design': ['design', 'mechanics', 'gameplay', 'balance', 'economy'],
+            'gamedev-art': ['art', 'graphics', 'rendering', 'visual', 'shader'],
+            'survival': ['survival', 'crafting', 'resource', 'gathering'],
+            'architecture': ['distributed', 'scalable', 'infrastructure', 'backend'],
+            'networking': ['network', 'multiplayer', 'synchronization', 'latency'],
+        }
+        
+        for category, keywords in categories.items():
+            if any(keyword in text_lower for keyword in keywords):
+                return category
+        
+        return 'general'
+    
+    def _estimate_effort(self, description: str) -> str:
+        """Estimate research effort based on description"""
+        text_lower = description.lower()
+        
+        # Check for explicit hour estimates
+        hour_match = re.search(r'(\d+)-?(\d+)?\s*hours?', text_lower)
+        if hour_match:
+            return hour_match.group(0)
+        
+        # Infer from content type
+        if any(word in text_lower for word in ['book', 'comprehensive', 'extensive']):
+            return '8-12 hours'
+        elif any(word in text_lower for word in ['talk', 'presentation', 'video']):
+            return '2-4 hours'
+        elif any(word in text_lower for word in ['article', 'blog', 'post']):
+            return '1-3 hours'
+        else:
+            return '4-6 hours'
+    
+    def generate_markdown_report(self, output_file: str = "auto-discovered-sources.md"):
+        """Generate a markdown report of discovered sources"""
+        output_path = self.research_dir / output_file
+        
+        # Group sources by priority
+        by_priority = defaultdict(list)
+        for source in self.discovered_sources:
+            by_priority[source['priority']].append(source)
+        
+        # Generate markdown content
+        content = [
+            "# Auto-Discovered Research Sources",
+            "",
+            "---",
+            f"title: Auto-Discovered Research Sources",
+            f"date: {datetime.now().strftime('%Y-%m-%d')}",
+            "tags: [research, auto-discovered, sources]",
+            "status: discovered",
+            "generated: automatic",
+            "---",
+            "",
+            "**Document Type:** Auto-Generated Source Discovery Report",
+            f"**Generation Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"**Total Sources Discovered:** {len(self.discovered_sources)}",
+            f"**Source Documents Scanned:** {self.documents_scanned}",
+            "",
+            "---",
+            "",
+            "## Executive Summary",
+            "",
+            f"This document contains {len(self.discovered_sources)} research sources automatically discovered from existing research documents. Sources were extracted from citations, references, 'future research' sections, and cross-references.",
+            "",
+            "**Discovery Breakdown:**",
+        ]
+        
+        # Add priority breakdown
+        for priority in ['critical', 'high', 'medium', 'low']:
+            if priority in by_priority:
+                content.append(f"- **{priority.capitalize()}:** {len(by_priority[priority])} sources")
+        
+        content.extend([
+            "",
+            "**Categories:**",
+        ])
+        
+        # Add category breakdown
+        by_category = defaultdict(list)
+        for source in self.discovered_sources:
+            by_category[source['category']].append(source)
+        
+        for category in sorted(by_category.keys()):
+            content.append(f"- **{category}:** {len(by_category[category])} sources")
+        
+        content.extend([
+            "",
+            "---",
+            "",
+        ])
+        
+        # Add sources by priority
+        for priority in ['critical', 'high', 'medium', 'low']:
+            if priority not in by_priority:
+                continue
+            
+            content.extend([
+                f"## {priority.capitalize()} Priority Sources ({len(by_priority[priority])} sources)",
+                "",
+            ])
+            
+            for idx, source in enumerate(sorted(by_priority[priority], 
+                                               key=lambda x: x['title']), 1):
+                content.extend([
+                    f"### {idx}. {source['title']}",
+                    "",
+                    f"**Priority:** {source['priority'].capitalize()}",
+                    f"**Category:** {source['category']}",
+                    f"**Estimated Effort:** {source['estimated_effort']}",
+                    "",
+                    f"**Description:**",
+                    source['description'],
+                    "",
+                    f"**Discovered From:**",
+                ])
+                
+                for ref in source['references']:
+                    content.append(f"- {ref}")
+                
+                content.extend([
+                    "",
+                    "---",
+                    "",
+                ])
+        
+        # Add processing queue section
+        content.extend([
+            "## Processing Queue",
+            "",
+            "Sources are organized by priority for systematic processing:",
+            "",
+            "### Critical Priority (Process First)",
+        ])
+        
+        if 'critical' in by_priority:
+            for source in by_priority['critical']:
+                content.append(f"- [ ] {source['title']} ({source['estimated_effort']})")
+        
+        content.append("")
+        content.append("### High Priority (Process Second)")
+        
+        if 'high' in by_priority:
+            for source in by_priority['high']:
+                content.append(f"- [ ] {source['title']} ({source['estimated_effort']})")
+        
+        content.extend([
+            "",
+            "### Medium Priority (Process Third)",
+        ])
+        
+        if 'medium' in by_priority:
+            for source in by_priority['medium']:
+                content.append(f"- [ ] {source['title']} ({source['estimated_effort']})")
+        
+        content.extend([
+            "",
+            "---",
+            "",
+            *self._quarantine_section(),
+            "## Statistics",
+            "",
+            f"**Total Sources:** {len(self.discovered_sources)}",
+            f"**Total Estimated Effort:** {self._calculate_total_effort()}",
+            f"**Unique Categories:** {len(self.categories)}",
+            f"**Unique Priorities:** {len(self.priorities)}",
+            "",
+            "---",
+            "",
+            "## Next Steps",
+            "",
+            "1. Review discovered sources for relevance",
+            "2. Validate source availability and accessibility",
+            "3. Assign sources to appropriate research phases",
+            "4. Create assignment groups for critical and high-priority sources",
+            "5. Begin systematic processing following batch workflow",
+            "",
+            "---",
+            "",
+            f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"**Tool:** autosources-discovery.py",
+            f"**Status:** Ready for Review",
+        ])
+        
+        # Write to file
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(content))
+        
+        print(f"✅ Markdown report generated: {output_path}")
+        return output_path
+    
+    def _quarantine_section(self) -> List[str]:
+        """Markdown lines listing quarantined documents (none if there are none)"""
+        if not self.quarantined:
+            return []
+        lines = [
+            f"## Quarantined Documents ({len(self.quarantined)})",
+            "",
+            "These documents broke the per-document extraction budget and were read by the "
+            "line-based fallback extractor, which skips frontmatter and links and cuts long lines. "
+            "Their sources may be incomplete.",
+            "",
+            "| Document | Reason | Full extraction | Fallback |",
+            "|----------|--------|-----------------|----------|",
+        ]
+        for entry in self.quarantined:
+            lines.append(f"| {entry['document']} | {entry['detail']} | "
+                         f"{entry['extract_ms']:.0f} ms | {entry['degraded_ms']:.0f} ms |")
+        lines.extend(["", "---", ""])
+        return lines
+    
+    def _calculate_total_effort(self) -> str:
+        """Calculate total estimated effort across all sources"""
+        total_min = 0
+        total_max = 0
+        
+        for source in self.discovered_sources:
+            effort = source['estimated_effort']
+            match = re.search(r'(\d+)-(\d+)', effort)
+            if match:
+                total_min += int(match.group(1))
+                total_max += int(match.group(2))
+        
+        return f"{total_min}-{total_max} hours"
+    
+    def generate_json_report(self, output_file: str = "auto-discovered-sources.json",
+                             compression: Optional[str] = None):
+        """Generate a JSON report of discovered sources"""
+        from .catalog_io import write_json
+        
+        output_path = self.research_dir / output_file
+        
+        report = {
+            'generated': datetime.now().isoformat(),
+            'total_sources': len(self.discovered_sources),
+            'sources': self.discovered_sources,
+            'categories': sorted(self.categories),
+            'priorities': sorted(self.priorities),
+            'quarantined': self.quarantined,
+        }
+        
+        write_json(output_path, report, compression)
+        
+        print(f"✅ JSON report generated: {output_path}")
+        return output_path
+    
+    def generate_stream_report(self, output_file: str, output_format: str = 'jsonl',
+                               compression: Optional[str] = None):
+        """Generate a JSON Lines or YAML report, writing one source at a time"""
+        from .catalog_io import catalog_header, write_jsonl, write_yaml
+        
+        output_path = self.research_dir / output_file
+        header = catalog_header(datetime.now().isoformat(), len(self.discovered_sources),
+                                self.categories, self.priorities, self.quarantined)
+        writer = write_jsonl if output_format == 'jsonl' else write_yaml
+        writer(output_path, header, self.discovered_sources, compression)
+        
+        print(f"✅ {'JSON Lines' if output_format == 'jsonl' else 'YAML'} report generated: {output_path}")
+        return output_path
+
+
+def write_report(discovery: SourceDiscovery, output: str, output_format: str,
+                 compression: Optional[str] = None):
+    """Write the report in the requested format and print the summary"""
+    if output_format == 'markdown':
+        discovery.generate_markdown_report(output)
+    else:
+        from .catalog_io import output_path
+        
+        path = output_path(output, output_format, compression)
+        if output_format == 'json':
+            discovery.generate_json_report(path, compression)
+        else:
+            discovery.generate_stream_report(path, output_format, compression)
+    
+    print("\n📊 Discovery Summary:")
+    print(f"   Total Sources: {len(discovery.discovered_sources)}")
+    print(f"   Categories: {', '.join(sorted(discovery.categories))}")
+    print(f"   Priorities: {', '.join(sorted(discovery.priorities))}")
+    if discovery.quarantined:
+        print(f"   ⚠ Quarantined documents: {len(discovery.quarantined)} (see report)")
+
+
+def merge_main(argv: List[str]) -> int:
+    """`merge` command: reduce partial results into one report (or partial)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} merge",
+        description='Merge partial results of sharded discovery runs'
+    )
+    parser.add_argument('partials', nargs='+', help='Partial result files (--shard output)')
+    parser.add_argument('--output', default='auto-discovered-sources.md',
+                       help='Output file for discovered sources')
+    parser.add_argument('--format', choices=['markdown', 'json', 'jsonl', 'yaml'],
+                       default='markdown',
+                       help='Output format')
+    parser.add_argument('--compress', choices=['gzip', 'xz'],
+                       help='Compress json/jsonl/yaml output (also implied by a .gz/.xz --output)')
+    parser.add_argument('--partial', metavar='FILE',
+                       help='Write a merged partial instead of a report (staged reduction)')
+    parser.add_argument('--snapshot', metavar='FILE',
+                       help='Also write a sorted snapshot for `diff` (.gz/.xz compresses)')
+    args = parser.parse_args(argv)
+    
+    partials = []
+    for path in args.partials:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                partials.append(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read partial {path}: {e}")
+            return 1
+    try:
+        discovery, merged = SourceDiscovery.merge_partials(partials)
+    except (KeyError, ValueError) as e:
+        print(f"❌ Cannot merge: {e}")
+        return 1
+    
+    count = merged['shards']['count']
+    missing = sorted(set(range(1, count + 1)) - set(merged['shards']['covered']))
+    print(f"🔗 Merged {len(partials)} partial(s): {discovery.documents_scanned} documents, "
+          f"{len(discovery.discovered_sources)} sources")
+    
+    if args.partial:
+        discovery.shard = Shard(1, 1)
+        result = discovery.partial_result(merged['phase'])
+        result['shards'] = merged['shards']
+        with open(args.partial, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(result, indent=1, ensure_ascii=False))
+        print(f"✅ Partial result written: {args.partial}")
+        return 0
+    
+    if missing:
+        print(f"❌ Missing shard(s) {', '.join(f'{n}/{count}' for n in missing)}; "
+              "the report would be incomplete")
+        return 1
+    
+    write_report(discovery, args.output, args.format, args.compress)
+    if args.snapshot:
+        from .snapshot import write_snapshot
+        
+        count = write_snapshot(args.snapshot, discovery.discovered_sources)
+        print(f"✅ Snapshot of {count} sources written: {args.snapshot}")
+    print(f"\n✅ Automated source discovery complete!")
+    return 0
+
+
+def main():
+    """Main execution function"""
+    import argparse
+    
+    if sys.argv[1:2] == ['merge']:
+        return merge_main(sys.argv[2:])
+    if sys.argv[1:2] == ['snapshot']:
+        from .snapshot import snapshot_main
+        return snapshot_main(sys.argv[2:])
+    if sys.argv[1:2] == ['diff']:
+        from .snapshot import diff_main
+        return diff_main(sys.argv[2:])
+    if sys.argv[1:2] == ['check-urls']:
+        from .link_check import main as check_urls_main
+        
+        sys.argv = [f"{sys.argv[0]} check-urls", *sys.argv[2:]]
+        return check_urls_main()
+    
+    parser = argparse.ArgumentParser(
+        description='Automated Source Discovery Tool for BlueMarble Research',
+        epilog="Run with 'merge --help' for combining sharded partial results, "
+               "'snapshot --help' / 'diff --help' for comparing runs and "
+               "'check-urls --help' for checking cited URLs."
+    )
+    parser.add_argument('--scan-all', action='store_true',
+                       help='Scan all existing research documents')
+    parser.add_argument('--phase', type=int,
+                       help='Focus on Phase N documents only')
+    parser.add_argument('--priority', choices=['critical', 'high', 'medium', 'low'],
+                       help='Filter by priority level')
+    parser.add_argument('--category',
+                       help='Filter by category')
+    parser.add_argument('--output', default='auto-discovered-sources.md',
+                       help='Output file for discovered sources')
+    parser.add_argument('--format', choices=['markdown', 'json', 'jsonl', 'yaml'],
+                       default='markdown',
+                       help='Output format')
+    parser.add_argument('--compress', choices=['gzip', 'xz'],
+                       help='Compress json/jsonl/yaml output (also implied by a .gz/.xz --output)')
+    parser.add_argument('--shard', metavar='I/N',
+                       help='Scan only shard I of N (1-based) and write a partial result')
+    parser.add_argument('--partial', metavar='FILE',
+                       help='Partial result file for --shard (default: discovery-shard-I-of-N.json)')
+    parser.add_argument('--snapshot', metavar='FILE',
+                       help='Also write a sorted snapshot for `diff` (.gz/.xz compresses)')
+    add_budget_arguments(parser)
+    
+    args = parser.parse_args()
+    
+    shard = None
+    if args.shard:
+        try:
+            shard = Shard.parse(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+    
+    # Initialize discovery engine
+    discovery = SourceDiscovery(shard=shard, budget=budget_from_args(parser, args))
+    
+    # Scan documents
+    print("🔍 Starting automated source discovery..." if shard is None
+          else f"🔍 Starting automated source discovery (shard {shard})...")
+    discovery.scan_research_documents(phase_filter=args.phase)
+    
+    print(f"✅ Discovered {len(discovery.discovered_sources)} sources")
+    
+    if shard is not None:
+        output = args.partial or f"discovery-shard-{shard.number}-of-{shard.count}.json"
+        discovery.write_partial(output, phase=args.phase)
+        return 0
+    
+    # Generate report
+    write_report(discovery, args.output, args.format, args.compress)
+    if args.snapshot:
+        from .snapshot import write_snapshot
+        
+        count = write_snapshot(args.snapshot, discovery.discovered_sources)
+        print(f"✅ Snapshot of {count} sources written: {args.snapshot}")
+    print(f"\n✅ Automated source discovery complete!")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+"""
+Documentation Quality Engine
+============================
+
+Runs the corpus-wide checks of check-documentation-quality.sh (duplicate
+content, broken internal links, small/stub files, file organization) in one
+process:
+
+- the repository is walked once (research_tools.corpus_index); the same walk
+  provides the in-memory path set used to resolve link targets
+- each changed markdown file is read once, by a pool of worker processes
+  that parse it and compute its near-duplicate signature from the same bytes
+- unchanged files are served from the persisted corpus index
+
+Incremental mode (--changed or --files) limits per-file findings to the
+given documents, which is what a pre-commit hook needs.
+
+Usage:
+    research-tools quality                 # full report
+    research-tools quality --changed       # files changed vs. HEAD
+    research-tools quality --files docs/a.md docs/b.md
+    research-tools quality --json --strict
+
+Exit codes:
+    0 - No findings, or findings without --strict
+    1 - Findings with --strict
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .corpus_index import REPO_ROOT, CorpusIndex, iter_headings
+from .near_duplicates import NearDuplicateFinder, signature_entry
+
+# Main documentation files checked for duplicate H2 headings
+MAIN_FILES = ['README.md', 'USAGE_EXAMPLES.md', 'CONTRIBUTING.md']
+# Estimated Jaccard similarity above which two documents count as near-copies
+NEAR_DUPLICATE_THRESHOLD = 0.8
+# Define minimum file size threshold (500 bytes)
+MIN_FILE_SIZE = 500
+# Define minimum content lines (excluding headings and empty lines)
+MIN_CONTENT_LINES = 10
+
+EXPECTED_ROOT_FILES = [
+    'README.md',
+    'CONTRIBUTING.md',
+    'DOCUMENTATION_BEST_PRACTICES.md',
+    'USAGE_EXAMPLES.md',
+    'LICENSE.md'
+]
+EXPECTED_README_DIRS = [
+    'docs', 'docs/core', 'docs/gameplay', 'docs/systems', 'docs/world',
+    'docs/ui-ux', 'docs/audio', 'docs/research',
+    'templates', 'assets', 'design', 'research', 'roadmap', 'scripts'
+]
+
+
+class QualityEngine:
+    """Corpus-wide documentation checks over a single walk of the repository"""
+
+    def __init__(self, root: Optional[str] = None, workers: Optional[int] = None):
+        self.root = Path(root).resolve() if root else REPO_ROOT
+        self.workers = workers
+        self.index = CorpusIndex(str(self.root)).load()
+        self.finder = NearDuplicateFinder(str(self.root), index=self.index).load()
+        self.stats = {}
+
+    def run(self, only: Optional[List[str]] = None) -> Dict:
+        """Run all checks; `only` restricts per-document findings to those paths"""
+        started = time.perf_counter()
+        self.index.update(self.workers, hook=signature_entry)
+        self.index.save()
+        scope = None
+        if only is not None:
+            scope = {self.index._relative(self.root / path) for path in only}
+            scope = {path for path in scope if path in self.index.records}
+
+        report = {
+            "duplicates": self.check_duplicates(scope),
+            "links": self.check_links(scope),
+            "stubs": self.check_stubs(scope),
+            "organization": self.check_organization(),
+        }
+        self.finder.save()
+        self.stats = dict(self.index.stats)
+        self.stats["checked"] = len(self.index.records) if scope is None else len(scope)
+        self.stats["seconds"] = round(time.perf_counter() - started, 3)
+        return report
+
+    def _documents(self, scope):
+        if scope is None:
+            return self.index.documents()
+        return [self.index.records[path] for path in sorted(scope)]
+
+    def check_duplicates(self, scope) -> Dict:
+        """Duplicate H2 headings, identical files and near-duplicate documents.
+
+        Headings come from the fence-aware heading tree, so unlike the old
+        `^## ` regex check, `## ` lines inside code blocks are not counted.
+        """
+        headings = []
+        for file in MAIN_FILES:
+            record = self.index.get(file)
+            if record is None or (scope is not None and file not in scope):
+                continue
+            seen = set()
+            for node in iter_headings(record['headings']):
+                if node['level'] != 2:
+                    continue
+                if node['text'] in seen:
+                    headings.append({"file": file, "heading": node['text']})
+                seen.add(node['text'])
+
+        file_hashes = defaultdict(list)
+        for record in self.index.documents():
+            if record['size'] > 0:
+                file_hashes[record['sha256']].append(record['path'])
+        identical = [
+            files for files in file_hashes.values()
+            if len(files) > 1 and (scope is None or scope.intersection(files))
+        ]
+
+        near = [
+            pair for pair in self.finder.find(threshold=NEAR_DUPLICATE_THRESHOLD, involving=scope)
+            if not any(set(pair['documents']) <= set(files) for files in identical)
+        ]
+        return {"headings": headings, "identical": identical, "near": near}
+
+    def check_links(self, scope) -> List[Dict]:
+        """Internal .md links whose target is not in the walked path set"""
+        paths = self.index.paths
+        broken = []
+        for record in self._documents(scope):
+            md_file = record['path']
+            for link in record['links']:
+                # Only internal markdown links are checked
+                if not link.endswith('.md') or link.startswith('http'):
+                    continue
+                # Resolve relative path (same rules as the original shell check)
+                target = os.path.normpath(os.path.join(os.path.dirname(md_file), link.lstrip('./')))
+                if target.replace(os.sep, '/') not in paths:
+                    broken.append({"file": md_file, "link": link})
+        return broken
+
+    def check_stubs(self, scope) -> List[Dict]:
+        """Files under MIN_FILE_SIZE bytes with fewer than MIN_CONTENT_LINES content lines"""
+        return [
+            {"file": record['path'], "size": record['size'], "lines": record['content_lines']}
+            for record in self._documents(scope)
+            if record['size'] < MIN_FILE_SIZE and record['content_lines'] < MIN_CONTENT_LINES
+        ]
+
+    def check_organization(self) -> Dict:
+        """Design documents in the root and directories without README.md"""
+        paths = self.index.paths
+        misplaced = sorted(
+            path for path in paths
+            if '/' not in path and path.endswith('.md') and path not in EXPECTED_ROOT_FILES
+            and any(keyword in path.lower() for keyword in ['design', 'gdd', 'outline', 'spec', 'plan'])
+        )
+        missing_readmes = [
+            directory for directory in EXPECTED_README_DIRS
+            if directory in paths and f"{directory}/README.md" not in paths
+        ]
+        return {"misplaced": misplaced, "missing_readmes": missing_readmes}
+
+
+def count_findings(report: Dict) -> int:
+    """Total number of findings across all categories"""
+    duplicates = report["duplicates"]
+    organization = report["organization"]
+    return (len(duplicates["headings"]) + len(duplicates["identical"]) + len(duplicates["near"])
+            + len(report["links"]) + len(report["stubs"])
+            + len(organization["misplaced"]) + len(organization["missing_readmes"]))
+
+
+def print_report(report: Dict):
+    """Print findings in the format of check-documentation-quality.sh (checks 4-7)"""
+    duplicates = report["duplicates"]
+    print("4. Checking for duplicate content...")
+    for finding in duplicates["headings"]:
+        print(f"⚠ Duplicate heading in {finding['file']}: '{finding['heading']}'")
+    for files in duplicates["identical"]:
+        print("⚠ Duplicate file content detected:")
+        for f in files:
+            print(f"    {f}")
+    near = duplicates["near"]
+    if near:
+        print(f"⚠ Found {len(near)} near-duplicate document pair(s):")
+        for pair in near[:10]:
+            first, second = pair['documents']
+            print(f"    {pair['similarity']:.2f}  {first} <-> {second}")
+        if len(near) > 10:
+            print(f"    ... and {len(near) - 10} more")
+        print("  Run 'research-tools duplicates' for the full ranked list")
+    if not (duplicates["headings"] or duplicates["identical"] or near):
+        print("✓ No duplicate headings, file content or near-duplicate documents found")
+    print()
+
+    broken_links = report["links"]
+    print("5. Checking for broken internal links...")
+    if broken_links:
+        print(f"⚠ Found {len(broken_links)} broken link(s):")
+        for finding in broken_links[:5]:
+            print(f"  {finding['file']} -> {finding['link']}")
+        if len(broken_links) > 5:
+            print(f"  ... and {len(broken_links) - 5} more")
+    else:
+        print("✓ No broken internal links found")
+    print()
+
+    small_files = report["stubs"]
+    print("6. Checking for small or stub files...")
+    if small_files:
+        print(f"⚠ Found {len(small_files)} small or stub file(s) that may need content:")
+        for finding in sorted(small_files, key=lambda x: x['size'])[:10]:
+            print(f"    {finding['file']} ({finding['size']} bytes, {finding['lines']} content lines)")
+        if len(small_files) > 10:
+            print(f"    ... and {len(small_files) - 10} more")
+        print("  Consider adding more content or consolidating with related documents")
+    else:
+        print("✓ No small or stub files detected")
+    print()
+
+    organization = report["organization"]
+    print("7. Checking file organization...")
+    if organization["misplaced"]:
+        print(f"⚠ Found {len(organization['misplaced'])} design document(s) in root that should be organized:")
+        for f in organization["misplaced"]:
+            print(f"    {f} -> Consider moving to docs/, design/, or templates/")
+    if organization["missing_readmes"]:
+        print(f"⚠ Found {len(organization['missing_readmes'])} directories without README.md:")
+        for d in organization["missing_readmes"]:
+            print(f"    {d}/")
+    if not (organization["misplaced"] or organization["missing_readmes"]):
+        print("✓ File organization looks good")
+
+
+def changed_files(root: Path) -> List[str]:
+    """Markdown files added or modified relative to HEAD, including untracked ones"""
+    output = subprocess.run(
+        ["git", "status", "--porcelain", "--untracked-files=all"],
+        cwd=root, capture_output=True, text=True, check=True,
+    ).stdout
+    files = []
+    for line in output.splitlines():
+        path = line[3:].split(" -> ")[-1].strip('"')
+        if path.endswith(".md") and line[:2].strip() != "D":
+            files.append(path)
+    return files
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Single-pass documentation quality checks")
+    parser.add_argument("--root", help="Repository root (default: parent of scripts/)")
+    parser.add_argument("--files", nargs="+", metavar="PATH",
+                        help="Only report findings for these documents (incremental mode)")
+    parser.add_argument("--changed", action="store_true",
+                        help="Only report findings for markdown files changed vs. HEAD")
+    parser.add_argument("--workers", type=int, help="Parser processes (default: one per CPU)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--strict", action="store_true", help="Exit with 1 if anything is found")
+    args = parser.parse_args()
+
+    engine = QualityEngine(args.root, args.workers)
+    only = None
+    if args.changed:
+        try:
+            only = changed_files(engine.root)
+        except (OSError, subprocess.CalledProcessError) as e:
+            parser.error(f"could not list changed files: {e}")
+    elif args.files:
+        only = [os.path.relpath(os.path.abspath(path), engine.root) for path in args.files]
+
+    report = engine.run(only)
+    findings = count_findings(report)
+
+    if args.json:
+        print(json.dumps({"stats": engine.stats, "findings": findings, "report": report}, indent=2))
+    else:
+        print_report(report)
+        stats = engine.stats
+        print()
+        print(f"ℹ Checked {stats['checked']} of {stats['documents']} document(s); "
+              f"read {stats['read']}, parsed {stats['parsed']} in {stats['seconds']:.2f}s")
+
+    return 1 if args.strict and findings else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
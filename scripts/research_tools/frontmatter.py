@@ -0,0 +1,274 @@
+"""
+Fast YAML Frontmatter Parsing
+=============================
+
+Parses the leading `---` YAML block of research documents. Almost all of our
+frontmatter is flat `key: value` pairs plus inline `[a, b]` tag lists, so a
+hand-written parser handles that restricted schema directly. Anything outside
+it (nested mappings, block lists, quoted strings, booleans, floats, comments
+after values, ...) falls back to full YAML, using libyaml's CSafeLoader when
+PyYAML was built with it.
+
+Results are memoized per frontmatter content hash, and parse failures are
+returned as an error string instead of being swallowed.
+
+Usage:
+    from research_tools.frontmatter import parse_frontmatter
+
+    data, error = parse_frontmatter(content)
+    if error:
+        print(f"Frontmatter not parsed: {error}")
+
+Benchmark against plain yaml.safe_load over the corpus:
+    research-tools frontmatter --benchmark
+"""
+
+import hashlib
+import json
+import re
+from typing import Dict, List, Optional, Tuple
+
+from .lazy import LazyRegex
+
+FRONTMATTER_REGEX = LazyRegex(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Restricted schema handled without YAML
+_KEY_VALUE_REGEX = LazyRegex(r'([A-Za-z_][A-Za-z0-9_\-]*):(?:[ \t]+(.*?))?[ \t]*$')
+_INT_REGEX = LazyRegex(r'-?(?:0|[1-9][0-9]*)')
+_DATE_REGEX = LazyRegex(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+# Characters that start YAML syntax rather than a plain scalar
+_INDICATORS = tuple("-?:,[]{}#&*!|>'\"%@`")
+# Without PyYAML's resolver, plain scalars that could be anything but a string
+_SPECIAL_SCALAR_REGEX = LazyRegex(
+    r'(?:[0-9+.~]|(?:y|Y|yes|Yes|YES|n|N|no|No|NO|true|True|TRUE|false|False|FALSE'
+    r'|on|On|ON|off|Off|OFF|null|Null|NULL)$)'
+)
+
+_IMPLICIT = (True, False)
+_yaml_state = {}
+
+_cache: Dict[str, Tuple[Optional[Dict], Optional[str]]] = {}
+stats = {"fast": 0, "yaml": 0, "cached": 0, "errors": 0}
+
+
+def load_yaml():
+    """Import PyYAML on first use; returns (yaml, loader, resolve) or None without it"""
+    if "support" not in _yaml_state:
+        try:
+            import yaml
+        except ImportError:  # fast-path frontmatter still parses without PyYAML
+            _yaml_state["support"] = None
+        else:
+            _yaml_state["support"] = (
+                yaml,
+                getattr(yaml, "CSafeLoader", yaml.SafeLoader),
+                yaml.resolver.Resolver().resolve,
+            )
+    return _yaml_state["support"]
+
+
+def _scalar(text: str):
+    """Convert a scalar in the restricted schema, or raise ValueError"""
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        inner = text[1:-1]
+        if text[0] in inner or "\\" in inner:
+            raise ValueError(text)
+        return inner
+    if (not text or text.startswith(_INDICATORS) or ": " in text or " #" in text
+            or "\t" in text or text.endswith(":")):
+        raise ValueError(text)
+
+    support = load_yaml()
+    if support is None:
+        if _INT_REGEX.fullmatch(text):
+            return int(text)
+        if _DATE_REGEX.fullmatch(text):
+            return text
+        if _SPECIAL_SCALAR_REGEX.match(text):
+            raise ValueError(text)
+        return text
+
+    # Type the scalar exactly as YAML would
+    yaml, _, resolve = support
+    tag = resolve(yaml.ScalarNode, text, _IMPLICIT)
+    if tag == "tag:yaml.org,2002:str":
+        return text
+    if tag == "tag:yaml.org,2002:int" and _INT_REGEX.fullmatch(text):
+        return int(text)
+    if tag == "tag:yaml.org,2002:timestamp" and _DATE_REGEX.fullmatch(text):
+        # YAML yields a date, which the JSON round-trip turns back into this string
+        return text
+    raise ValueError(text)
+
+
+def _flow_list(text: str) -> List:
+    """Convert an inline `[a, b]` list of plain scalars, or raise ValueError"""
+    inner = text[1:-1].strip()
+    if not inner:
+        return []
+    if any(char in inner for char in "[]{}:\"'"):
+        raise ValueError(text)
+    return [_scalar(item.strip()) for item in inner.split(",")]
+
+
+def parse_flat(block: str) -> Optional[Dict]:
+    """Parse the restricted flat schema; None means 'use full YAML'"""
+    data = {}
+    for line in block.split("\n"):
+        if not line.strip() or line.lstrip().startswith("#"):
+            continue
+        match = _KEY_VALUE_REGEX.fullmatch(line.rstrip("\r"))
+        if not match or not match.group(2):
+            return None
+        key, value = match.groups()
+        try:
+            # Keys such as "on" or "no" are not strings in YAML 1.1
+            if _SPECIAL_SCALAR_REGEX.match(key):
+                return None
+            if value.startswith("[") and value.endswith("]"):
+                data[key] = _flow_list(value)
+            else:
+                data[key] = _scalar(value)
+        except ValueError:
+            return None
+    return data
+
+
+def parse_yaml(block: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Parse a frontmatter block with full YAML (C loader when available)"""
+    support = load_yaml()
+    if support is None:
+        return None, "PyYAML not installed"
+    yaml, loader, _ = support
+    try:
+        data = yaml.load(block, Loader=loader)
+    except yaml.MarkedYAMLError as e:
+        # Document line: marks are 0-based and the block starts after the opening ---
+        line = e.problem_mark.line + 2 if e.problem_mark else "?"
+        return None, f"{e.problem or e.context} (line {line})"
+    except yaml.YAMLError as e:
+        return None, str(e).splitlines()[0]
+    if not isinstance(data, dict):
+        return None, "frontmatter is not a mapping"
+    # Round-trip so dates etc. look the same fresh and loaded from disk
+    return json.loads(json.dumps(data, default=str)), None
+
+
+def parse_frontmatter(content: str) -> Tuple[Optional[Dict], Optional[str]]:
+    """Return (frontmatter, error) for a document's leading YAML block.
+
+    (None, None) means the document has no frontmatter. Results are cached
+    by the block's content hash; treat the returned mapping as read-only.
+    """
+    match = FRONTMATTER_REGEX.match(content)
+    if not match:
+        return None, None
+    block = match.group(1)
+
+    key = hashlib.sha256(block.encode("utf-8", errors="replace")).hexdigest()
+    cached = _cache.get(key)
+    if cached is not None:
+        stats["cached"] += 1
+        return cached
+
+    data = parse_flat(block)
+    if data is not None:
+        stats["fast"] += 1
+        result = (data, None)
+    else:
+        stats["yaml"] += 1
+        result = parse_yaml(block)
+        if result[1] is not None:
+            stats["errors"] += 1
+    _cache[key] = result
+    return result
+
+
+def benchmark(root: str):
+    """Compare yaml.safe_load on every document with this module"""
+    yaml, loader, _ = load_yaml()
+    import os
+    import time
+
+    blocks = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for name in filenames:
+            if name.endswith(".md"):
+                with open(os.path.join(dirpath, name), "r", encoding="utf-8", errors="replace") as f:
+                    content = f.read()
+                if FRONTMATTER_REGEX.match(content):
+                    blocks.append((os.path.join(dirpath, name), content))
+    print(f"Documents with frontmatter: {len(blocks)}")
+
+    mismatches = []
+    started = time.perf_counter()
+    for _, content in blocks:
+        try:
+            yaml.safe_load(FRONTMATTER_REGEX.match(content).group(1))
+        except yaml.YAMLError:
+            pass
+    pure = time.perf_counter() - started
+
+    _cache.clear()
+    started = time.perf_counter()
+    for _, content in blocks:
+        parse_frontmatter(content)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _, content in blocks:
+        parse_frontmatter(content)
+    warm = time.perf_counter() - started
+
+    for path, content in blocks:
+        block = FRONTMATTER_REGEX.match(content).group(1)
+        fast = parse_flat(block)
+        if fast is not None and (fast, None) != parse_yaml(block):
+            mismatches.append(path)
+
+    print(f"yaml.safe_load (pure Python loader): {pure * 1000:8.2f} ms")
+    print(f"parse_frontmatter, cold cache:       {cold * 1000:8.2f} ms")
+    print(f"parse_frontmatter, warm cache:       {warm * 1000:8.2f} ms")
+    print(f"Fast path: {stats['fast']}, full YAML: {stats['yaml']} "
+          f"({loader.__name__}), "
+          f"errors: {stats['errors']}")
+    print(f"Fast path results differing from full YAML: {len(mismatches)}")
+    for path in mismatches:
+        print(f"  {path}")
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Parse YAML frontmatter of markdown documents")
+    parser.add_argument("files", nargs="*", help="Documents to parse")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare with yaml.safe_load over the repository")
+    parser.add_argument("--root", default=".", help="Corpus for --benchmark")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        if load_yaml() is None:
+            parser.error("--benchmark needs PyYAML")
+        benchmark(args.root)
+        return
+
+    failed = False
+    for path in args.files:
+        with open(path, "r", encoding="utf-8") as f:
+            data, error = parse_frontmatter(f.read())
+        if error:
+            failed = True
+            print(f"{path}: ⚠ {error}")
+        elif data is None:
+            print(f"{path}: no frontmatter")
+        else:
+            print(f"{path}: {json.dumps(data, ensure_ascii=False)}")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
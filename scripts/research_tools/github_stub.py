@@ -0,0 +1,221 @@
+"""
+Local GitHub Issues API Stub with Rate Limiting
+================================================
+
+A small offline stand-in for the GitHub REST API used to exercise
+publish-research-issues.py without touching GitHub. It implements:
+
+- POST  /repos/{owner}/{repo}/issues
+- PATCH /repos/{owner}/{repo}/issues/{number}
+- GET   /repos/{owner}/{repo}/issues
+- GET   /search/issues?q=... ("in:title" search on quoted titles)
+
+and simulates both kinds of GitHub rate limit:
+
+- a primary limit of --limit requests per --window seconds, reported through
+  x-ratelimit-* headers and answered with 403 once exhausted
+- a secondary limit of --secondary-burst writes per --secondary-window
+  seconds, answered with 403 "secondary rate limit" and Retry-After
+  (omitted with --no-retry-after to exercise exponential backoff)
+
+Usage:
+    python3 scripts/github-api-stub.py --port 8765
+    python3 scripts/github-api-stub.py --port 8765 --limit 20 --window 10 --secondary-burst 3
+
+On exit (Ctrl+C) a summary of created issues and rejected requests is printed.
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from .lazy import LazyRegex
+
+
+class StubState:
+    """Issues and rate-limit counters shared by all handler threads"""
+
+    def __init__(self, limit, window, secondary_burst, secondary_window, retry_after, send_retry_after):
+        self.limit = limit
+        self.window = window
+        self.secondary_burst = secondary_burst
+        self.secondary_window = secondary_window
+        self.retry_after = retry_after
+        self.send_retry_after = send_retry_after
+        self.lock = threading.Lock()
+        self.issues = []
+        self.window_start = time.time()
+        self.used = 0
+        self.recent_writes = deque()
+        self.stats = {"requests": 0, "primary_limited": 0, "secondary_limited": 0}
+
+    def check_limits(self, is_write):
+        """Return (status, headers, message) for a rejected request, or headers on success"""
+        with self.lock:
+            now = time.time()
+            self.stats["requests"] += 1
+            if now - self.window_start >= self.window:
+                self.window_start = now
+                self.used = 0
+            reset = int(self.window_start + self.window) + 1
+
+            if self.used >= self.limit:
+                self.stats["primary_limited"] += 1
+                headers = self._rate_headers(0, reset)
+                return 403, headers, "API rate limit exceeded"
+
+            if is_write:
+                while self.recent_writes and now - self.recent_writes[0] >= self.secondary_window:
+                    self.recent_writes.popleft()
+                if len(self.recent_writes) >= self.secondary_burst:
+                    self.stats["secondary_limited"] += 1
+                    headers = {}
+                    if self.send_retry_after:
+                        headers["Retry-After"] = str(self.retry_after)
+                    return 403, headers, "You have exceeded a secondary rate limit"
+                self.recent_writes.append(now)
+
+            self.used += 1
+            return None, self._rate_headers(self.limit - self.used, reset), None
+
+    def _rate_headers(self, remaining, reset):
+        return {
+            "x-ratelimit-limit": str(self.limit),
+            "x-ratelimit-remaining": str(remaining),
+            "x-ratelimit-reset": str(reset),
+            "x-ratelimit-used": str(self.limit - remaining),
+        }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Request handler implementing the subset of the Issues API we use"""
+
+    state = None
+    issue_path = LazyRegex(r"^/repos/([^/]+/[^/]+)/issues(?:/(\d+))?$")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length", 0))
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _handle(self, method):
+        is_write = method in ("POST", "PATCH")
+        status, headers, message = self.state.check_limits(is_write)
+        if status is not None:
+            self._send(status, {"message": message}, headers)
+            return
+
+        parsed = urlparse(self.path)
+        match = self.issue_path.match(parsed.path)
+
+        if method == "GET" and parsed.path == "/search/issues":
+            query = parse_qs(parsed.query).get("q", [""])[0]
+            titles = re.findall(r'"([^"]+)"', query)
+            with self.state.lock:
+                items = [issue for issue in self.state.issues if issue["title"] in titles]
+            self._send(200, {"total_count": len(items), "items": items}, headers)
+        elif match and method == "GET" and match.group(2) is None:
+            with self.state.lock:
+                self._send(200, list(self.state.issues), headers)
+        elif match and method == "POST" and match.group(2) is None:
+            payload = self._read_json()
+            with self.state.lock:
+                number = len(self.state.issues) + 1
+                issue = {
+                    "number": number,
+                    "title": payload.get("title", ""),
+                    "body": payload.get("body", ""),
+                    "labels": [{"name": name} for name in payload.get("labels", [])],
+                    "html_url": f"https://github.com/{match.group(1)}/issues/{number}",
+                }
+                self.state.issues.append(issue)
+            self._send(201, issue, headers)
+        elif match and method == "PATCH" and match.group(2) is not None:
+            payload = self._read_json()
+            number = int(match.group(2))
+            with self.state.lock:
+                issue = next((i for i in self.state.issues if i["number"] == number), None)
+                if issue is not None:
+                    issue["body"] = payload.get("body", issue["body"])
+                    if "labels" in payload:
+                        issue["labels"] = [{"name": name} for name in payload["labels"]]
+            if issue is None:
+                self._send(404, {"message": "Not Found"}, headers)
+            else:
+                self._send(200, issue, headers)
+        else:
+            self._send(404, {"message": "Not Found"}, headers)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+
+def make_server(host="127.0.0.1", port=0, limit=5000, window=3600, secondary_burst=80,
+                secondary_window=60, retry_after=1, send_retry_after=True):
+    """Create a stub server; port=0 picks a free port (see server.server_address)"""
+    state = StubState(limit, window, secondary_burst, secondary_window, retry_after, send_retry_after)
+    handler = type("BoundStubHandler", (StubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.state = state
+    return server
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Local GitHub Issues API stub with rate limiting")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--limit", type=int, default=5000, help="Primary limit per window")
+    parser.add_argument("--window", type=float, default=3600, help="Primary window in seconds")
+    parser.add_argument("--secondary-burst", type=int, default=80,
+                        help="Writes allowed per secondary window")
+    parser.add_argument("--secondary-window", type=float, default=60,
+                        help="Secondary window in seconds")
+    parser.add_argument("--retry-after", type=int, default=1,
+                        help="Retry-After seconds sent with secondary limit responses")
+    parser.add_argument("--no-retry-after", action="store_true",
+                        help="Omit Retry-After so clients must back off on their own")
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, args.limit, args.window, args.secondary_burst,
+                         args.secondary_window, args.retry_after, not args.no_retry_after)
+    host, port = server.server_address
+    print(f"Stub GitHub API listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        state = server.state
+        print()
+        print(f"Issues created: {len(state.issues)}")
+        print(f"Requests: {state.stats['requests']}, primary limited: {state.stats['primary_limited']}, "
+              f"secondary limited: {state.stats['secondary_limited']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Deferred Regular Expressions
+============================
+
+Module-level patterns are wrapped in LazyRegex so that importing a module
+(e.g. for `--help`) does not pay for compiling patterns it may never use.
+"""
+
+from typing import Optional
+
+
+class LazyRegex:
+    """A regular expression compiled the first time one of its methods is used"""
+
+    __slots__ = ("pattern", "flags", "_compiled")
+
+    def __init__(self, pattern: str, flags: int = 0):
+        self.pattern = pattern
+        self.flags = flags
+        self._compiled: Optional[object] = None
+
+    def compiled(self):
+        """Return the compiled re.Pattern"""
+        if self._compiled is None:
+            import re
+            self._compiled = re.compile(self.pattern, self.flags)
+        return self._compiled
+
+    def __getattr__(self, name):
+        # Only reached for re.Pattern attributes (match, finditer, groups, ...)
+        return getattr(self.compiled(), name)
+
+    def __repr__(self) -> str:
+        return f"LazyRegex({self.pattern!r}, {self.flags!r})"
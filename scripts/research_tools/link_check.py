@@ -0,0 +1,578 @@
+"""
+Citation Link Checker
+=====================
+
+Finds dead and redirected links among the URLs cited by research documents.
+
+URLs are harvested from the `URL:` references that source discovery collects
+(each mapped to the documents citing it) and from the `url = {...}` fields of
+research/sources/sources.bib, then normalized and deduplicated, so a URL cited
+by ten documents is probed once:
+
+- scheme and host are lower-cased, default ports and #fragments dropped
+- trailing markdown/sentence punctuation (`.`, `,`, `` ` ``, `*`, ...) removed
+- an empty path becomes `/`
+
+Probing sends HEAD and falls back to GET when a server rejects or
+mishandles HEAD (any 4xx/5xx except 429). Redirects are followed by hand,
+up to --max-redirects, so the chain is recorded. Requests run on a thread
+pool (--workers) with at most --per-host requests in flight per host, over
+keep-alive connections pooled per host; a 429 is retried once after its
+Retry-After (capped at 10 s).
+
+Results are kept in .cache/link-check.json. Live URLs (ok or redirected)
+are not probed again for --ttl-days; failures are re-probed on every run
+unless --failure-ttl-hours is set, so a dead link is never reported from a
+stale cache entry longer than asked for.
+
+The report lists dead links (4xx/5xx, too many redirects), unreachable ones
+(DNS, connection, TLS, timeout) and permanent redirects (301/308), each
+with the documents citing it.
+
+Usage:
+    research-tools check-urls
+    research-tools check-urls --json > link-report.json
+    research-tools check-urls --workers 32 --per-host 4 --timeout 5
+    research-tools check-urls --no-harvest --urls-file urls.txt --no-cache
+    research-tools discover check-urls --strict    # exit 1 on dead links
+    research-tools check-urls --stub 200           # self-test against url_stub
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+from .corpus_index import REPO_ROOT
+from .lazy import LazyRegex
+
+DEFAULT_BIB = REPO_ROOT / "research" / "sources" / "sources.bib"
+DEFAULT_CACHE = REPO_ROOT / ".cache" / "link-check.json"
+CACHE_FORMAT = "bluemarble-link-check"
+
+USER_AGENT = "BlueMarble-research-tools link-check"
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+PERMANENT_REDIRECTS = (301, 308)
+LIVE_STATUSES = ("ok", "redirected")
+# Bytes of a GET body read before the connection is dropped instead of drained
+MAX_BODY = 64 * 1024
+MAX_RETRY_AFTER = 10
+
+URL_PATTERN = r'URL:\s*(https?://[^\s\)]+)'
+TRAILING_PUNCTUATION = ".,;:!?'\"`*>]}"
+
+BIB_ENTRY_REGEX = LazyRegex(r'^@\w+\s*\{\s*([^,\s]+)\s*,')
+BIB_URL_REGEX = LazyRegex(r'^\s*url\s*=\s*[{"]\s*([^}"\s]+)\s*[}"]', re.IGNORECASE)
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """Canonical form of a cited URL, or None if it isn't an http(s) URL"""
+    url = url.strip().rstrip(TRAILING_PUNCTUATION)
+    # "(see https://example.org/a)" style citations leave an unbalanced paren
+    if url.endswith(")") and url.count("(") < url.count(")"):
+        url = url[:-1].rstrip(TRAILING_PUNCTUATION)
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https") or not parts.hostname:
+        return None
+    host = parts.hostname.lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port and port != {"http": 80, "https": 443}[scheme]:
+        host = f"{host}:{port}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+def harvest_discovery(research_dir: str = "research/literature",
+                      discovery=None) -> Dict[str, List[str]]:
+    """Normalized URL -> citing documents, from source discovery's URL references"""
+    if discovery is None:
+        from contextlib import redirect_stdout
+
+        from .discovery import SourceDiscovery
+
+        discovery = SourceDiscovery(research_dir)
+        # Keep scan progress off stdout, which may carry --json output
+        with redirect_stdout(sys.stderr):
+            discovery.scan_research_documents()
+
+    urls = defaultdict(list)
+    for reference, entries in discovery.source_references.items():
+        if not any(entry['pattern'] == URL_PATTERN for entry in entries):
+            continue
+        url = normalize_url(reference)
+        if url is None:
+            continue
+        for entry in entries:
+            if entry['pattern'] == URL_PATTERN and entry['document'] not in urls[url]:
+                urls[url].append(entry['document'])
+    return urls
+
+
+def harvest_bibtex(path: Path = DEFAULT_BIB) -> Dict[str, List[str]]:
+    """Normalized URL -> ["sources.bib (key)", ...] from BibTeX url fields"""
+    urls = defaultdict(list)
+    key = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            entry = BIB_ENTRY_REGEX.match(line)
+            if entry:
+                key = entry.group(1)
+                continue
+            field = BIB_URL_REGEX.match(line)
+            if field:
+                url = normalize_url(field.group(1))
+                if url is not None:
+                    urls[url].append(f"{path.name} ({key})" if key else path.name)
+    return urls
+
+
+def read_url_file(path: str) -> Dict[str, List[str]]:
+    """Normalized URL -> [file name] for a file with one URL per line (# comments)"""
+    urls = defaultdict(list)
+    name = os.path.basename(path)
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            url = normalize_url(line)
+            if url is not None and name not in urls[url]:
+                urls[url].append(name)
+    return urls
+
+
+def merge_citations(*sources: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Union of several URL -> citing documents maps, keeping first-seen order"""
+    merged = {}
+    for source in sources:
+        for url, documents in source.items():
+            citing = merged.setdefault(url, [])
+            citing.extend(doc for doc in documents if doc not in citing)
+    return merged
+
+
+class LinkCache:
+    """Probe results on disk, with separate lifetimes for live and failed URLs"""
+
+    def __init__(self, path: Optional[Path] = DEFAULT_CACHE, ttl: float = 7 * 86400,
+                 failure_ttl: float = 0.0):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.failure_ttl = failure_ttl
+        self.entries = {}
+
+    def load(self) -> "LinkCache":
+        if self.path is None or not self.path.exists():
+            return self
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return self
+        if data.get("format") == CACHE_FORMAT:
+            self.entries = data.get("results", {})
+        return self
+
+    def fresh(self, url: str, now: Optional[float] = None) -> Optional[Dict]:
+        """Cached result if it is still within its lifetime"""
+        entry = self.entries.get(url)
+        if entry is None:
+            return None
+        lifetime = self.ttl if entry["status"] in LIVE_STATUSES else self.failure_ttl
+        age = (now if now is not None else time.time()) - entry["checked_at"]
+        return entry if 0 <= age < lifetime else None
+
+    def store(self, result: Dict):
+        # Rate-limited answers say nothing about the link; don't remember them
+        if result["status"] != "unknown":
+            self.entries[result["url"]] = result
+
+    def save(self):
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_suffix(".tmp")
+        results = {url: self.entries[url] for url in sorted(self.entries)}
+        temporary.write_text(json.dumps({"format": CACHE_FORMAT, "results": results}, indent=1),
+                             encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+class ConnectionPool:
+    """Keep-alive connections per (scheme, host), with a per-host in-flight limit"""
+
+    def __init__(self, per_host: int = 2, timeout: float = 10.0):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.idle = defaultdict(list)
+        self.slots = {}
+        self.opened = 0
+
+    def slot(self, key) -> threading.BoundedSemaphore:
+        with self.lock:
+            if key not in self.slots:
+                self.slots[key] = threading.BoundedSemaphore(self.per_host)
+            return self.slots[key]
+
+    def acquire(self, key) -> Tuple[object, bool]:
+        """An idle connection for key (reused=True) or a new one"""
+        with self.lock:
+            if self.idle[key]:
+                return self.idle[key].pop(), True
+            self.opened += 1
+        import http.client
+
+        scheme, netloc = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(netloc, timeout=self.timeout), False
+
+    def release(self, key, connection, reusable: bool):
+        if reusable:
+            with self.lock:
+                self.idle[key].append(connection)
+        else:
+            connection.close()
+
+    def close(self):
+        with self.lock:
+            connections = [c for idle in self.idle.values() for c in idle]
+            self.idle.clear()
+        for connection in connections:
+            connection.close()
+
+
+class LinkChecker:
+    """Probes URLs with HEAD/GET, following redirects by hand"""
+
+    def __init__(self, workers: int = 16, per_host: int = 2, timeout: float = 10.0,
+                 max_redirects: int = 5):
+        self.workers = workers
+        self.max_redirects = max_redirects
+        self.pool = ConnectionPool(per_host, timeout)
+        self.requests = 0
+        self._count_lock = threading.Lock()
+
+    def _request(self, url: str, method: str) -> Tuple[int, str, Optional[str], Dict]:
+        """One request on a pooled connection: (status, reason, location, headers)"""
+        import http.client
+
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        headers = {"User-Agent": USER_AGENT, "Accept": "*/*"}
+
+        with self.pool.slot(key):
+            for attempt in range(2):
+                connection, reused = self.pool.acquire(key)
+                with self._count_lock:
+                    self.requests += 1
+                try:
+                    connection.request(method, target, headers=headers)
+                    response = connection.getresponse()
+                    body = response.read(MAX_BODY) if method == "GET" else response.read()
+                except (OSError, http.client.HTTPException):
+                    connection.close()
+                    # A pooled connection may have been closed by the server
+                    # while idle; retry once on a fresh one
+                    if reused and attempt == 0:
+                        continue
+                    raise
+                drained = method == "HEAD" or len(body) < MAX_BODY or response.isclosed()
+                self.pool.release(key, connection, drained and not response.will_close)
+                return (response.status, response.reason, response.getheader("Location"),
+                        {"retry-after": response.getheader("Retry-After")})
+
+    def _exchange(self, url: str) -> Tuple[int, str, Optional[str], str, Dict]:
+        """HEAD, then GET if the server refuses HEAD: (status, reason, location, method, headers)"""
+        status, reason, location, headers = self._request(url, "HEAD")
+        if status >= 400 and status != 429:
+            status, reason, location, headers = self._request(url, "GET")
+            return status, reason, location, "GET", headers
+        return status, reason, location, "HEAD", headers
+
+    def probe(self, url: str) -> Dict:
+        """Classify one URL: ok, redirected, dead, unreachable or unknown (rate-limited)"""
+        import http.client
+
+        started = time.perf_counter()
+        result = {"url": url, "status": None, "code": None, "reason": None, "final_url": url,
+                  "redirects": [], "method": None, "error": None}
+        current = url
+        retried = False
+        try:
+            while True:
+                code, reason, location, method, headers = self._exchange(current)
+                result.update(code=code, reason=reason, method=method, final_url=current)
+                if code == 429 and not retried:
+                    retried = True
+                    time.sleep(_retry_after(headers.get("retry-after")))
+                    continue
+                if code in REDIRECT_CODES and location:
+                    if len(result["redirects"]) >= self.max_redirects:
+                        result.update(status="dead", error=f"more than {self.max_redirects} redirects")
+                        break
+                    result["redirects"].append([code, current])
+                    current = urljoin(current, location)
+                    continue
+                if code == 429:
+                    result["status"] = "unknown"
+                elif code >= 400:
+                    result["status"] = "dead"
+                elif any(hop[0] in PERMANENT_REDIRECTS for hop in result["redirects"]):
+                    result["status"] = "redirected"
+                else:
+                    result["status"] = "ok"
+                break
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            result.update(status="unreachable", error=f"{type(e).__name__}: {e}".rstrip(": "))
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        result["checked_at"] = time.time()
+        return result
+
+    def check(self, urls: Iterable[str], progress=None) -> List[Dict]:
+        """Probe URLs concurrently; results in input order"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        urls = list(urls)
+        if not urls:
+            return []
+        # Interleave hosts so one slow host doesn't occupy every worker
+        by_host = defaultdict(list)
+        for url in urls:
+            by_host[urlsplit(url).netloc].append(url)
+        queues = list(by_host.values())
+        order = [queue[i] for i in range(max(map(len, queues))) for queue in queues if i < len(queue)]
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, self.workers)) as executor:
+            for result in executor.map(self.probe, order):
+                results[result["url"]] = result
+                if progress:
+                    progress(result)
+        self.pool.close()
+        return [results[url] for url in urls]
+
+
+def _retry_after(value: Optional[str]) -> float:
+    """Seconds to wait for a Retry-After header (delta-seconds only), capped"""
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+def run(citations: Dict[str, List[str]], checker: LinkChecker, cache: LinkCache,
+        progress=None) -> Dict:
+    """Check every cited URL not fresh in the cache; returns the report"""
+    started = time.perf_counter()
+    now = time.time()
+    cached = {}
+    pending = []
+    for url in citations:
+        entry = cache.fresh(url, now)
+        if entry is not None:
+            cached[url] = entry
+        else:
+            pending.append(url)
+
+    probed = {result["url"]: result for result in checker.check(pending, progress)}
+    for result in probed.values():
+        cache.store(result)
+    cache.save()
+
+    results = []
+    for url, documents in citations.items():
+        result = dict(probed.get(url) or cached[url])
+        result["cached"] = url not in probed
+        result["documents"] = documents
+        results.append(result)
+
+    counts = defaultdict(int)
+    for result in results:
+        counts[result["status"]] += 1
+    return {
+        "urls": len(results),
+        "probed": len(probed),
+        "cached": len(cached),
+        "requests": checker.requests,
+        "connections": checker.pool.opened,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+        "counts": {status: counts[status] for status in
+                   ("ok", "redirected", "dead", "unreachable", "unknown")},
+        "results": results,
+    }
+
+
+def _describe(result: Dict) -> str:
+    if result["error"]:
+        return result["error"]
+    return f"{result['code']} {result['reason'] or ''}".strip()
+
+
+def _cited_in(documents: List[str], limit: int = 5) -> str:
+    shown = ", ".join(documents[:limit])
+    return shown + (f" (+{len(documents) - limit} more)" if len(documents) > limit else "")
+
+
+def format_report(report: Dict) -> str:
+    """Markdown report: dead, unreachable, redirected and rate-limited links"""
+    counts = report["counts"]
+    lines = [
+        "# Citation Link Check",
+        "",
+        f"**URLs:** {report['urls']} ({report['probed']} probed, {report['cached']} from cache)  ",
+        f"**Result:** {counts['ok']} ok, {counts['redirected']} redirected, {counts['dead']} dead, "
+        f"{counts['unreachable']} unreachable, {counts['unknown']} rate-limited  ",
+        f"**Requests:** {report['requests']} over {report['connections']} connection(s) "
+        f"in {report['elapsed_s']} s",
+    ]
+    sections = [
+        ("dead", "Dead Links"),
+        ("unreachable", "Unreachable Links"),
+        ("redirected", "Permanently Redirected Links"),
+        ("unknown", "Rate-Limited (not verified)"),
+    ]
+    for status, title in sections:
+        rows = [r for r in report["results"] if r["status"] == status]
+        if not rows:
+            continue
+        lines.extend(["", f"## {title}", ""])
+        for result in sorted(rows, key=lambda r: r["url"]):
+            if status == "redirected":
+                lines.append(f"- {result['url']} → {result['final_url']} "
+                             f"({result['redirects'][0][0]})")
+            else:
+                lines.append(f"- {result['url']} — {_describe(result)}")
+            lines.append(f"  - cited in: {_cited_in(result['documents'])}")
+    return "\n".join(lines) + "\n"
+
+
+def self_test(count: int, workers: int, per_host: int) -> int:
+    """Check `count` URLs against a local url_stub server and verify the classification"""
+    from .url_stub import make_server
+
+    server = make_server()
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # (path, expected status), cycled over two "hosts" served by the same stub
+    cases = [
+        ("ok", "ok"), ("ok", "ok"), ("ok", "ok"), ("ok", "ok"), ("ok", "ok"), ("ok", "ok"),
+        ("slow/300", "ok"),
+        ("status/404", "dead"),
+        ("redirect/301/ok", "redirected"),
+        ("redirect/302/ok", "ok"),
+        ("redirect/302/status/410", "dead"),
+        ("no-head", "ok"),
+        ("status/503", "dead"),
+        ("rate-limit", "ok"),
+        ("loop", "dead"),
+    ]
+    expected = {}
+    citations = {}
+    for n in range(count):
+        path, status = cases[n % len(cases)]
+        host = ("127.0.0.1", "localhost")[n % 2]
+        url = f"http://{host}:{port}/{path}/{n}"
+        expected[url] = status
+        citations[url] = [f"stub-doc-{n % 7}.md"]
+
+    try:
+        checker = LinkChecker(workers=workers, per_host=per_host, timeout=5.0)
+        report = run(citations, checker, LinkCache(None))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    wrong = [r for r in report["results"] if r["status"] != expected[r["url"]]]
+    stub = server.state.summary()
+    print(format_report(report), end="")
+    print()
+    print(f"Stub: {stub['requests']} request(s), {stub['connections']} connection(s), "
+          f"max in flight per host {stub['max_in_flight_per_host']}")
+    over = {host: n for host, n in stub["max_in_flight_per_host"].items() if n > per_host}
+    if over:
+        print(f"❌ Per-host limit of {per_host} exceeded: {over}")
+    if wrong:
+        for result in wrong:
+            print(f"❌ {result['url']}: {result['status']}, expected {expected[result['url']]}")
+    if over or wrong:
+        return 1
+    print(f"✅ {count} URL(s) classified as expected")
+    return 0
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Find dead and redirected citation links")
+    parser.add_argument("--research-dir", default="research/literature",
+                        help="Documents whose URL: references are checked (default: research/literature)")
+    parser.add_argument("--bib", default=str(DEFAULT_BIB),
+                        help="BibTeX file whose url fields are checked")
+    parser.add_argument("--urls-file", action="append", default=[],
+                        help="Extra file with one URL per line (repeatable)")
+    parser.add_argument("--no-harvest", action="store_true",
+                        help="Skip research documents and the BibTeX file")
+    parser.add_argument("--workers", type=int, default=16, help="Concurrent requests (default: 16)")
+    parser.add_argument("--per-host", type=int, default=2,
+                        help="Concurrent requests per host (default: 2)")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="Connect/read timeout in seconds (default: 10)")
+    parser.add_argument("--max-redirects", type=int, default=5)
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE), help="Result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write the cache")
+    parser.add_argument("--ttl-days", type=float, default=7.0,
+                        help="Days before a live URL is probed again (default: 7)")
+    parser.add_argument("--failure-ttl-hours", type=float, default=0.0,
+                        help="Hours before a failed URL is probed again (default: every run)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--strict", action="store_true", help="Exit 1 when a link is dead")
+    parser.add_argument("--stub", type=int, metavar="N",
+                        help="Self-test: check N URLs against a local stub server")
+    args = parser.parse_args()
+
+    if args.workers < 1 or args.per_host < 1:
+        parser.error("--workers and --per-host must be at least 1")
+    if args.stub:
+        return self_test(args.stub, args.workers, args.per_host)
+
+    try:
+        sources = [read_url_file(path) for path in args.urls_file]
+        if not args.no_harvest:
+            sources.insert(0, harvest_discovery(args.research_dir))
+            if Path(args.bib).exists():
+                sources.insert(1, harvest_bibtex(Path(args.bib)))
+            else:
+                print(f"⚠ {args.bib} not found; skipping BibTeX URLs", file=sys.stderr)
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    citations = merge_citations(*sources)
+
+    cache = LinkCache(None if args.no_cache else args.cache, ttl=args.ttl_days * 86400,
+                      failure_ttl=args.failure_ttl_hours * 3600).load()
+    checker = LinkChecker(args.workers, args.per_host, args.timeout, args.max_redirects)
+    print(f"🔗 Checking {len(citations)} URL(s)...", file=sys.stderr)
+    report = run(citations, checker, cache)
+
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print(format_report(report), end="")
+    return 1 if args.strict and report["counts"]["dead"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+Linear-Time Markdown Section Tokenizer
+======================================
+
+Single-pass, line-based tokenizer that turns a markdown document into a
+heading tree. Every section records its character span and the list items
+in its own body, so callers can pull "Discovered Sources" entries or numbered
+topic headings without running DOTALL/lookahead regexes over the whole
+document.
+
+A single forward pass visits each line once: a newline-anchored pattern picks
+out lines that can open a fence, heading or list item, which are then
+classified with prefix checks. No pattern ever scans across line
+boundaries, so tokenizing is strictly linear in the document size, including
+for unclosed or malformed sections.
+
+Usage:
+    from research_tools.markdown_sections import parse_sections, discovered_source_entries
+
+    sections = parse_sections(content)
+    for entry in discovered_source_entries(sections):
+        print(entry["title"], entry["description"])
+
+Benchmark against the previous regex extraction:
+    research-tools sections --benchmark
+    research-tools sections --benchmark --top 20 --scale 16
+"""
+
+import re
+from typing import Dict, Iterator, List, Optional
+
+from .lazy import LazyRegex
+
+# Heading titles whose sections list newly discovered sources
+DISCOVERED_SECTION_REGEX = LazyRegex(r'(?:Discovered|Next|Future|Additional)\s+Sources', re.IGNORECASE)
+# Source entry format: **Title**: Description
+TITLE_DESC_REGEX = LazyRegex(r'\*\*(.+?)\*\*\s*[:\-]?\s*(.*)')
+
+_BULLETS = ("- ", "* ", "+ ", "-\t", "*\t", "+\t")
+# Lines whose first non-blank character can start a fence, heading or list item.
+# Anchoring on a literal newline (instead of ^ with MULTILINE) lets the regex
+# engine skip prose with its fast prefix scan.
+_CANDIDATE_LINE_REGEX = LazyRegex(r'\n[ \t]*[`~#*+\-0-9]')
+_CANDIDATE_FIRST_LINE_REGEX = LazyRegex(r'[ \t]*[`~#*+\-0-9]')
+
+
+class ListItem:
+    """A list item line inside a section body"""
+
+    __slots__ = ("line", "indent", "marker", "text")
+
+    def __init__(self, line: int, indent: int, marker: str, text: str):
+        self.line = line
+        self.indent = indent
+        self.marker = marker
+        self.text = text
+
+    def to_dict(self) -> Dict:
+        return {"line": self.line, "indent": self.indent, "marker": self.marker, "text": self.text}
+
+
+class Section:
+    """A heading and the document span it governs.
+
+    start/end are character offsets: start is the heading line, body_end is
+    the next heading of any level, end is the next heading of the same or a
+    higher level (so [start, end) includes subsections).
+    """
+
+    __slots__ = ("level", "title", "line", "start", "body_start", "body_end", "end",
+                 "children", "items")
+
+    def __init__(self, level: int, title: str, line: int, start: int, body_start: int):
+        self.level = level
+        self.title = title
+        self.line = line
+        self.start = start
+        self.body_start = body_start
+        self.body_end = body_start
+        self.end = body_start
+        self.children: List["Section"] = []
+        self.items: List[ListItem] = []
+
+    def to_dict(self) -> Dict:
+        """Heading-tree node as stored in the corpus index"""
+        return {
+            "level": self.level,
+            "text": self.title,
+            "line": self.line,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+def _heading(line: str):
+    """Return (level, title) for an ATX heading line, else None"""
+    level = 0
+    length = len(line)
+    while level < length and line[level] == "#":
+        level += 1
+    if level == 0 or level > 6 or level == length or line[level] not in " \t":
+        return None
+    title = line[level:].strip()
+    # Optional closing sequence: "## Title ##"
+    stripped = title.rstrip("#")
+    if stripped != title and (not stripped or stripped[-1] in " \t"):
+        title = stripped.rstrip()
+    return (level, title) if title else None
+
+
+def _list_item(line: str, line_no: int) -> Optional[ListItem]:
+    """Return a ListItem for a bullet or ordered list line, else None"""
+    text = line.lstrip(" \t")
+    indent = len(line) - len(text)
+    if text.startswith(_BULLETS):
+        return ListItem(line_no, indent, text[0], text[2:].strip())
+    digits = 0
+    while digits < len(text) and digits < 9 and text[digits].isdigit():
+        digits += 1
+    if digits and text[digits:digits + 2] in (". ", ") "):
+        return ListItem(line_no, indent, text[:digits + 1], text[digits + 2:].strip())
+    return None
+
+
+def _candidate_line_starts(content: str) -> Iterator[int]:
+    """Offsets of lines that may be a fence, heading or list item"""
+    if _CANDIDATE_FIRST_LINE_REGEX.match(content):
+        yield 0
+    for match in _CANDIDATE_LINE_REGEX.finditer(content):
+        yield match.start() + 1
+
+
+def parse_sections(content: str) -> List[Section]:
+    """Tokenize a document into a heading tree in one pass over its lines.
+
+    Lines inside fenced code blocks are never treated as headings or list
+    items. List items before the first heading are ignored.
+    """
+    roots: List[Section] = []
+    stack: List[Section] = []
+    current: Optional[Section] = None
+    fence: Optional[str] = None
+    line_no = 1
+    counted_to = 0
+    length = len(content)
+
+    # Only lines that can open a fence, heading or list item are visited;
+    # prose lines are skipped by the C regex engine in a single forward pass.
+    for line_start in _candidate_line_starts(content):
+        line_end = content.find("\n", line_start)
+        line_end = length if line_end == -1 else line_end + 1
+        line_no += content.count("\n", counted_to, line_start)
+        counted_to = line_start
+
+        raw_line = content[line_start:line_end]
+        stripped = raw_line.lstrip(" \t")
+        first = stripped[:1]
+
+        if fence is not None:
+            if stripped.startswith(fence):
+                fence = None
+            continue
+        if first in "`~":
+            if stripped.startswith(("```", "~~~")) and len(raw_line) - len(stripped) < 4:
+                fence = stripped[:3]
+            continue
+
+        line = raw_line.rstrip("\r\n")
+        if first == "#":
+            heading = _heading(line) if line.startswith("#") else None
+            if heading is not None:
+                level, title = heading
+                if current is not None:
+                    current.body_end = line_start
+                while stack and stack[-1].level >= level:
+                    stack.pop().end = line_start
+                section = Section(level, title, line_no, line_start, line_end)
+                (stack[-1].children if stack else roots).append(section)
+                stack.append(section)
+                current = section
+            continue
+
+        if current is not None:
+            item = _list_item(line, line_no)
+            if item is not None:
+                current.items.append(item)
+
+    offset = length
+    if current is not None:
+        current.body_end = offset
+    for section in stack:
+        section.end = offset
+    return roots
+
+
+def iter_sections(sections: List[Section]) -> Iterator[Section]:
+    """Depth-first iteration over a section tree"""
+    for section in sections:
+        yield section
+        yield from iter_sections(section.children)
+
+
+def discovered_source_entries(sections: List[Section]) -> List[Dict]:
+    """'**Title**: Description' bullets from Discovered/Next/Future/Additional Sources sections"""
+    entries = []
+    for section in iter_sections(sections):
+        if section.level < 2 or not DISCOVERED_SECTION_REGEX.match(section.title):
+            continue
+        for item in section.items:
+            if item.marker not in ("-", "*"):
+                continue
+            match = TITLE_DESC_REGEX.match(item.text)
+            if match:
+                entries.append({
+                    "title": match.group(1).strip(),
+                    "description": match.group(2).strip(),
+                })
+    return entries
+
+
+def _legacy_discovered_entries(content: str) -> List[Dict]:
+    """The previous DOTALL/lookahead extraction, kept for the benchmark only"""
+    section_pattern = r'##\s+(?:Discovered|Next|Future|Additional)\s+Sources.*?\n(.*?)(?=\n##|\Z)'
+    entry_pattern = re.compile(r'^\s*[-\*]\s+(.*)', re.MULTILINE)
+    entries = []
+    for match in re.finditer(section_pattern, content, re.DOTALL | re.IGNORECASE):
+        for entry_match in entry_pattern.finditer(match.group(1)):
+            td_match = TITLE_DESC_REGEX.match(entry_match.group(1).strip())
+            if td_match:
+                entries.append({
+                    "title": td_match.group(1).strip(),
+                    "description": td_match.group(2).strip(),
+                })
+    return entries
+
+
+def benchmark(research_dir: str, top: int = 10, scale: int = 8, repeat: int = 5):
+    """Time legacy regex vs tokenizer on the largest documents and scaled copies"""
+    import os
+    import time
+
+    def best_of(func, content):
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(content)
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    def tokenize(content):
+        return discovered_source_entries(parse_sections(content))
+
+    files = []
+    for dirpath, _, filenames in os.walk(research_dir):
+        for name in filenames:
+            if name.endswith(".md"):
+                path = os.path.join(dirpath, name)
+                files.append((os.path.getsize(path), path))
+    files.sort(reverse=True)
+
+    print(f"Largest {top} documents in {research_dir} (best of {repeat}):")
+    print(f"{'size':>9}  {'regex ms':>9}  {'tokenizer ms':>12}  document")
+    for size, path in files[:top]:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            content = f.read()
+        legacy = best_of(_legacy_discovered_entries, content)
+        tokenized = best_of(tokenize, content)
+        print(f"{size:>9}  {legacy * 1000:>9.2f}  {tokenized * 1000:>12.2f}  {os.path.relpath(path)}")
+
+    if not files:
+        return
+    with open(files[0][1], "r", encoding="utf-8", errors="replace") as f:
+        base = f.read()
+
+    # An unclosed "Discovered Sources" section followed by a long body without
+    # any "##" is the worst case for the lazy DOTALL scan.
+    pathological = "## Discovered Sources\n" + "- plain entry without bold title\n" * 2000
+
+    print()
+    print(f"Scaling (largest document repeated 1..{scale}x, and unclosed sections):")
+    print(f"{'factor':>6}  {'chars':>9}  {'regex ms':>9}  {'tokenizer ms':>12}  {'unclosed regex':>14}  {'unclosed tok':>12}")
+    factor = 1
+    while factor <= scale:
+        content = base * factor
+        unclosed = pathological * factor
+        print(f"{factor:>6}  {len(content):>9}  "
+              f"{best_of(_legacy_discovered_entries, content) * 1000:>9.2f}  "
+              f"{best_of(tokenize, content) * 1000:>12.2f}  "
+              f"{best_of(_legacy_discovered_entries, unclosed) * 1000:>14.2f}  "
+              f"{best_of(tokenize, unclosed) * 1000:>12.2f}")
+        factor *= 2
+
+
+def main():
+    """Main execution function"""
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Markdown section tokenizer")
+    parser.add_argument("file", nargs="?", help="Print the section tree of a markdown file")
+    parser.add_argument("--benchmark", action="store_true",
+                        help="Compare against the legacy regex extraction")
+    parser.add_argument("--research-dir", default="research", help="Corpus for --benchmark")
+    parser.add_argument("--top", type=int, default=10, help="Largest documents to benchmark")
+    parser.add_argument("--scale", type=int, default=8, help="Largest repetition factor")
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.research_dir, args.top, args.scale)
+    elif args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            sections = parse_sections(f.read())
+        print(json.dumps([section.to_dict() for section in sections], indent=2))
+        for entry in discovered_source_entries(sections):
+            print(f"- {entry['title']}: {entry['description']}")
+    else:
+        parser.error("give a file or --benchmark")
+
+
+if __name__ == "__main__":
+    main()
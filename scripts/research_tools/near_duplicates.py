@@ -0,0 +1,267 @@
+"""
+Near-Duplicate Document Detection
+=================================
+
+Finds research documents that are near-copies of each other, not just
+byte-identical files. Each document is reduced to a set of word shingles
+(overlapping 5-word sequences), summarized by a MinHash signature, and
+candidate pairs are found with LSH banding: signatures are cut into bands and
+only documents sharing an identical band are compared. Comparisons therefore
+scale with the number of similar documents instead of all n^2 pairs.
+
+Signatures use one-permutation MinHash: every shingle is hashed once and the
+hash picks both a bin and a value, with empty bins filled from their
+neighbours (densification). This gives the usual Jaccard estimate at the cost
+of a single hash per shingle, which keeps a pure-Python cold run to seconds.
+
+Signatures are cached per content hash of the shared corpus index
+(research_tools.corpus_index), so reruns only read and shingle changed files.
+
+Usage:
+    research-tools duplicates
+    research-tools duplicates --dir research/literature --threshold 0.6
+    research-tools duplicates --json --limit 100
+
+Output:
+    Ranked pairs with estimated Jaccard similarity; cache in
+    .cache/near-duplicates.json
+"""
+
+import json
+import os
+import sys
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .corpus_index import REPO_ROOT, open_index
+from .lazy import LazyRegex
+
+# Bump when shingling or signature layout changes
+CACHE_VERSION = 1
+
+SHINGLE_SIZE = 5
+NUM_BINS = 128            # signature length; must be a power of two
+BIN_BITS = 7              # log2(NUM_BINS)
+VALUE_LIMIT = 1 << (32 - BIN_BITS)
+EMPTY = VALUE_LIMIT       # larger than any real bin value
+DEFAULT_BANDS = 32        # 32 bands x 4 rows: pairs above ~0.42 become candidates
+DEFAULT_THRESHOLD = 0.5
+MIN_SHINGLES = 50         # stubs share too much boilerplate to compare meaningfully
+
+_word_regex = LazyRegex(r'\w+')
+
+
+def shingle_hashes(content: str, size: int = SHINGLE_SIZE) -> set:
+    """32-bit hashes of the document's overlapping word shingles"""
+    words = _word_regex.findall(content.lower())
+    windows = zip(*(words[i:] for i in range(size)))
+    return set(map(zlib.crc32, map(str.encode, map(" ".join, windows))))
+
+
+def minhash_signature(hashes: set) -> Optional[List[int]]:
+    """One-permutation MinHash signature with rotation densification"""
+    if not hashes:
+        return None
+    # Visiting hashes in descending order leaves the minimum in every bin
+    bins = {h & (NUM_BINS - 1): h >> BIN_BITS for h in sorted(hashes, reverse=True)}
+    signature = [bins.get(i, EMPTY) for i in range(NUM_BINS)]
+    for i in range(NUM_BINS):
+        if i in bins:
+            continue
+        # Borrow from the next non-empty bin, offset by the distance travelled
+        distance = 1
+        while bins.get((i + distance) % NUM_BINS) is None:
+            distance += 1
+        signature[i] = bins[(i + distance) % NUM_BINS] + distance * VALUE_LIMIT
+    return signature
+
+
+def signature_entry(raw: bytes) -> Dict:
+    """Cache entry for a document's raw bytes (usable as a corpus index hook)"""
+    hashes = shingle_hashes(raw.decode("utf-8", errors="replace"))
+    return {"shingles": len(hashes), "signature": minhash_signature(hashes)}
+
+
+def estimate_jaccard(first: List[int], second: List[int]) -> float:
+    """Fraction of matching signature bins"""
+    return sum(1 for a, b in zip(first, second) if a == b) / NUM_BINS
+
+
+class NearDuplicateFinder:
+    """MinHash/LSH near-duplicate search over the corpus index"""
+
+    def __init__(self, root: Optional[str] = None, cache_path: Optional[str] = None,
+                 index=None):
+        self.root = Path(root).resolve() if root else REPO_ROOT
+        self.cache_path = Path(cache_path or (self.root / ".cache" / "near-duplicates.json"))
+        self.index = index
+        # sha256 -> {"shingles": int, "signature": [int] | None}
+        self.signatures: Dict[str, Dict] = {}
+        self.stats = {"documents": 0, "computed": 0, "cached": 0, "candidates": 0}
+        self._dirty = False
+
+    def load(self) -> "NearDuplicateFinder":
+        """Load cached signatures if the cache matches the current settings"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return self
+        if data.get("version") == CACHE_VERSION and data.get("bins") == NUM_BINS:
+            self.signatures = data.get("signatures", {})
+        return self
+
+    def save(self):
+        """Write the signature cache atomically if anything changed"""
+        if not self._dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"version": CACHE_VERSION, "bins": NUM_BINS, "signatures": self.signatures},
+                               separators=(",", ":")))
+        os.replace(tmp_path, self.cache_path)
+        self._dirty = False
+
+    def update(self, directory: Optional[str] = None) -> List[Tuple[str, Dict]]:
+        """Return (path, entry) for every document, computing missing signatures"""
+        if self.index is None:
+            self.index = open_index(self.root)
+
+        documents = []
+        live = set()
+        for record in self.index.documents(directory):
+            digest = record["sha256"]
+            live.add(digest)
+            entry = self.signatures.get(digest)
+            if entry is None and record["path"] in self.index.hook_results:
+                # Computed while the corpus index read this file
+                entry = self.index.hook_results[record["path"]]
+                self.signatures[digest] = entry
+                self._dirty = True
+                self.stats["computed"] += 1
+            elif entry is None:
+                try:
+                    with open(self.root / record["path"], "rb") as f:
+                        entry = signature_entry(f.read())
+                except OSError as e:
+                    print(f"Error reading {record['path']}: {e}", file=sys.stderr)
+                    continue
+                self.signatures[digest] = entry
+                self._dirty = True
+                self.stats["computed"] += 1
+            else:
+                self.stats["cached"] += 1
+            documents.append((record["path"], entry))
+
+        # Only prune on full-corpus runs so a --dir run keeps other signatures
+        if directory is None:
+            for digest in list(self.signatures):
+                if digest not in live:
+                    del self.signatures[digest]
+                    self._dirty = True
+        self.stats["documents"] = len(documents)
+        return documents
+
+    def find(self, directory: Optional[str] = None, threshold: float = DEFAULT_THRESHOLD,
+             bands: int = DEFAULT_BANDS, min_shingles: int = MIN_SHINGLES,
+             involving: Optional[set] = None) -> List[Dict]:
+        """Ranked near-duplicate pairs with estimated Jaccard >= threshold.
+
+        With `involving`, only pairs that include one of those paths are kept.
+        """
+        if NUM_BINS % bands:
+            raise ValueError(f"bands must divide {NUM_BINS}")
+        rows = NUM_BINS // bands
+        documents = [
+            (path, entry["signature"]) for path, entry in self.update(directory)
+            if entry["signature"] is not None and entry["shingles"] >= min_shingles
+        ]
+
+        buckets = defaultdict(list)
+        for doc_id, (_, signature) in enumerate(documents):
+            for band in range(bands):
+                start = band * rows
+                buckets[(band, *signature[start:start + rows])].append(doc_id)
+
+        candidates = set()
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for i, first in enumerate(members):
+                for second in members[i + 1:]:
+                    candidates.add((first, second))
+        self.stats["candidates"] = len(candidates)
+
+        pairs = []
+        for first, second in candidates:
+            if involving is not None and not (
+                    documents[first][0] in involving or documents[second][0] in involving):
+                continue
+            score = estimate_jaccard(documents[first][1], documents[second][1])
+            if score >= threshold:
+                pairs.append({
+                    "similarity": round(score, 3),
+                    "documents": sorted([documents[first][0], documents[second][0]]),
+                })
+        pairs.sort(key=lambda pair: (-pair["similarity"], pair["documents"]))
+        return pairs
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Find near-duplicate markdown documents")
+    parser.add_argument("--dir", help="Only compare documents under this directory (e.g. research/literature)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum estimated Jaccard similarity (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--bands", type=int, default=DEFAULT_BANDS,
+                        help=f"LSH bands; more bands find lower similarities (default: {DEFAULT_BANDS})")
+    parser.add_argument("--min-shingles", type=int, default=MIN_SHINGLES,
+                        help=f"Skip documents with fewer shingles (default: {MIN_SHINGLES})")
+    parser.add_argument("--limit", type=int, default=50, help="Maximum pairs to print (0 = all)")
+    parser.add_argument("--json", action="store_true", help="Print pairs as JSON")
+    parser.add_argument("--root", help="Repository root (default: parent of scripts/)")
+    parser.add_argument("--cache", help="Signature cache (default: .cache/near-duplicates.json)")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore cached signatures")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    finder = NearDuplicateFinder(args.root, args.cache)
+    if not args.rebuild:
+        finder.load()
+    try:
+        pairs = finder.find(args.dir, args.threshold, args.bands, args.min_shingles)
+    except ValueError as e:
+        parser.error(str(e))
+    finder.save()
+    elapsed = time.perf_counter() - started
+    shown = pairs[:args.limit] if args.limit else pairs
+
+    if args.json:
+        print(json.dumps({"stats": finder.stats, "pairs": shown}, indent=2))
+        return
+
+    stats = finder.stats
+    rows = NUM_BINS // args.bands
+    print(f"Documents: {stats['documents']} (signatures computed: {stats['computed']}, "
+          f"cached: {stats['cached']}), candidate pairs: {stats['candidates']}, "
+          f"LSH {args.bands}x{rows} (~{(1 / args.bands) ** (1 / rows):.2f} cutoff), {elapsed:.2f}s")
+    if not pairs:
+        print(f"✓ No document pairs with similarity >= {args.threshold}")
+        return
+    print(f"⚠ {len(pairs)} near-duplicate pair(s) with similarity >= {args.threshold}:")
+    for pair in shown:
+        first, second = pair["documents"]
+        print(f"  {pair['similarity']:.2f}  {first}")
+        print(f"        {second}")
+    if len(shown) < len(pairs):
+        print(f"  ... and {len(pairs) - len(shown)} more")
+
+
+if __name__ == "__main__":
+    main()
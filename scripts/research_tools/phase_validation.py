@@ -0,0 +1,324 @@
+"""
+Research Phase Completion Validator
+===================================
+
+Checks the completion status of every research assignment group of a phase
+and whether the project is ready to plan the next phase.
+
+The research directory is walked once: completion-summary files
+(`*group-NN*completion*summary*.md`, `*group-NN*COMPLETED*.md`) are indexed
+by (phase, group number) and each assignment file is read once to count
+checkboxes and look for completion markers. Cost grows with the number of
+files, not with groups x directory walks.
+
+A group is complete when it has a completion summary, a completion marker
+("Status: Complete", "Phase N ... Complete", "✅ ... Complete"), or all of
+its checkboxes ticked; partial when some are ticked; incomplete otherwise.
+
+Usage:
+    research-tools validate-phase                 # Phase 1, 40 groups
+    research-tools validate-phase --json
+    research-tools validate-phase --groups 0      # every group found
+    research-tools validate-phase --phase 2 --groups 12
+
+Exit codes:
+    0 = Phase complete, ready for the next phase
+    1 = Phase incomplete, shows remaining work
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from .lazy import LazyRegex
+
+RESEARCH_DIR = "research/literature"
+
+# Assignment files: research-assignment-group-07.md, research-assignment-phase-2-group-07.md,
+# research-assignment-phase-2-group-high-gamedev-tech.md
+ASSIGNMENT_REGEX = LazyRegex(r'^research-assignment-(?:phase-(\d+)-)?group-(\d+|[a-z][a-z0-9-]*)\.md$')
+# Named-group files that are reports about a group, not its assignment
+REPORT_SUFFIXES = ("summary", "queue", "sources", "overview")
+GROUP_REGEX = LazyRegex(r'group-(\d+)')
+PHASE_REGEX = LazyRegex(r'phase-(\d+)')
+SUMMARY_PATTERNS = ["*completion*summary*.md", "*COMPLETED*.md"]
+
+# Checkbox lines: "[x]" is done, "[ ]" / "[x]" (with optional spaces) is a task
+DONE_REGEX = LazyRegex(r'\[x\]')
+TASK_REGEX = LazyRegex(r'\[\s*[x ]\s*\]')
+
+STATUS_COMPLETE = "✅"
+STATUS_PARTIAL = "🔄"
+STATUS_INCOMPLETE = "⏳"
+
+# Phase 1 groups that blocked Phase 2 planning, with their remaining work
+PHASE_1_CRITICAL_GROUPS = {
+    3: {
+        "label": "Energy Systems + Historical Maps",
+        "title": "Energy Systems Collection",
+        "estimate": "5-7 hours",
+        "deliverable": "survival-content-extraction-energy-systems.md",
+    },
+    6: {
+        "label": "Game Design + Blender",
+        "title": "Fundamentals of Game Design",
+        "estimate": "6-8 hours",
+        "deliverable": "game-dev-analysis-fundamentals.md",
+    },
+}
+
+PHASE_1_NEXT_STEPS = [
+    "Aggregate discovered sources from all 40 groups",
+    "Validate and prioritize sources",
+    "Create discovery statistics",
+    "Balance and distribute into Phase 2 groups",
+    "Create Phase 2 assignment files",
+    "Update master research queue",
+    "Create Phase 2 sub-issues",
+]
+
+
+def group_key(name: str):
+    """Numbered groups are keyed by int, named (Phase 2+) groups by their slug"""
+    return int(name) if name.isdigit() else name
+
+
+def group_label(key) -> str:
+    return f"{key:02d}" if isinstance(key, int) else key
+
+
+def index_research_dir(research_dir: str) -> Tuple[Dict, Dict, List[str]]:
+    """Walk once over the research directory.
+
+    Returns ({(phase, group): assignment path}, {(phase, group number): summary
+    path}, [paths of all completion summaries]).
+    """
+    assignments = {}
+    summaries = {}
+    summary_paths = []
+    for dirpath, dirnames, filenames in os.walk(research_dir):
+        dirnames.sort()
+        for name in sorted(filenames):
+            if not name.endswith(".md"):
+                continue
+            path = os.path.join(dirpath, name)
+
+            match = ASSIGNMENT_REGEX.match(name)
+            if match and dirpath == research_dir and not match.group(2).endswith(REPORT_SUFFIXES):
+                assignments[(int(match.group(1) or 1), group_key(match.group(2)))] = path
+                continue
+
+            if any(fnmatch.fnmatchcase(name, p) for p in SUMMARY_PATTERNS):
+                summary_paths.append(path)
+
+            for group_match in GROUP_REGEX.finditer(name):
+                rest = name[group_match.end():]
+                if not rest[:1].isdigit() and any(fnmatch.fnmatchcase(rest, p) for p in SUMMARY_PATTERNS):
+                    # A "phase-N" before the group number places it in that phase
+                    phase_match = PHASE_REGEX.search(name, 0, group_match.start())
+                    key = (int(phase_match.group(1)) if phase_match else 1, int(group_match.group(1)))
+                    summaries.setdefault(key, path)
+    return assignments, summaries, summary_paths
+
+
+def find_named_summary(summary_paths: List[str], phase: int, slug: str) -> Optional[str]:
+    """Completion summary of a named group, e.g. phase-2-<slug>-final-completion-summary.md"""
+    for path in summary_paths:
+        name = os.path.basename(path)
+        position = name.find(slug)
+        if position != -1 and f"phase-{phase}-" in name[:position] and \
+                any(fnmatch.fnmatchcase(name[position + len(slug):], p) for p in SUMMARY_PATTERNS):
+            return path
+    return None
+
+
+def scan_assignment(path: str, phase: int) -> Dict:
+    """Count done/total checkbox lines and find a completion marker in one pass"""
+    completed_regex = re.compile(
+        rf'status.*complete|phase {phase}.*complete|✅.*complete', re.IGNORECASE
+    )
+    done = total = 0
+    has_completed = False
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if DONE_REGEX.search(line):
+                done += 1
+            if TASK_REGEX.search(line):
+                total += 1
+            if not has_completed and completed_regex.search(line):
+                has_completed = True
+    return {"done": done, "total": total, "has_completed": has_completed}
+
+
+def validate(research_dir: str, phase: int, groups: int) -> Dict:
+    """Status of groups 1..groups, or of every group found if groups is 0"""
+    assignments, summaries, summary_paths = index_research_dir(research_dir)
+    if groups:
+        keys = range(1, groups + 1)
+    else:
+        keys = sorted((key for (p, key) in assignments if p == phase),
+                      key=lambda key: (isinstance(key, str), key))
+
+    results = []
+    for key in keys:
+        path = assignments.get((phase, key))
+        if isinstance(key, int):
+            summary = summaries.get((phase, key))
+        else:
+            summary = find_named_summary(summary_paths, phase, key)
+        result = {"group": key, "file": path, "summary": summary,
+                  "done": 0, "total": 0, "percent": None}
+        if path is None:
+            result["status"] = STATUS_INCOMPLETE
+            result["missing"] = True
+            results.append(result)
+            continue
+
+        scan = scan_assignment(path, phase)
+        result.update(done=scan["done"], total=scan["total"])
+        if scan["total"]:
+            result["percent"] = scan["done"] * 100 // scan["total"]
+
+        if result["summary"] or scan["has_completed"]:
+            result["status"] = STATUS_COMPLETE
+        elif scan["total"] and scan["done"]:
+            result["status"] = STATUS_COMPLETE if result["percent"] >= 100 else STATUS_PARTIAL
+        else:
+            result["status"] = STATUS_INCOMPLETE
+        results.append(result)
+
+    counts = {
+        "total": len(results),
+        "completed": sum(1 for r in results if r["status"] == STATUS_COMPLETE),
+        "partial": sum(1 for r in results if r["status"] == STATUS_PARTIAL),
+    }
+    counts["incomplete"] = counts["total"] - counts["completed"] - counts["partial"]
+    counts["percent"] = counts["completed"] * 100 // counts["total"] if counts["total"] else 0
+    return {
+        "phase": phase,
+        "complete": counts["total"] > 0 and counts["completed"] == counts["total"],
+        "counts": counts,
+        "groups": results,
+    }
+
+
+def banner(title: str):
+    print("╔════════════════════════════════════════════════════════════╗")
+    print(f"║  {title:<58}║")
+    print("╚════════════════════════════════════════════════════════════╝")
+    print("")
+
+
+def print_report(report: Dict, research_dir: str):
+    """Human-readable report (format of validate-phase1-completion.sh)"""
+    phase = report["phase"]
+    counts = report["counts"]
+    by_number = {r["group"]: r for r in report["groups"]}
+
+    print("╔════════════════════════════════════════════════════════════╗")
+    print(f"║  {f'Phase {phase} Research - Completion Validation':<57}║")
+    print("║  BlueMarble.Design Research Project                       ║")
+    print("╚════════════════════════════════════════════════════════════╝")
+    print("")
+    print(f"Checking all {counts['total']} research assignment groups...")
+    print("")
+
+    # Only show incomplete or partial groups (to keep output clean)
+    for result in report["groups"]:
+        if result["status"] == STATUS_COMPLETE:
+            continue
+        if result.get("missing"):
+            print(f"Group {group_label(result['group'])}: ❌ FILE MISSING")
+        elif result["total"] and result["done"]:
+            print(f"Group {group_label(result['group'])}: {result['status']} PARTIAL "
+                  f"({result['done']}/{result['total']} tasks = {result['percent']}%)")
+        else:
+            print(f"Group {group_label(result['group'])}: {result['status']} NOT COMPLETE")
+
+    print("")
+    banner("Summary Statistics")
+    print(f"Total Groups:      {counts['total']}")
+    print(f"✅ Completed:      {counts['completed']} ({counts['percent']}%)")
+    print(f"🔄 Partial:        {counts['partial']}")
+    print(f"⏳ Incomplete:     {counts['incomplete']}")
+    print("")
+
+    banner(f"Phase {phase + 1} Readiness Check")
+    critical = PHASE_1_CRITICAL_GROUPS if phase == 1 else {}
+    if critical:
+        print("Critical Groups Status:")
+        for number, info in critical.items():
+            label = f"Group {number:02d} ({info['label']}):"
+            status = by_number[number]["status"] if number in by_number else "UNKNOWN"
+            print(f"  {label:<45}{status}")
+        print("")
+
+    if report["complete"]:
+        print(f"🎉 Phase {phase} Status: COMPLETE!")
+        print(f"✅ All {counts['total']} groups finished")
+        print(f"✅ Ready to proceed with Phase {phase + 1} Planning")
+        if phase == 1:
+            print("")
+            print("Next Steps:")
+            for step, text in enumerate(PHASE_1_NEXT_STEPS, 1):
+                print(f"  {step}. {text}")
+        return
+
+    print(f"⚠️  Phase {phase} Status: INCOMPLETE ({counts['percent']}% complete)")
+    print(f"❌ Cannot proceed with Phase {phase + 1} Planning")
+    print("")
+    print("Remaining Work:")
+    blocking = [(n, info) for n, info in critical.items()
+                if n in by_number and by_number[n]["status"] != STATUS_COMPLETE]
+    for number, info in blocking:
+        print("")
+        print(f"  Group {number:02d}: {info['title']}")
+        print("    - Status: Partial (1 of 2 topics complete)")
+        print(f"    - Remaining: {info['title']}")
+        print(f"    - Estimated: {info['estimate']}")
+        print(f"    - Deliverable: {info['deliverable']}")
+        if os.path.isfile(os.path.join(research_dir, info["deliverable"])):
+            print("    ✅ Document EXISTS - may need status update")
+        else:
+            print("    ❌ Document MISSING - research incomplete")
+    others = [r for r in report["groups"]
+              if r["status"] != STATUS_COMPLETE and r["group"] not in critical]
+    if others:
+        print("")
+        numbers = ", ".join(group_label(r["group"]) for r in others)
+        print(f"  Other unfinished groups: {numbers}")
+    if phase == 1 and blocking:
+        print("")
+        print("Total Estimated Remaining: 11-15 hours across 2 topics")
+        print("")
+        print("Recommendation:")
+        print("  - Assign Group 03 to team member familiar with survival content")
+        print("  - Assign Group 06 to team member with game design expertise")
+        print("  - With 2 people working in parallel: 1 day to complete")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Validate research phase completion")
+    parser.add_argument("--phase", type=int, default=1, help="Phase to validate (default: 1)")
+    parser.add_argument("--groups", type=int, default=40,
+                        help="Number of groups (default: 40; 0 = every numbered assignment file found)")
+    parser.add_argument("--research-dir", default=RESEARCH_DIR,
+                        help=f"Directory with assignment files (default: {RESEARCH_DIR})")
+    parser.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = parser.parse_args(argv)
+
+    report = validate(args.research_dir, args.phase, args.groups)
+    if args.json:
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        print_report(report, args.research_dir)
+    return 0 if report["complete"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Read-Ahead File Prefetcher
+==========================
+
+Overlaps disk reads with document extraction. Instead of alternating
+between a blocking read and CPU-bound parsing, a bounded pool of reader
+threads reads the next documents while the current one is being parsed:
+
+    readers   threads issuing reads (file I/O releases the GIL)
+    depth     documents read ahead of the consumer at most
+
+Reads are submitted in document order through a window of `depth`
+futures, and the consumer takes them in the same order. A new read is
+only submitted when the consumer takes one, so at most `depth` documents
+are buffered (backpressure) and a slow consumer never makes the readers
+run away with memory. With readers=0 files are read inline, one at a
+time, as before.
+
+The stats separate the time spent in reads (summed over reader threads)
+from the time the consumer actually waited for data. On a cold cache a
+sequential scan costs read + compute. A pipelined one approaches
+max(read, compute), and read_wait shows how much I/O was left exposed.
+
+Usage:
+    from research_tools.prefetch import Prefetcher
+
+    prefetcher = Prefetcher(paths, readers=4, depth=16)
+    for path, raw, error in prefetcher:
+        ...
+    print(prefetcher.stats)
+
+    research-tools index --rebuild --readers 4 --queue-depth 16
+    research-tools index --rebuild --readers 0                   # sequential
+    research-tools index --rebuild --read-latency-ms 5           # emulate cold storage
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Iterator, Optional, Sequence, Tuple
+
+DEFAULT_READERS = 4
+DEFAULT_DEPTH = 16
+
+
+class Prefetcher:
+    """Reads files in order on a bounded thread pool, at most `depth` ahead of the consumer"""
+
+    def __init__(self, paths: Sequence, readers: int = DEFAULT_READERS, depth: int = DEFAULT_DEPTH,
+                 latency: float = 0.0):
+        self.paths = paths
+        self.readers = max(0, readers)
+        self.depth = max(1, depth)
+        # Extra seconds per read, to emulate cold or networked storage in benchmarks
+        self.latency = latency
+        self._lock = threading.Lock()
+        self.stats = {"readers": self.readers, "depth": self.depth, "files": 0, "bytes": 0,
+                      "read_s": 0.0, "read_wait_s": 0.0, "stalls": 0}
+
+    def _read(self, path) -> Tuple[Optional[bytes], Optional[str]]:
+        started = time.perf_counter()
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            with open(path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            raw, error = None, str(e)
+        else:
+            error = None
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.stats["read_s"] += elapsed
+            self.stats["files"] += 1
+            self.stats["bytes"] += len(raw) if raw is not None else 0
+        return raw, error
+
+    def __iter__(self) -> Iterator[Tuple[object, Optional[bytes], Optional[str]]]:
+        """(path, raw bytes or None, error or None) in the order of `paths`"""
+        if self.readers == 0:
+            for path in self.paths:
+                started = time.perf_counter()
+                raw, error = self._read(path)
+                self.stats["read_wait_s"] += time.perf_counter() - started
+                yield path, raw, error
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        pool = ThreadPoolExecutor(self.readers, thread_name_prefix="prefetch")
+        pending = iter(self.paths)
+        window = deque()
+        try:
+            for path in pending:
+                window.append((path, pool.submit(self._read, path)))
+                if len(window) >= self.depth:
+                    break
+            while window:
+                path, future = window.popleft()
+                if not future.done():
+                    self.stats["stalls"] += 1
+                started = time.perf_counter()
+                raw, error = future.result()
+                self.stats["read_wait_s"] += time.perf_counter() - started
+                # Refill the window before handing the document over, so the
+                # readers keep working while the consumer computes
+                following = next(pending, None)
+                if following is not None:
+                    window.append((following, pool.submit(self._read, following)))
+                yield path, raw, error
+        finally:
+            # Only the window holds pending reads; cancel them before shutting
+            # down (shutdown(cancel_futures=True) needs Python 3.9)
+            for _, future in window:
+                future.cancel()
+            pool.shutdown(wait=True)
@@ -0,0 +1,422 @@
+"""
+Rate-Limit-Aware Issue Publisher for Research Assignment Groups
+================================================================
+
+Publishes the issues generated by generate-research-issues.py through the
+GitHub REST API. Only the issues listed in changes.json are touched: added
+issues are created, changed issues are edited in place.
+
+Instead of a fixed 120-second sleep between issues, requests are paced by a
+token bucket that follows GitHub's rate-limit response headers:
+
+- x-ratelimit-remaining / x-ratelimit-reset spread the remaining quota over
+  the time left in the window, and block until the reset when it runs out
+- Retry-After on 403/429 responses pauses all workers for that long
+- secondary rate limits without Retry-After back off exponentially
+
+Every successful publish is recorded in published-manifest.json immediately,
+so an interrupted run resumes where it stopped.
+
+Usage:
+    python3 scripts/publish-research-issues.py --repo Nomoos/BlueMarble.Design
+    python3 scripts/publish-research-issues.py --dry-run
+    python3 scripts/publish-research-issues.py --concurrency 2 --rate 0.5
+
+Offline testing against the local stub API (see github-api-stub.py):
+    python3 scripts/github-api-stub.py --port 8765 &
+    python3 scripts/publish-research-issues.py --api-url http://127.0.0.1:8765 \\
+        --token test --backoff-base 1
+
+Requirements:
+    A token with issue write access in GITHUB_TOKEN or GH_TOKEN (or --token)
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.parse
+
+DEFAULT_OUTPUT_DIR = "/tmp/research-issues"
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_REPO = "Nomoos/BlueMarble.Design"
+
+CHANGES_FILE = "changes.json"
+MANIFEST_FILE = "manifest.json"
+PUBLISHED_MANIFEST_FILE = "published-manifest.json"
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request was rejected by a primary or secondary rate limit"""
+
+    def __init__(self, message, wait_seconds):
+        super().__init__(message)
+        self.wait_seconds = wait_seconds
+
+
+class ApiError(Exception):
+    """Raised for non-rate-limit API failures"""
+
+    def __init__(self, status, message):
+        super().__init__(f"HTTP {status}: {message}")
+        self.status = status
+
+
+class RateLimiter:
+    """Token bucket whose refill rate follows GitHub's rate-limit headers.
+
+    The bucket holds up to `burst` tokens and refills at `rate` tokens per
+    second. Responses can lower the effective rate (few requests left until
+    the reset) or pause the bucket entirely (exhausted quota, Retry-After,
+    secondary limit backoff).
+    """
+
+    def __init__(self, rate=1.0, burst=1, backoff_base=60.0, backoff_max=900.0,
+                 clock=time.monotonic, wall_clock=time.time, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._clock = clock
+        self._wall_clock = wall_clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = float(burst)
+        self._effective_rate = rate
+        self._last_refill = clock()
+        self._paused_until = 0.0
+        self._secondary_strikes = 0
+        self.waited = 0.0
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                else:
+                    delay = (1 - self._tokens) / self._effective_rate
+                self.waited += delay
+            self._sleep(delay)
+
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(self.burst, self._tokens + elapsed * self._effective_rate)
+
+    def update_from_headers(self, headers):
+        """Adjust pacing from x-ratelimit-* headers of a successful response"""
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = int(remaining)
+            seconds_to_reset = max(0.0, float(reset) - self._wall_clock())
+        except ValueError:
+            return
+
+        with self._lock:
+            self._secondary_strikes = 0
+            if remaining <= 0:
+                self._pause(seconds_to_reset + 1)
+            elif seconds_to_reset > 0:
+                # Spread what is left of the quota over the rest of the window
+                self._effective_rate = min(self.rate, remaining / seconds_to_reset)
+            else:
+                self._effective_rate = self.rate
+
+    def wait_for_limit(self, headers, secondary):
+        """Compute and apply the pause for a rate-limited response"""
+        retry_after = headers.get("retry-after")
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+
+        with self._lock:
+            if retry_after is not None:
+                try:
+                    wait = float(retry_after)
+                except ValueError:
+                    wait = self.backoff_base
+            elif not secondary and remaining == "0" and reset is not None:
+                try:
+                    wait = max(0.0, float(reset) - self._wall_clock()) + 1
+                except ValueError:
+                    wait = self.backoff_base
+            else:
+                # Secondary limit without guidance: exponential backoff
+                wait = min(self.backoff_max, self.backoff_base * (2 ** self._secondary_strikes))
+                self._secondary_strikes += 1
+            self._pause(wait)
+        return wait
+
+    def _pause(self, seconds):
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+        self._tokens = 0.0
+
+
+class GitHubClient:
+    """Minimal GitHub REST client that routes every request through a RateLimiter"""
+
+    def __init__(self, api_url, repo, token, limiter, max_retries=5, timeout=30):
+        self.api_url = api_url.rstrip("/")
+        self.repo = repo
+        self.token = token
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.stats = {"requests": 0, "rate_limited": 0, "retries": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def request(self, method, path, payload=None):
+        """Send a request, retrying on rate limits and transient server errors"""
+        # http.client/ssl are only loaded once a request is actually made
+        import urllib.error
+        import urllib.request
+
+        url = f"{self.api_url}{path}"
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire()
+            self._count("requests")
+            req = urllib.request.Request(url, data=data, method=method)
+            req.add_header("Accept", "application/vnd.github+json")
+            req.add_header("X-GitHub-Api-Version", "2022-11-28")
+            req.add_header("User-Agent", "bluemarble-research-publisher")
+            if self.token:
+                req.add_header("Authorization", f"Bearer {self.token}")
+            if data is not None:
+                req.add_header("Content-Type", "application/json")
+
+            try:
+                with urllib.request.urlopen(req, timeout=self.timeout) as response:
+                    headers = {k.lower(): v for k, v in response.headers.items()}
+                    self.limiter.update_from_headers(headers)
+                    body = response.read()
+                    return json.loads(body) if body else None
+            except urllib.error.HTTPError as e:
+                headers = {k.lower(): v for k, v in e.headers.items()}
+                message = e.read().decode("utf-8", errors="replace")
+
+                if e.code in (403, 429) and self._is_rate_limited(e.code, headers, message):
+                    self._count("rate_limited")
+                    secondary = "secondary rate limit" in message.lower()
+                    wait = self.limiter.wait_for_limit(headers, secondary)
+                    kind = "secondary" if secondary else "primary"
+                    print(f"  ⏳ {kind} rate limit on {method} {path}; waiting {wait:.0f}s")
+                    if attempt == self.max_retries:
+                        raise RateLimitExceeded(message, wait)
+                elif e.code >= 500 and attempt < self.max_retries:
+                    self.limiter.wait_for_limit({}, secondary=True)
+                else:
+                    raise ApiError(e.code, message) from None
+            except urllib.error.URLError as e:
+                if attempt == self.max_retries:
+                    raise ApiError(0, str(e.reason)) from None
+                self.limiter.wait_for_limit({}, secondary=True)
+            self._count("retries")
+
+        raise ApiError(0, f"giving up on {method} {path}")
+
+    @staticmethod
+    def _is_rate_limited(status, headers, message):
+        if status == 429 or "retry-after" in headers:
+            return True
+        if headers.get("x-ratelimit-remaining") == "0":
+            return True
+        return "rate limit" in message.lower()
+
+    def create_issue(self, title, body, labels, assignee=None):
+        payload = {"title": title, "body": body, "labels": labels}
+        if assignee:
+            payload["assignees"] = [assignee]
+        return self.request("POST", f"/repos/{self.repo}/issues", payload)
+
+    def update_issue(self, number, body, labels):
+        return self.request("PATCH", f"/repos/{self.repo}/issues/{number}",
+                            {"body": body, "labels": labels})
+
+    def find_issue(self, title):
+        """Find an issue number by exact title"""
+        query = urllib.parse.quote(f'repo:{self.repo} is:issue in:title "{title}"')
+        result = self.request("GET", f"/search/issues?q={query}")
+        for item in (result or {}).get("items", []):
+            if item.get("title") == title:
+                return item["number"]
+        return None
+
+
+class PublishedManifest:
+    """published-manifest.json, rewritten atomically after every publish"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data = json.load(f)
+        except FileNotFoundError:
+            self.data = {"issues": {}}
+        self.data.setdefault("issues", {})
+
+    @property
+    def issues(self):
+        return self.data["issues"]
+
+    def is_published(self, entry):
+        record = self.issues.get(entry["file"])
+        return record is not None and record.get("sha256") == entry["sha256"]
+
+    def record(self, entry, issue):
+        with self._lock:
+            self.issues[entry["file"]] = {
+                "sha256": entry["sha256"],
+                "title": entry["title"],
+                "labels": entry["labels"],
+                "number": issue.get("number"),
+                "url": issue.get("html_url"),
+            }
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2, sort_keys=True)
+                f.write("\n")
+            os.replace(tmp_path, self.path)
+
+
+def load_publish_list(output_dir, publish_all=False):
+    """Return the issues to publish, in publishing order"""
+    if publish_all:
+        with open(os.path.join(output_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            issues = json.load(f)["issues"]
+        return [dict(meta, file=name, status="added") for name, meta in issues.items()]
+
+    with open(os.path.join(output_dir, CHANGES_FILE), "r", encoding="utf-8") as f:
+        return json.load(f)["publish"]
+
+
+def publish_entry(client, published, output_dir, entry, assignee=None):
+    """Create or update a single issue and record it"""
+    with open(os.path.join(output_dir, entry["file"]), "r", encoding="utf-8") as f:
+        body = f.read()
+
+    number = published.issues.get(entry["file"], {}).get("number")
+    if number is None:
+        # Also for "added" entries: a run killed between creating the issue
+        # and recording it must not create it a second time when resumed
+        number = client.find_issue(entry["title"])
+
+    if number is not None:
+        issue = client.update_issue(number, body, entry["labels"])
+        action = "Updated"
+    else:
+        issue = client.create_issue(entry["title"], body, entry["labels"], assignee)
+        action = "Created"
+
+    published.record(entry, issue or {})
+    return action, issue or {}
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(
+        description="Publish new or changed research issues through the GitHub REST API"
+    )
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR,
+                        help="Directory written by generate-research-issues.py")
+    parser.add_argument("--repo", default=DEFAULT_REPO, help="Target repository (owner/name)")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL, help="GitHub API base URL")
+    parser.add_argument("--token", default=os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN"),
+                        help="API token (default: $GITHUB_TOKEN or $GH_TOKEN)")
+    parser.add_argument("--assignee", help="GitHub username to assign created issues to")
+    parser.add_argument("--all", action="store_true",
+                        help="Publish every issue in manifest.json, not just changes.json")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Maximum requests in flight (default: 1)")
+    parser.add_argument("--rate", type=float, default=1.0,
+                        help="Maximum sustained requests per second (default: 1.0)")
+    parser.add_argument("--burst", type=int, default=1,
+                        help="Token bucket capacity (default: 1)")
+    parser.add_argument("--backoff-base", type=float, default=60.0,
+                        help="First secondary-limit backoff in seconds (default: 60)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="List what would be published without calling the API")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Publishing Research Assignment Issues")
+    print("=" * 60)
+
+    try:
+        entries = load_publish_list(args.output_dir, args.all)
+    except FileNotFoundError as e:
+        print(f"✗ {e.filename} not found")
+        print("  Run: python3 scripts/generate-research-issues.py")
+        return 1
+
+    published = PublishedManifest(os.path.join(args.output_dir, PUBLISHED_MANIFEST_FILE))
+    pending = [entry for entry in entries if not published.is_published(entry)]
+    skipped = len(entries) - len(pending)
+
+    if skipped:
+        print(f"ℹ Resuming: {skipped} issue(s) already published")
+    if not pending:
+        print("✓ Nothing to publish")
+        return 0
+
+    print(f"ℹ {len(pending)} issue(s) to publish to {args.repo}")
+    if args.dry_run:
+        for entry in pending:
+            print(f"  {entry['status']:8} {entry['file']}: {entry['title']}")
+        return 0
+
+    if not args.token:
+        print("✗ No API token: set GITHUB_TOKEN or GH_TOKEN, or pass --token")
+        return 1
+
+    limiter = RateLimiter(rate=args.rate, burst=args.burst, backoff_base=args.backoff_base)
+    client = GitHubClient(args.api_url, args.repo, args.token, limiter)
+
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    started = time.monotonic()
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as pool:
+        futures = {
+            pool.submit(publish_entry, client, published, args.output_dir, entry, args.assignee): entry
+            for entry in pending
+        }
+        for future in as_completed(futures):
+            entry = futures[future]
+            try:
+                action, issue = future.result()
+                print(f"✓ {action}: {entry['title']} {issue.get('html_url', '')}".rstrip())
+            except (ApiError, RateLimitExceeded, OSError) as e:
+                print(f"✗ Failed: {entry['title']}: {e}")
+                failed.append(entry["file"])
+
+    elapsed = time.monotonic() - started
+    print()
+    print("=" * 60)
+    print(f"Published: {len(pending) - len(failed)} of {len(pending)} in {elapsed:.1f}s")
+    print(f"Requests: {client.stats['requests']}, rate limited: {client.stats['rate_limited']}, "
+          f"retries: {client.stats['retries']}, waited: {limiter.waited:.1f}s")
+    if failed:
+        print(f"⚠ Failed: {', '.join(sorted(failed))} (rerun to retry)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
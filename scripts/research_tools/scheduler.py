@@ -0,0 +1,254 @@
+"""
+Effort-Balanced Assignment Scheduler
+====================================
+
+Packs discovered sources into K research assignment groups so that every
+group carries about the same estimated effort, instead of balancing
+`groups_config` by hand.
+
+Each source's `estimated_effort` ("8-12 hours", "3 hours", "4-8h") is parsed
+into an hour range and scheduled by the midpoint with the LPT (longest
+processing time first) heuristic:
+
+1. Sources are ordered by priority (critical first), then by effort,
+   largest first, then by catalog order, so critical work is spread over
+   the groups before anything else is placed.
+2. Each source goes to the currently lightest group that is below the
+   per-group topic cap (a heap keyed by load, O(n log K) overall).
+3. Groups are numbered by their highest priority, heaviest first, so
+   group 01 starts with critical work as in the hand-made plan.
+
+Plain LPT keeps the heaviest group within 4/3 of the optimum; priority
+ordering and topic caps can loosen that, so the heaviest group is reported
+against a lower bound (the larger of the average load and the largest
+source) next to the max/min load ratio. Sources that don't fit under the
+topic caps are reported as unscheduled.
+
+Usage:
+    research-tools schedule --groups 12
+    research-tools schedule --groups 12 --max-topics 3 --catalog auto-discovered-sources.json
+    research-tools schedule --groups 12 --json
+    research-tools schedule --benchmark 5000 --groups 300
+"""
+
+import heapq
+import json
+import math
+import re
+import sys
+from typing import Dict, List, Optional, Tuple
+
+from .lazy import LazyRegex
+
+# Lower rank schedules first; unknown priorities go last
+PRIORITY_ORDER = ["critical", "high", "medium", "low", "very low"]
+PRIORITY_RANK = {priority: rank for rank, priority in enumerate(PRIORITY_ORDER)}
+
+# Fallback when a source has no parseable estimate (matches _estimate_effort's default)
+DEFAULT_EFFORT = (4.0, 6.0)
+
+EFFORT_REGEX = LazyRegex(r'(\d+(?:\.\d+)?)\s*(?:(?:-|–|to)\s*(\d+(?:\.\d+)?))?\s*(?:h\b|hours?\b)',
+                          re.IGNORECASE)
+
+HOURS_PER_WEEK = 8
+
+
+def parse_effort(text: Optional[str]) -> Tuple[float, float]:
+    """Hour range of an effort estimate: "8-12 hours" -> (8, 12), "3h" -> (3, 3)"""
+    match = EFFORT_REGEX.search(text or "")
+    if not match:
+        return DEFAULT_EFFORT
+    low = float(match.group(1))
+    high = float(match.group(2)) if match.group(2) else low
+    return (low, high) if low <= high else (high, low)
+
+
+def priority_rank(priority: Optional[str]) -> int:
+    """Scheduling rank of a priority label (case-insensitive)"""
+    return PRIORITY_RANK.get((priority or "").lower(), len(PRIORITY_ORDER))
+
+
+def format_hours(low: float, high: float) -> str:
+    """Effort range in the groups_config style, e.g. "8-12h" """
+    return f"{low:g}h" if low == high else f"{low:g}-{high:g}h"
+
+
+def schedule(sources: List[Dict], groups: int, max_topics: Optional[int] = None,
+             first_group: int = 1) -> Dict:
+    """Pack sources into `groups` effort-balanced groups.
+
+    Returns {"groups": [...], "unscheduled": [...], "stats": {...}} where each
+    group has the groups_config fields (num, topics, priority, effort, weeks,
+    title) plus "sources", "low", "high" and "load" (midpoint hours).
+    """
+    if groups < 1:
+        raise ValueError("at least one group is required")
+    if max_topics is not None and max_topics < 1:
+        raise ValueError("max_topics must be at least 1")
+
+    items = []
+    for position, source in enumerate(sources):
+        low, high = parse_effort(source.get("estimated_effort"))
+        items.append((priority_rank(source.get("priority")), -(low + high), position, low, high))
+    items.sort()
+
+    capacity = max_topics or len(items)
+    members = [[] for _ in range(groups)]
+    lows = [0.0] * groups
+    highs = [0.0] * groups
+    # (load, group) heap of the groups that still have room
+    heap = [(0.0, index) for index in range(groups)]
+    unscheduled = []
+    for _, _, position, low, high in items:
+        if not heap:
+            unscheduled.append(sources[position])
+            continue
+        _, index = heapq.heappop(heap)
+        members[index].append(position)
+        lows[index] += low
+        highs[index] += high
+        if len(members[index]) < capacity:
+            heapq.heappush(heap, ((lows[index] + highs[index]) / 2, index))
+
+    def order(index):
+        ranks = [priority_rank(sources[p].get("priority")) for p in members[index]]
+        return (min(ranks) if ranks else len(PRIORITY_ORDER) + 1,
+                -(lows[index] + highs[index]), members[index][:1])
+
+    result = []
+    for num, index in enumerate(sorted(range(groups), key=order), first_group):
+        group_sources = [sources[p] for p in members[index]]
+        low, high = lows[index], highs[index]
+        if group_sources:
+            top = min((s.get("priority") or "low" for s in group_sources), key=priority_rank)
+            titles = [s["title"] for s in group_sources]
+            title = " + ".join(titles[:2]) + (f" + {len(titles) - 2} more" if len(titles) > 2 else "")
+            priority = top.title()
+            weeks = max(1, math.ceil(high / HOURS_PER_WEEK))
+        else:
+            priority, title, weeks = "Reserved", "Reserved for Discovered Sources", 0
+        result.append({
+            "num": num,
+            "topics": len(group_sources),
+            "priority": priority,
+            "effort": format_hours(low, high),
+            "weeks": weeks,
+            "title": title,
+            "sources": group_sources,
+            "low": low,
+            "high": high,
+            "load": (low + high) / 2,
+        })
+
+    return {"groups": result, "unscheduled": unscheduled, "stats": balance_stats(result)}
+
+
+def balance_stats(groups: List[Dict]) -> Dict:
+    """Load spread of a schedule and how far the heaviest group is from optimal"""
+    loads = [group["load"] for group in groups]
+    largest = max((sum(parse_effort(source.get("estimated_effort"))) / 2
+                   for group in groups for source in group["sources"]), default=0.0)
+    lower_bound = max(sum(loads) / len(groups), largest)
+    max_load, min_load = max(loads), min(loads)
+    return {
+        "groups": len(groups),
+        "sources": sum(group["topics"] for group in groups),
+        "total_hours": [sum(g["low"] for g in groups), sum(g["high"] for g in groups)],
+        "max_load": max_load,
+        "min_load": min_load,
+        # None when a group is empty (more groups than sources)
+        "max_min_ratio": round(max_load / min_load, 3) if min_load else None,
+        "lower_bound": lower_bound,
+        "max_vs_lower_bound": round(max_load / lower_bound, 3) if lower_bound else None,
+    }
+
+
+def print_schedule(plan: Dict, verbose: bool = True):
+    """Groups with their effort, then the balance summary"""
+    if verbose:
+        for group in plan["groups"]:
+            print(f"Group {group['num']:02d}  {group['priority']:<9} {group['effort']:>10}  "
+                  f"{group['topics']} topic(s)  {group['title']}")
+        print()
+    print_balance(plan)
+
+
+def print_balance(plan: Dict):
+    """One-paragraph balance summary (max/min load and distance from optimal)"""
+    stats = plan["stats"]
+    ratio = f"{stats['max_min_ratio']:.3f}" if stats["max_min_ratio"] else "n/a (empty group)"
+    print(f"Scheduled {stats['sources']} source(s) into {stats['groups']} group(s), "
+          f"{format_hours(*stats['total_hours'])} total")
+    print(f"Load (midpoint hours): max {stats['max_load']:g}, min {stats['min_load']:g}, "
+          f"max/min {ratio}")
+    if stats["max_vs_lower_bound"]:
+        print(f"Heaviest group vs lower bound {stats['lower_bound']:g}h: "
+              f"{stats['max_vs_lower_bound']:.3f}x")
+    if plan["unscheduled"]:
+        print(f"⚠ {len(plan['unscheduled'])} source(s) unscheduled: topic caps are full")
+
+
+def load_catalog(path: Optional[str] = None) -> List[Dict]:
+    """Sources of a discovery report (.json, .jsonl, .yaml, optionally .gz/.xz), or of a fresh scan"""
+    if path:
+        from .catalog_io import iter_sources
+
+        return list(iter_sources(path))
+    from contextlib import redirect_stdout
+
+    from .discovery import SourceDiscovery
+
+    # Keep scan progress off stdout, which may carry --json output
+    with redirect_stdout(sys.stderr):
+        return SourceDiscovery().scan_research_documents()
+
+
+def benchmark(sources: int, groups: int, max_topics: Optional[int]) -> Dict:
+    """Schedule a synthetic catalog and time it"""
+    import random
+    import time
+
+    rng = random.Random(0)
+    efforts = ["1-3 hours", "2-4 hours", "4-6 hours", "8-12 hours", "6 hours", "10-20 hours"]
+    catalog = [{"title": f"Source {n}", "priority": rng.choice(PRIORITY_ORDER[:4]),
+                "estimated_effort": rng.choice(efforts)} for n in range(sources)]
+    started = time.perf_counter()
+    plan = schedule(catalog, groups, max_topics)
+    plan["stats"]["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    return plan
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Pack discovered sources into effort-balanced groups")
+    parser.add_argument("--groups", type=int, default=10, help="Number of groups (default: 10)")
+    parser.add_argument("--max-topics", type=int, default=None,
+                        help="Maximum sources per group (default: no cap)")
+    parser.add_argument("--catalog",
+                        help="Discovery report: .json, .jsonl or .yaml, optionally .gz/.xz (default: scan research/literature)")
+    parser.add_argument("--json", action="store_true", help="Print the schedule as JSON")
+    parser.add_argument("--benchmark", type=int, metavar="N",
+                        help="Schedule N synthetic sources and report the time taken")
+    args = parser.parse_args()
+
+    try:
+        if args.benchmark:
+            plan = benchmark(args.benchmark, args.groups, args.max_topics)
+        else:
+            plan = schedule(load_catalog(args.catalog), args.groups, args.max_topics)
+    except (OSError, KeyError, ValueError) as e:
+        print(f"❌ {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(plan, indent=2, ensure_ascii=False))
+    else:
+        print_schedule(plan, verbose=not args.benchmark)
+        if args.benchmark:
+            print(f"Scheduling took {plan['stats']['elapsed_ms']} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
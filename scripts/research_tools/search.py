@@ -0,0 +1,650 @@
+"""
+Full-Text Search over the BlueMarble Research Corpus
+=====================================================
+
+Maintains an incremental inverted index over research/ and answers BM25-ranked
+queries with phrase and field filters, so researchers can check whether a topic
+is already covered before adding a new discovered source or analysis document.
+
+Usage:
+    research-tools search "terrain erosion"
+    research-tools search '"level of detail" octree' --limit 5
+    research-tools search "economy title:mmorpg tag:game-design phase:3"
+    research-tools search "crafting" --tag survival --json
+    research-tools search --update        # refresh the index only
+    research-tools search --rebuild       # discard and rebuild
+
+Query syntax:
+    word            scored term (documents matching any term are ranked by BM25)
+    "a phrase"      required phrase; its words must appear consecutively
+    title:word      document title must contain the word
+    tag:value       frontmatter tags must include the value
+    phase:N         frontmatter phase is N, or the filename contains phase-N
+
+Index layout (.cache/search-index/):
+    manifest.json   document table (path, fingerprint, title, tags, phase,
+                    length), tombstones and segment list
+    seg-N.dict      term dictionary: a header, a table of fixed-width entries
+                    sorted by term (term offset/length, df, postings offset,
+                    docs bytes, positions bytes) and the UTF-8 term blob;
+                    looked up by binary search over an mmap, never loaded whole
+    seg-N.post      postings: varint (doc delta, tf) pairs followed by
+                    delta-encoded token positions per document
+
+Each update stats the files under research/, re-tokenizes only changed files
+into a new small segment and tombstones their old versions, so a one-file edit
+costs about as much as indexing that file. Once there are too many segments the
+small ones are merged together; a full merge only happens when a large share
+of the indexed documents has been tombstoned.
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .corpus_index import REPO_ROOT, iter_headings, parse_headings
+from .frontmatter import parse_frontmatter
+from .lazy import LazyRegex
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_DIR = REPO_ROOT / ".cache" / "search-index"
+DEFAULT_CORPUS_DIR = "research"
+
+# Merge segments once there are more than this many, or this share is tombstoned
+MAX_SEGMENTS = 8
+MAX_DELETED_RATIO = 0.25
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+DICT_MAGIC = b"BMSD"
+DICT_HEADER = struct.Struct("<4sI")
+DICT_ENTRY = struct.Struct("<IIIQII")
+
+_token_regex = LazyRegex(r"[^\W_]+")
+_query_regex = LazyRegex(r'"([^"]+)"|(\w+):("[^"]+"|\S+)|(\S+)')
+_phase_name_regex = LazyRegex(r"phase-(\d+)")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; very long tokens (hashes, base64) are dropped"""
+    return [t for t in _token_regex.findall(text.lower()) if len(t) <= 40]
+
+
+def encode_varints(values, out: bytearray):
+    """Append unsigned LEB128 varints to out"""
+    if not values:
+        return
+    if max(values) < 0x80:
+        # Common case for deltas and term frequencies: one byte each
+        out += bytes(values)
+        return
+    for value in values:
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+
+def decode_varints(buf) -> List[int]:
+    """Decode a buffer of unsigned LEB128 varints"""
+    values = []
+    append = values.append
+    value = shift = 0
+    for byte in buf:
+        if byte & 0x80:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+        else:
+            append(value | (byte << shift))
+            value = shift = 0
+    return values
+
+
+def document_metadata(rel_path: str, content: str) -> Dict:
+    """Title, tags and phase used by field filters"""
+    frontmatter, _ = parse_frontmatter(content)
+    frontmatter = frontmatter or {}
+
+    title = frontmatter.get("title")
+    if not title:
+        title = next((h["text"] for h in iter_headings(parse_headings(content)) if h["level"] == 1), "")
+
+    tags = frontmatter.get("tags") or []
+    if isinstance(tags, str):
+        tags = [t.strip() for t in tags.split(",")]
+
+    phase = frontmatter.get("phase")
+    if phase is None:
+        match = _phase_name_regex.search(os.path.basename(rel_path))
+        phase = match.group(1) if match else None
+
+    return {
+        "title": str(title),
+        "tags": sorted({str(t).lower() for t in tags if t}),
+        "phase": str(phase) if phase is not None else None,
+    }
+
+
+class Segment:
+    """A read-only segment: term dictionary plus postings file"""
+
+    def __init__(self, index_dir: Path, name: str):
+        self.name = name
+        self.post_path = index_dir / f"{name}.post"
+        with open(index_dir / f"{name}.dict", "rb") as f:
+            self._dict = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = DICT_HEADER.unpack_from(self._dict, 0)
+        if magic != DICT_MAGIC:
+            raise ValueError(f"{name}.dict is not a search dictionary")
+        self._blob_start = DICT_HEADER.size + self.count * DICT_ENTRY.size
+        self._post = None
+
+    def _entry(self, i: int):
+        return DICT_ENTRY.unpack_from(self._dict, DICT_HEADER.size + i * DICT_ENTRY.size)
+
+    def _term_bytes(self, entry) -> bytes:
+        start = self._blob_start + entry[0]
+        return self._dict[start:start + entry[1]]
+
+    def lookup(self, term: str):
+        """Binary search the dictionary; returns (df, offset, docs_len, pos_len) or None"""
+        key = term.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry = self._entry(mid)
+            candidate = self._term_bytes(entry)
+            if candidate < key:
+                lo = mid + 1
+            elif candidate > key:
+                hi = mid
+            else:
+                return entry[2:]
+        return None
+
+    def iter_terms(self):
+        """Yield every term in the segment, in dictionary order"""
+        for i in range(self.count):
+            yield self._term_bytes(self._entry(i)).decode("utf-8")
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._post is None:
+            self._post = open(self.post_path, "rb")
+        self._post.seek(offset)
+        return self._post.read(length)
+
+    def postings(self, term: str):
+        """Return [(doc_id, tf), ...] for a term, or []"""
+        entry = self.lookup(term)
+        if entry is None:
+            return []
+        _, offset, docs_len, _ = entry
+        values = decode_varints(self._read(offset, docs_len))
+        result = []
+        doc_id = 0
+        for i in range(0, len(values), 2):
+            doc_id += values[i]
+            result.append((doc_id, values[i + 1]))
+        return result
+
+    def positions(self, term: str) -> Dict[int, List[int]]:
+        """Return {doc_id: [positions]} for a term"""
+        entry = self.lookup(term)
+        if entry is None:
+            return {}
+        _, offset, docs_len, pos_len = entry
+        deltas = decode_varints(self._read(offset + docs_len, pos_len))
+        result = {}
+        cursor = 0
+        for doc_id, tf in self.postings(term):
+            position = 0
+            doc_positions = []
+            for delta in deltas[cursor:cursor + tf]:
+                position += delta
+                doc_positions.append(position)
+            result[doc_id] = doc_positions
+            cursor += tf
+        return result
+
+    def close(self):
+        self._dict.close()
+        if self._post is not None:
+            self._post.close()
+            self._post = None
+
+
+def write_segment(index_dir: Path, name: str, postings: Dict[str, Dict[int, List[int]]]):
+    """Write {term: {doc_id: [positions]}} as a segment"""
+    entries = bytearray()
+    blob = bytearray()
+    data = bytearray()
+    # Sort by UTF-8 bytes so lookups can compare raw dictionary bytes
+    encoded_terms = sorted((term.encode("utf-8"), term) for term in postings)
+    for key, term in encoded_terms:
+        docs = postings[term]
+        doc_block = bytearray()
+        pos_block = bytearray()
+        previous_doc = 0
+        for doc_id in sorted(docs):
+            positions = docs[doc_id]
+            encode_varints([doc_id - previous_doc, len(positions)], doc_block)
+            previous_doc = doc_id
+            previous_pos = 0
+            deltas = []
+            for position in positions:
+                deltas.append(position - previous_pos)
+                previous_pos = position
+            encode_varints(deltas, pos_block)
+        entries += DICT_ENTRY.pack(len(blob), len(key), len(docs), len(data),
+                                   len(doc_block), len(pos_block))
+        blob += key
+        data += doc_block
+        data += pos_block
+
+    with open(index_dir / f"{name}.post", "wb") as f:
+        f.write(data)
+    with open(index_dir / f"{name}.dict", "wb") as f:
+        f.write(DICT_HEADER.pack(DICT_MAGIC, len(encoded_terms)))
+        f.write(entries)
+        f.write(blob)
+
+
+class SearchIndex:
+    """Incremental BM25 index over the markdown files of one directory tree"""
+
+    def __init__(self, corpus_dir: str = DEFAULT_CORPUS_DIR, index_dir: Optional[str] = None,
+                 root: Optional[str] = None):
+        self.root = Path(root).resolve() if root else REPO_ROOT
+        self.corpus_dir = corpus_dir.strip("/")
+        self.index_dir = Path(index_dir) if index_dir else DEFAULT_INDEX_DIR
+        self.manifest = self._empty_manifest()
+        self._segments: Dict[str, Segment] = {}
+
+    def _empty_manifest(self) -> Dict:
+        return {
+            "version": INDEX_VERSION,
+            "corpus_dir": self.corpus_dir,
+            "next_doc_id": 1,
+            "next_segment": 1,
+            "docs": {},
+            "paths": {},
+            "deleted": [],
+            "segments": [],
+        }
+
+    # Loading and saving
+
+    def load(self) -> "SearchIndex":
+        """Load the manifest; an incompatible or missing index starts empty"""
+        try:
+            with open(self.index_dir / "manifest.json", "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return self
+        compatible = (
+            manifest.get("version") == INDEX_VERSION
+            and manifest.get("corpus_dir") == self.corpus_dir
+        )
+        if compatible:
+            self.manifest = manifest
+        return self
+
+    def _save_manifest(self):
+        tmp_path = self.index_dir / "manifest.json.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, separators=(",", ":"))
+        os.replace(tmp_path, self.index_dir / "manifest.json")
+
+    def segment(self, name: str) -> Segment:
+        if name not in self._segments:
+            self._segments[name] = Segment(self.index_dir, name)
+        return self._segments[name]
+
+    def close(self):
+        for segment in self._segments.values():
+            segment.close()
+        self._segments.clear()
+
+    # Updating
+
+    def _walk(self):
+        base = self.root / self.corpus_dir
+        for dirpath, dirnames, filenames in os.walk(base):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+            for name in sorted(filenames):
+                if name.endswith(".md"):
+                    full_path = os.path.join(dirpath, name)
+                    yield os.path.relpath(full_path, self.root).replace(os.sep, "/"), full_path
+
+    def update(self, rebuild: bool = False) -> Dict:
+        """Index new and changed files, tombstone removed ones"""
+        if rebuild:
+            self.close()
+            self.manifest = self._empty_manifest()
+            # Segment numbers restart at 1, so drop every old segment (including
+            # those of an incompatible manifest that was never loaded); the
+            # manifest goes first so an interrupted rebuild leaves an empty index
+            for path in [self.index_dir / "manifest.json", *self.index_dir.glob("seg-*.dict"),
+                         *self.index_dir.glob("seg-*.post")]:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        manifest = self.manifest
+        docs, paths = manifest["docs"], manifest["paths"]
+        deleted = set(manifest["deleted"])
+        stats = {"indexed": 0, "removed": 0, "unchanged": 0, "merged": False}
+
+        new_postings: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+        new_doc_ids = []
+        seen = set()
+        touched = rebuild
+
+        for rel_path, full_path in self._walk():
+            seen.add(rel_path)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                continue
+
+            old_id = paths.get(rel_path)
+            old = docs.get(str(old_id)) if old_id is not None else None
+            if old and old["size"] == stat.st_size and old["mtime_ns"] == stat.st_mtime_ns:
+                stats["unchanged"] += 1
+                continue
+
+            with open(full_path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+            if old and old["sha256"] == digest:
+                # Touched but not edited: remember the new stat so it is not hashed again
+                old["size"], old["mtime_ns"] = stat.st_size, stat.st_mtime_ns
+                stats["unchanged"] += 1
+                touched = True
+                continue
+
+            if old_id is not None:
+                deleted.add(old_id)
+            doc_id = manifest["next_doc_id"]
+            manifest["next_doc_id"] += 1
+
+            content = raw.decode("utf-8", errors="replace")
+            tokens = tokenize(content)
+            doc_positions = defaultdict(list)
+            for position, token in enumerate(tokens):
+                doc_positions[token].append(position)
+            for token, positions in doc_positions.items():
+                new_postings[token][doc_id] = positions
+
+            docs[str(doc_id)] = dict(
+                document_metadata(rel_path, content),
+                path=rel_path, size=stat.st_size, mtime_ns=stat.st_mtime_ns,
+                sha256=digest, length=len(tokens),
+            )
+            paths[rel_path] = doc_id
+            new_doc_ids.append(doc_id)
+            stats["indexed"] += 1
+
+        for rel_path in list(paths):
+            if rel_path not in seen:
+                deleted.add(paths.pop(rel_path))
+                stats["removed"] += 1
+
+        for doc_id in deleted:
+            docs.pop(str(doc_id), None)
+        manifest["deleted"] = sorted(deleted)
+
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        if not (new_doc_ids or stats["removed"]):
+            if touched:
+                self._save_manifest()
+            return stats
+
+        if new_doc_ids:
+            name = f"seg-{manifest['next_segment']:06d}"
+            manifest["next_segment"] += 1
+            write_segment(self.index_dir, name, new_postings)
+            manifest["segments"].append(
+                {"name": name, "first_doc": new_doc_ids[0], "last_doc": new_doc_ids[-1]})
+
+        total = len(docs) + len(deleted)
+        if total and len(deleted) / total > MAX_DELETED_RATIO:
+            self._merge(0)
+            stats["merged"] = True
+        elif len(manifest["segments"]) > MAX_SEGMENTS:
+            # Merge only the small segments after the base one, keeping the cost
+            # proportional to recent edits rather than to the whole corpus
+            self._merge(1)
+            stats["merged"] = True
+
+        self._save_manifest()
+        return stats
+
+    def _merge(self, start: int):
+        """Rewrite segments[start:] into one, dropping their tombstoned documents"""
+        manifest = self.manifest
+        deleted = set(manifest["deleted"])
+        merged: Dict[str, Dict[int, List[int]]] = defaultdict(dict)
+
+        old_segments = manifest["segments"][start:]
+        old_names = [segment["name"] for segment in old_segments]
+        for name in old_names:
+            segment = self.segment(name)
+            for term in segment.iter_terms():
+                for doc_id, positions in segment.positions(term).items():
+                    if doc_id not in deleted:
+                        merged[term][doc_id] = positions
+
+        name = f"seg-{manifest['next_segment']:06d}"
+        manifest["next_segment"] += 1
+        write_segment(self.index_dir, name, merged)
+
+        self.close()
+        for old_name in old_names:
+            for suffix in (".dict", ".post"):
+                try:
+                    os.remove(self.index_dir / f"{old_name}{suffix}")
+                except OSError:
+                    pass
+        # Doc ids only grow, so the merged range is contiguous and the
+        # remaining tombstones all belong to segments before it
+        first_doc = old_segments[0]["first_doc"]
+        manifest["segments"] = manifest["segments"][:start] + [
+            {"name": name, "first_doc": first_doc, "last_doc": old_segments[-1]["last_doc"]}
+        ]
+        manifest["deleted"] = [doc_id for doc_id in manifest["deleted"] if doc_id < first_doc]
+
+    # Querying
+
+    @staticmethod
+    def parse_query(query: str) -> Dict:
+        """Split a query string into terms, phrases and field filters"""
+        parsed = {"terms": [], "phrases": [], "title": [], "tag": [], "phase": None}
+        for phrase, field, value, word in _query_regex.findall(query):
+            if phrase:
+                tokens = tokenize(phrase)
+                if tokens:
+                    parsed["phrases"].append(tokens)
+                    parsed["terms"].extend(tokens)
+            elif field:
+                value = value.strip('"')
+                field = field.lower()
+                if field == "title":
+                    parsed["title"].extend(tokenize(value))
+                elif field in ("tag", "tags"):
+                    parsed["tag"].append(value.lower())
+                elif field == "phase":
+                    parsed["phase"] = value
+                else:
+                    parsed["terms"].extend(tokenize(f"{field} {value}"))
+            else:
+                parsed["terms"].extend(tokenize(word))
+        return parsed
+
+    def _passes_filters(self, doc: Dict, parsed: Dict) -> bool:
+        if parsed["title"]:
+            title_tokens = set(tokenize(doc["title"]))
+            if not all(t in title_tokens for t in parsed["title"]):
+                return False
+        if parsed["tag"] and not all(t in doc["tags"] for t in parsed["tag"]):
+            return False
+        if parsed["phase"] is not None and doc["phase"] != str(parsed["phase"]):
+            return False
+        return True
+
+    def _has_phrase(self, doc_id: int, phrase: List[str], positions_cache) -> bool:
+        candidate = None
+        for offset, term in enumerate(phrase):
+            term_positions = positions_cache.get(term, {}).get(doc_id)
+            if not term_positions:
+                return False
+            shifted = {p - offset for p in term_positions}
+            candidate = shifted if candidate is None else candidate & shifted
+            if not candidate:
+                return False
+        return True
+
+    def search(self, query: str, limit: int = 10, title: Optional[List[str]] = None,
+               tags: Optional[List[str]] = None, phase: Optional[str] = None) -> List[Dict]:
+        """Return up to `limit` documents ranked by BM25"""
+        parsed = self.parse_query(query)
+        for value in title or []:
+            parsed["title"].extend(tokenize(value))
+        parsed["tag"].extend(t.lower() for t in tags or [])
+        if phase is not None:
+            parsed["phase"] = str(phase)
+
+        docs = self.manifest["docs"]
+        deleted = set(self.manifest["deleted"])
+        live = len(docs)
+        if live == 0:
+            return []
+        avgdl = sum(doc["length"] for doc in docs.values()) / live
+
+        # Gather postings per term across segments, skipping tombstones
+        term_postings = {}
+        for term in dict.fromkeys(parsed["terms"]):
+            postings = []
+            for segment in self.manifest["segments"]:
+                postings.extend(p for p in self.segment(segment["name"]).postings(term) if p[0] not in deleted)
+            term_postings[term] = postings
+
+        scores: Dict[int, float] = defaultdict(float)
+        for term, postings in term_postings.items():
+            df = len(postings)
+            if df == 0:
+                continue
+            idf = math.log(1 + (live - df + 0.5) / (df + 0.5))
+            for doc_id, tf in postings:
+                length = docs[str(doc_id)]["length"]
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avgdl)
+                scores[doc_id] += idf * tf * (BM25_K1 + 1) / norm
+
+        if not parsed["terms"]:
+            # Filter-only query: list matching documents by path
+            candidates = {int(doc_id): 0.0 for doc_id in docs}
+        else:
+            candidates = scores
+
+        candidates = {
+            doc_id: score for doc_id, score in candidates.items()
+            if self._passes_filters(docs[str(doc_id)], parsed)
+        }
+
+        if parsed["phrases"]:
+            positions_cache = {}
+            for phrase in parsed["phrases"]:
+                for term in phrase:
+                    if term not in positions_cache:
+                        positions_cache[term] = {}
+                        for segment in self.manifest["segments"]:
+                            positions_cache[term].update(self.segment(segment["name"]).positions(term))
+            candidates = {
+                doc_id: score for doc_id, score in candidates.items()
+                if all(self._has_phrase(doc_id, phrase, positions_cache) for phrase in parsed["phrases"])
+            }
+
+        top = heapq.nsmallest(
+            limit, candidates.items(),
+            key=lambda item: (-item[1], docs[str(item[0])]["path"]),
+        )
+        return [
+            {
+                "path": docs[str(doc_id)]["path"],
+                "title": docs[str(doc_id)]["title"],
+                "score": round(score, 4),
+                "tags": docs[str(doc_id)]["tags"],
+                "phase": docs[str(doc_id)]["phase"],
+            }
+            for doc_id, score in top
+        ]
+
+
+def main():
+    """Main execution function"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="BM25 full-text search over the research corpus")
+    parser.add_argument("query", nargs="?", default="", help="Search query (see module docstring)")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
+    parser.add_argument("--title", action="append", help="Require a word in the document title")
+    parser.add_argument("--tag", action="append", help="Require a frontmatter tag")
+    parser.add_argument("--phase", help="Require a research phase")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS_DIR,
+                        help="Directory to index, relative to the repository root (default: research)")
+    parser.add_argument("--index-dir", help="Index directory (default: .cache/search-index)")
+    parser.add_argument("--update", action="store_true", help="Update the index and exit")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the index from scratch")
+    parser.add_argument("--no-update", action="store_true",
+                        help="Query the index as-is without checking for changed files")
+    args = parser.parse_args()
+
+    index = SearchIndex(args.corpus, args.index_dir).load()
+
+    started = time.perf_counter()
+    if not args.no_update or args.rebuild:
+        stats = index.update(rebuild=args.rebuild)
+        elapsed = time.perf_counter() - started
+        if args.update or args.rebuild or stats["indexed"] or stats["removed"]:
+            print(f"Index updated: {stats['indexed']} indexed, {stats['removed']} removed, "
+                  f"{stats['unchanged']} unchanged{' (merged)' if stats['merged'] else ''} "
+                  f"in {elapsed * 1000:.0f} ms", file=sys.stderr)
+    if args.update or args.rebuild:
+        return
+
+    if not (args.query or args.title or args.tag or args.phase):
+        parser.error("a query or at least one filter is required")
+
+    started = time.perf_counter()
+    results = index.search(args.query, args.limit, args.title, args.tag, args.phase)
+    elapsed = time.perf_counter() - started
+    index.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    if not results:
+        print(f"No matches ({elapsed * 1000:.1f} ms)")
+        return
+    for rank, result in enumerate(results, 1):
+        print(f"{rank:2}. [{result['score']:.2f}] {result['path']}")
+        if result["title"]:
+            print(f"    {result['title']}")
+    print(f"\n{len(results)} result(s) in {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+CLI Startup Benchmark
+=====================
+
+Measures how long `research-tools <command> --help` takes in a fresh
+interpreter and which modules it imports, so that a heavy top-level import
+(yaml, requests, urllib.request, a process pool) sneaking into a command module
+shows up before it slows every hook and script that shells out to the CLI.
+
+Each command runs `python -X importtime -m research_tools <command> --help`
+several times; the best wall time is reported next to the cumulative import
+time of the research_tools modules and the heavy modules that were loaded.
+The interpreter's own startup (`python -c pass`) is measured as a baseline.
+
+Usage:
+    research-tools startup-benchmark
+    research-tools startup-benchmark --repeat 10 discover search
+    research-tools startup-benchmark --max-ms 50    # exit 1 above budget
+    research-tools startup-benchmark --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .cli import COMMANDS
+
+# Modules a --help invocation should never need
+HEAVY_MODULES = (
+    "yaml",
+    "requests",
+    "urllib.request",
+    "concurrent.futures",
+    "multiprocessing",
+)
+
+PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+def _environment() -> dict:
+    """Environment that lets `-m research_tools` resolve without installing"""
+    env = dict(os.environ)
+    parent = str(PACKAGE_DIR.parent)
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (parent, env.get("PYTHONPATH")) if p)
+    return env
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Map module name -> (cumulative import time in microseconds, nesting depth)"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        name = parts[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules[name.strip()] = (cumulative, depth)
+    return modules
+
+
+def measure(args: list, repeat: int, env: dict) -> dict:
+    """Best wall time of a subprocess, plus the import profile of one run"""
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+
+    profile = subprocess.run([sys.executable, "-X", "importtime", *args], env=env,
+                             stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                             text=True, check=False)
+    modules = parse_importtime(profile.stderr)
+    # Outermost research_tools imports only; nested ones are in their parents' time
+    package_us = sum(us for name, (us, depth) in modules.items()
+                     if depth == 0 and name.split(".")[0] == "research_tools")
+    return {
+        "wall_ms": round(best * 1000, 1),
+        "package_import_ms": round(package_us / 1000, 1),
+        "heavy_modules": sorted(name for name in HEAVY_MODULES if name in modules),
+    }
+
+
+def run(commands: list, repeat: int) -> dict:
+    """Measure the interpreter baseline, top-level help and each command's help"""
+    env = _environment()
+    baseline = measure(["-c", "pass"], repeat, env)["wall_ms"]
+    results = {"(help)": measure(["-m", "research_tools", "--help"], repeat, env)}
+    for command in commands:
+        results[command] = measure(["-m", "research_tools", command, "--help"], repeat, env)
+    for result in results.values():
+        result["overhead_ms"] = round(result["wall_ms"] - baseline, 1)
+    return {"python": sys.version.split()[0], "baseline_ms": baseline, "commands": results}
+
+
+def print_report(report: dict, max_ms=None):
+    """Table of wall time, overhead over bare interpreter startup and heavy imports"""
+    print(f"Python {report['python']}, bare interpreter startup {report['baseline_ms']:.1f} ms")
+    print()
+    print(f"{'command':<20} {'wall ms':>8} {'overhead':>9} {'pkg imp':>8}  heavy imports")
+    for command, result in report["commands"].items():
+        flag = " !" if max_ms is not None and result["overhead_ms"] > max_ms else ""
+        heavy = ", ".join(result["heavy_modules"]) or "-"
+        print(f"{command:<20} {result['wall_ms']:>8.1f} {result['overhead_ms']:>9.1f} "
+              f"{result['package_import_ms']:>8.1f}  {heavy}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure research-tools CLI startup time")
+    parser.add_argument("commands", nargs="*",
+                        help="Commands to measure (default: all except this one)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Runs per command; the fastest is reported (default: 5)")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Fail when a command's overhead over bare startup exceeds this")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    commands = args.commands or [name for name in COMMANDS if name != "startup-benchmark"]
+    unknown = [name for name in commands if name not in COMMANDS]
+    if unknown:
+        parser.error(f"unknown command(s): {', '.join(unknown)}")
+
+    report = run(commands, max(1, args.repeat))
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.max_ms)
+
+    if args.max_ms is not None:
+        slow = [name for name, result in report["commands"].items()
+                if result["overhead_ms"] > args.max_ms]
+        heavy = [name for name, result in report["commands"].items() if result["heavy_modules"]]
+        if slow or heavy:
+            if not args.json:
+                print()
+                if slow:
+                    print(f"Over {args.max_ms:g} ms budget: {', '.join(slow)}")
+                if heavy:
+                    print(f"Heavy imports on --help: {', '.join(heavy)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,177 @@
+"""
+Local Link-Rot Stub Server
+==========================
+
+An offline stand-in for the web hosts behind harvested citation URLs, used
+to exercise `research-tools check-urls` without network access. The path
+selects the behaviour:
+
+    /ok/...                      200
+    /slow/<ms>/...               200 after <ms> milliseconds
+    /status/<code>/...           that status (404, 410, 500, ...)
+    /redirect/<code>/<path...>   <code> (301, 302, 307, 308) to /<path...>
+    /loop/...                    redirects to itself forever
+    /no-head/...                 405 for HEAD, 200 for GET
+    /rate-limit/...              429 with Retry-After: 1 the first time, then 200
+
+Every response carries Content-Length and connections are kept alive, so
+clients can pool them. The server counts requests per method, TCP
+connections opened and the highest number of concurrent requests per Host
+header, which shows whether a client respects per-host limits. Serving on
+127.0.0.1 and addressing it as both `127.0.0.1` and `localhost` gives two
+"hosts".
+
+Usage:
+    research-tools url-stub --port 8767
+    research-tools check-urls --no-harvest --urls-file urls.txt
+
+On exit (Ctrl+C) the counters are printed.
+"""
+
+import argparse
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+class StubState:
+    """Counters shared by all handler threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = defaultdict(int)
+        self.connections = 0
+        self.in_flight = defaultdict(int)
+        self.max_in_flight = defaultdict(int)
+        self.rate_limited = set()
+
+    def enter(self, host):
+        with self.lock:
+            self.in_flight[host] += 1
+            self.max_in_flight[host] = max(self.max_in_flight[host], self.in_flight[host])
+
+    def leave(self, host):
+        with self.lock:
+            self.in_flight[host] -= 1
+
+    def summary(self):
+        with self.lock:
+            return {
+                "requests": dict(self.requests),
+                "connections": self.connections,
+                "max_in_flight_per_host": dict(self.max_in_flight),
+            }
+
+
+class LinkStubHandler(BaseHTTPRequestHandler):
+    """Answers according to the path; see the module docstring"""
+
+    state = None
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def _respond(self, status, headers=None, body=b""):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _handle(self):
+        host = self.headers.get("Host", "")
+        with self.state.lock:
+            self.state.requests[self.command] += 1
+        self.state.enter(host)
+        try:
+            self._route(host)
+        finally:
+            self.state.leave(host)
+
+    def _route(self, host):
+        parts = [part for part in self.path.split("?")[0].split("/") if part]
+        kind = parts[0] if parts else ""
+
+        if kind == "ok":
+            self._respond(200, body=b"ok\n")
+        elif kind == "slow" and len(parts) > 1 and parts[1].isdigit():
+            time.sleep(int(parts[1]) / 1000)
+            self._respond(200, body=b"slow ok\n")
+        elif kind == "status" and len(parts) > 1 and parts[1].isdigit():
+            self._respond(int(parts[1]), body=b"status\n")
+        elif kind == "redirect" and len(parts) > 1 and parts[1].isdigit() \
+                and int(parts[1]) in REDIRECT_CODES:
+            self._respond(int(parts[1]), {"Location": "/" + "/".join(parts[2:])})
+        elif kind == "loop":
+            self._respond(302, {"Location": self.path})
+        elif kind == "no-head":
+            if self.command == "HEAD":
+                self._respond(405, {"Allow": "GET"})
+            else:
+                self._respond(200, body=b"get only\n")
+        elif kind == "rate-limit":
+            key = (host, self.path)
+            with self.state.lock:
+                first = key not in self.state.rate_limited
+                self.state.rate_limited.add(key)
+            if first:
+                self._respond(429, {"Retry-After": "1"})
+            else:
+                self._respond(200, body=b"ok after retry\n")
+        else:
+            self._respond(404, body=b"not found\n")
+
+    def do_HEAD(self):
+        self._handle()
+
+    def do_GET(self):
+        self._handle()
+
+
+def make_server(host="127.0.0.1", port=0):
+    """Create a stub server; port=0 picks a free port (see server.server_address)"""
+    state = StubState()
+    handler = type("BoundLinkStubHandler", (LinkStubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Local stub hosts for link checking")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port)
+    host, port = server.server_address
+    print(f"Link stub listening on http://{host}:{port} (also http://localhost:{port})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        summary = server.state.summary()
+        print()
+        print(f"Requests: {summary['requests']}, connections: {summary['connections']}")
+        print(f"Max concurrent requests per host: {summary['max_in_flight_per_host']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Wiki Fetch Load Test
+====================
+
+Drives the wiki source processor (`create_bibtex_entry` and
+`fetch_wiki_summary`) with thousands of synthetic article URLs against the
+fault-injecting wiki stub, fully offline, and reports:
+
+- throughput (URLs per second) and wall time
+- p50/p95/p99/max latency per URL, including retries and their waits
+- requests, retries and bytes received
+- URLs that got a summary vs. failed, with the final error types
+
+The stub runs in-process on a free port unless --server points at one
+started with `research-tools wiki-stub`. Faults are seeded per path and
+attempt, so with the same options every run sees the same faults and the
+retry and byte counts are reproducible; only the timings vary.
+
+Results can be saved as a baseline and later runs compared against it:
+throughput below, or a latency percentile above, the baseline by more than
+--tolerance (plus 1 ms of slack for latencies), more retries or a lower
+success rate fail the run with exit status 1.
+
+Usage:
+    research-tools wiki-load --urls 2000 --concurrency 16
+    research-tools wiki-load --latency lognormal:40,0.6 --throttle-rate 0.1 --error-rate 0.02
+    research-tools wiki-load --save-baseline wiki-load-baseline.json
+    research-tools wiki-load --baseline wiki-load-baseline.json --tolerance 0.25
+    research-tools wiki-load --server http://127.0.0.1:8768 --json
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+from .wiki_stub import add_profile_arguments, make_server, profile_from_args
+
+RESULT_FORMAT = "bluemarble-wiki-load"
+# Latencies within this many ms of the baseline are noise, not regressions
+LATENCY_SLACK_MS = 1.0
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return 0.0
+    rank = max(1, int(-(-fraction * len(values) // 1)))
+    return values[min(rank, len(values)) - 1]
+
+
+def run_load(urls: List[str], concurrency: int, retries: int, backoff: float,
+             timeout: float) -> Dict:
+    """Process every URL on a thread pool (one requests.Session per thread)"""
+    import io
+    from concurrent.futures import ThreadPoolExecutor
+    from contextlib import redirect_stdout
+
+    import requests
+
+    from .wiki_sources import create_bibtex_entry, fetch_wiki_summary
+
+    local = threading.local()
+
+    def process(url):
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        stats = {}
+        started = time.perf_counter()
+        entry = create_bibtex_entry(url)
+        summary = fetch_wiki_summary(url, session=local.session, retries=retries,
+                                     backoff=backoff, timeout=timeout, stats=stats)
+        stats["latency_ms"] = (time.perf_counter() - started) * 1000
+        stats["ok"] = entry is not None and summary is not None
+        return stats
+
+    # fetch_wiki_summary prints a warning per failed URL; keep them out of the report
+    with redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            records = list(executor.map(process, urls))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(record["latency_ms"] for record in records)
+    succeeded = sum(record["ok"] for record in records)
+    errors = Counter(record["error"] for record in records if record["error"])
+    return {
+        "urls": len(records),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_per_s": round(len(records) / elapsed, 1) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 0.50), 2),
+            "p95": round(percentile(latencies, 0.95), 2),
+            "p99": round(percentile(latencies, 0.99), 2),
+            "max": round(latencies[-1], 2) if latencies else 0.0,
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        },
+        "requests": sum(record["attempts"] for record in records),
+        "retries": sum(record["retries"] for record in records),
+        "bytes": sum(record["bytes"] for record in records),
+        "succeeded": succeeded,
+        "failed": len(records) - succeeded,
+        "success_rate": round(succeeded / len(records), 4) if records else 0.0,
+        "errors": dict(sorted(errors.items())),
+    }
+
+
+def compare(current: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Regressions of a run against a baseline run, as messages"""
+    now, then = current["results"], baseline["results"]
+    regressions = []
+    if now["throughput_per_s"] < then["throughput_per_s"] * (1 - tolerance):
+        regressions.append(f"throughput {now['throughput_per_s']}/s < baseline "
+                           f"{then['throughput_per_s']}/s")
+    for name in ("p50", "p95", "p99"):
+        limit = then["latency_ms"][name] * (1 + tolerance) + LATENCY_SLACK_MS
+        if now["latency_ms"][name] > limit:
+            regressions.append(f"{name} latency {now['latency_ms'][name]} ms > baseline "
+                               f"{then['latency_ms'][name]} ms")
+    if now["retries"] > then["retries"] * (1 + tolerance):
+        regressions.append(f"retries {now['retries']} > baseline {then['retries']}")
+    if now["success_rate"] < then["success_rate"]:
+        regressions.append(f"success rate {now['success_rate']:.2%} < baseline "
+                           f"{then['success_rate']:.2%}")
+    return regressions
+
+
+def print_report(report: Dict):
+    config, results = report["config"], report["results"]
+    latency = results["latency_ms"]
+    print(f"Wiki fetch load test: {results['urls']} URL(s), concurrency {config['concurrency']}, "
+          f"retries {config['retries']}")
+    profile = config["profile"]
+    if profile:
+        print(f"Stub: latency {profile['latency_ms']} ms, payload {profile['payload_bytes']} B, "
+              f"errors {profile['error_rate']:g}, 429s {profile['throttle_rate']:g}, "
+              f"drops {profile['drop_rate']:g}")
+    print()
+    print(f"Throughput: {results['throughput_per_s']} URL/s ({results['elapsed_s']} s)")
+    print(f"Latency ms: p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  "
+          f"max {latency['max']}")
+    print(f"Requests: {results['requests']} ({results['retries']} retries), "
+          f"{results['bytes'] / 1e6:.1f} MB received")
+    print(f"Succeeded: {results['succeeded']}, failed: {results['failed']}"
+          + (f" {results['errors']}" if results["errors"] else ""))
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Load-test the wiki fetch path offline")
+    parser.add_argument("--urls", type=int, default=2000, help="Number of URLs (default: 2000)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Worker threads (default: 16)")
+    parser.add_argument("--retries", type=int, default=2, help="Retries per URL (default: 2)")
+    parser.add_argument("--backoff", type=float, default=0.05,
+                        help="Base retry backoff in seconds without Retry-After (default: 0.05)")
+    parser.add_argument("--timeout", type=float, default=5.0, help="Request timeout in seconds")
+    parser.add_argument("--server", help="Use a running wiki-stub at this base URL")
+    parser.add_argument("--save-baseline", metavar="FILE", help="Write the results as a baseline")
+    parser.add_argument("--baseline", metavar="FILE", help="Compare against a baseline; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed relative regression (default: 0.2)")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON")
+    add_profile_arguments(parser)
+    parser.set_defaults(latency="lognormal:20,0.5", payload="lognormal:20000,0.5",
+                        error_rate=0.01, throttle_rate=0.02, drop_rate=0.005)
+    args = parser.parse_args()
+
+    if args.urls < 1 or args.concurrency < 1 or args.retries < 0:
+        parser.error("--urls and --concurrency must be positive, --retries non-negative")
+
+    server = None
+    profile = None
+    if args.server:
+        base = args.server.rstrip("/")
+    else:
+        try:
+            stub_profile = profile_from_args(args)
+        except ValueError as e:
+            parser.error(str(e))
+        profile = stub_profile.description
+        server = make_server(stub_profile)
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    urls = [f"{base}/wiki/Synthetic_Article_{n}" for n in range(args.urls)]
+    try:
+        results = run_load(urls, args.concurrency, args.retries, args.backoff, args.timeout)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+    report = {
+        "format": RESULT_FORMAT,
+        "python": sys.version.split()[0],
+        "config": {
+            "urls": args.urls, "concurrency": args.concurrency, "retries": args.retries,
+            "backoff": args.backoff, "timeout": args.timeout, "profile": profile,
+        },
+        "results": results,
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(json.dumps(report, indent=2) + "\n")
+        print(f"✅ Baseline saved to {args.save_baseline}", file=sys.stderr)
+
+    if args.baseline:
+        try:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.loads(f.read())
+        except (OSError, ValueError) as e:
+            print(f"❌ Cannot read baseline: {e}", file=sys.stderr)
+            return 1
+        if baseline.get("format") != RESULT_FORMAT:
+            print(f"❌ {args.baseline} is not a wiki-load result", file=sys.stderr)
+            return 1
+        if baseline["config"] != report["config"]:
+            print("⚠ Baseline was recorded with different options; comparison is approximate",
+                  file=sys.stderr)
+        regressions = compare(report, baseline, args.tolerance)
+        for message in regressions:
+            print(f"❌ Regression: {message}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"✅ Within {args.tolerance:.0%} of baseline", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+"""
+Wikipedia Source Processor for BlueMarble Research
+===================================================
+
+Processes Wikipedia URLs and generates BibTeX entries for sources.bib
+
+Usage:
+    python process-wiki-sources.py <url1> <url2> ...
+    
+Or use the embedded list of URLs to process.
+"""
+
+import re
+import sys
+from urllib.parse import unquote, urlparse
+from datetime import datetime
+
+
+def extract_wiki_title(url):
+    """Extract the page title from Wikipedia URL"""
+    parsed = urlparse(url)
+    path = parsed.path
+    
+    # Extract title from path (e.g., /wiki/Heat -> Heat)
+    match = re.search(r'/wiki/(.+)', path)
+    if match:
+        title = match.group(1)
+        # Decode URL encoding
+        title = unquote(title)
+        # Replace underscores with spaces
+        title = title.replace('_', ' ')
+        return title
+    return None
+
+
+def generate_bibtex_key(title):
+    """Generate a BibTeX key from title"""
+    # Remove special characters and convert to lowercase
+    key = title.lower()
+    # Replace spaces and special chars with underscores
+    key = re.sub(r'[^\w\s-]', '', key)
+    key = re.sub(r'[-\s]+', '_', key)
+    # Remove Wikipedia namespace prefixes
+    key = re.sub(r'^wikipedia:', '', key)
+    return f"wiki_{key}"
+
+
+# Throttling and transient server errors worth another attempt
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+MAX_RETRY_WAIT = 30
+
+
+def _retry_wait(retry_after, fallback):
+    """Seconds to wait before a retry: Retry-After (delta-seconds) if present, capped"""
+    try:
+        return min(max(float(retry_after), 0.0), MAX_RETRY_WAIT)
+    except (TypeError, ValueError):
+        return fallback
+
+
+def fetch_wiki_summary(url, session=None, retries=2, backoff=0.5, timeout=10, stats=None):
+    """Fetch the first paragraph/summary from Wikipedia page
+
+    429 and 5xx responses, connection errors and timeouts are retried up to
+    `retries` times, waiting Retry-After or backoff * 2**attempt seconds.
+    Pass a requests.Session to reuse connections. If `stats` is a dict, the
+    attempts, retries, bytes received and final error are counted into it.
+    """
+    # Imported here so that --help and BibTeX-only code paths start fast
+    import time
+
+    import requests
+
+    http = session or requests
+    if stats is not None:
+        for counter in ("attempts", "retries", "bytes"):
+            stats.setdefault(counter, 0)
+        stats["error"] = None
+
+    for attempt in range(retries + 1):
+        try:
+            # Try to fetch the page
+            response = http.get(url, timeout=timeout)
+            if stats is not None:
+                stats["attempts"] += 1
+                stats["bytes"] += len(response.content)
+            if response.status_code in RETRY_STATUSES and attempt < retries:
+                if stats is not None:
+                    stats["retries"] += 1
+                time.sleep(_retry_wait(response.headers.get("Retry-After"), backoff * 2 ** attempt))
+                continue
+            response.raise_for_status()
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if stats is not None:
+                stats["attempts"] += 1
+            if attempt < retries:
+                if stats is not None:
+                    stats["retries"] += 1
+                time.sleep(backoff * 2 ** attempt)
+                continue
+            return _fetch_failed(url, e, stats)
+        except Exception as e:
+            return _fetch_failed(url, e, stats)
+
+        html = response.text
+
+        # Extract first paragraph from content
+        # Look for the main content area
+        match = re.search(r'<p[^>]*>(.*?)</p>', html, re.DOTALL)
+        if match:
+            text = match.group(1)
+            # Remove HTML tags
+            text = re.sub(r'<[^>]+>', '', text)
+            # Remove reference markers like [1], [2], etc.
+            text = re.sub(r'\[\d+\]', '', text)
+            # Clean up whitespace
+            text = ' '.join(text.split())
+            return text[:200] + '...' if len(text) > 200 else text
+        return None
+
+
+def _fetch_failed(url, error, stats):
+    """Report a fetch that won't be retried; the summary is simply missing"""
+    if stats is not None:
+        stats["error"] = type(error).__name__
+    print(f"Warning: Could not fetch summary from {url}: {error}")
+    return None
+
+
+def generate_bluemarble_note(title, url):
+    """Generate BlueMarble-specific note for the source"""
+    title_lower = title.lower()
+    
+    # Map topics to BlueMarble-relevant descriptions
+    notes = {
+        'hydrological': 'Hydrological modeling for water system simulation and environmental mechanics',
+        'fick': 'Diffusion laws for material transport, gas exchange, and chemical processes',
+        'heat': 'Heat transfer principles for temperature simulation, smelting, and energy systems',
+        'categorization': 'Knowledge organization and taxonomy systems for in-game knowledge bases',
+        'biologick': 'Biological classification systems for flora and fauna taxonomy',
+        'systematika': 'Systematic classification for organizing game world biology and ecosystems',
+    }
+    
+    # Check for matching keywords
+    for keyword, note in notes.items():
+        if keyword in title_lower:
+            return note
+    
+    # Default note based on general topic detection
+    if 'model' in title_lower or 'simulation' in title_lower:
+        return f'{title} for game world simulation and mechanics'
+    elif 'law' in title_lower or 'equation' in title_lower:
+        return f'{title} for physics simulation and game mechanics'
+    else:
+        return f'{title} for game design and world building reference'
+
+
+def create_bibtex_entry(url):
+    """Create a BibTeX entry for a Wikipedia URL"""
+    title = extract_wiki_title(url)
+    if not title:
+        print(f"Error: Could not extract title from {url}")
+        return None
+    
+    key = generate_bibtex_key(title)
+    note = generate_bluemarble_note(title, url)
+    year = datetime.now().year
+    
+    entry = f"""@misc{{{key},
+  title = {{{title}}},
+  author = {{{{Wikipedia contributors}}}},
+  year = {{{year}}},
+  url = {{{url}}},
+  note = {{{note}}}
+}}"""
+    
+    return {
+        'key': key,
+        'title': title,
+        'entry': entry,
+        'url': url
+    }
+
+
+def main():
+    """Main execution function"""
+    # URLs to process from the problem statement
+    urls = [
+        'https://en.wikipedia.org/wiki/Hydrological_model',
+        'https://en.wikipedia.org/wiki/Fick%27s_laws_of_diffusion',
+        'https://en.wikipedia.org/wiki/Heat',
+        'https://en.wikipedia.org/wiki/Wikipedia:Categorization',
+        'https://cs.wikipedia.org/wiki/Biologick%C3%A1_systematika',
+    ]
+    
+    # Allow URLs to be passed as command line arguments
+    if any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        print(f"usage: {sys.argv[0]} [URL ...]")
+        print()
+        print("Create BibTeX entries for Wikipedia URLs (defaults to the built-in list)")
+        return []
+    if len(sys.argv) > 1:
+        urls = sys.argv[1:]
+    
+    print("Processing Wikipedia URLs...")
+    print("=" * 60)
+    
+    entries = []
+    for url in urls:
+        print(f"\nProcessing: {url}")
+        entry_data = create_bibtex_entry(url)
+        if entry_data:
+            entries.append(entry_data)
+            print(f"  Title: {entry_data['title']}")
+            print(f"  Key: {entry_data['key']}")
+    
+    print("\n" + "=" * 60)
+    print("Generated BibTeX Entries:")
+    print("=" * 60)
+    
+    for entry_data in entries:
+        print(f"\n{entry_data['entry']}\n")
+    
+    return entries
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,222 @@
+"""
+Fault-Injecting Wiki Stub Server
+================================
+
+A local stand-in for Wikipedia that serves synthetic article pages for any
+/wiki/<Title> path, with configurable latency, payload size and faults, so
+`research-tools wiki-load` can measure the wiki fetch path offline.
+
+Each request draws, in order:
+
+- a dropped connection (closed without a response) with --drop-rate
+- a 429 with `Retry-After: --retry-after` with --throttle-rate
+- a 503 with --error-rate
+- otherwise a 200 page of about --payload bytes, after --latency
+
+Latency and payload take a distribution: `fixed:20`, `uniform:5,50`,
+`exp:20` (mean), `lognormal:20,0.6` (median, sigma) or just a number.
+Latency is in milliseconds, payload in bytes. Draws are seeded by
+(--seed, path, attempt number for that path), so a run sees the same faults
+regardless of thread scheduling and a retry of a throttled URL can succeed.
+
+Usage:
+    research-tools wiki-stub --port 8768 --latency lognormal:40,0.5 --throttle-rate 0.05
+    research-tools wiki-sources http://127.0.0.1:8768/wiki/Heat
+"""
+
+import argparse
+import math
+import random
+import threading
+import time
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+FILLER = ("Synthetic article text used to exercise the wiki fetch path under load. "
+          "It carries no information beyond its size. ")
+
+
+def parse_distribution(spec: str) -> Callable[[random.Random], float]:
+    """Sampler for 'fixed:A', 'uniform:A,B', 'exp:MEAN', 'lognormal:MEDIAN,SIGMA' or a number"""
+    kind, _, params = spec.partition(":")
+    if not params:
+        kind, params = "fixed", kind
+    try:
+        values = [float(value) for value in params.split(",")]
+    except ValueError:
+        raise ValueError(f"invalid distribution parameters: {spec!r}") from None
+
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "exp" and len(values) == 1:
+        return lambda rng: rng.expovariate(1 / values[0]) if values[0] > 0 else 0.0
+    if kind == "lognormal" and len(values) == 2:
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"unknown distribution {spec!r} (fixed:A, uniform:A,B, exp:MEAN, "
+                     "lognormal:MEDIAN,SIGMA)")
+
+
+class FaultProfile:
+    """What the stub does to each request"""
+
+    def __init__(self, latency="0", payload="20000", error_rate=0.0, throttle_rate=0.0,
+                 drop_rate=0.0, retry_after=0, seed=0):
+        self.latency = parse_distribution(latency)
+        self.payload = parse_distribution(payload)
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.drop_rate = drop_rate
+        self.retry_after = retry_after
+        self.seed = seed
+        self.description = {
+            "latency_ms": latency, "payload_bytes": payload, "error_rate": error_rate,
+            "throttle_rate": throttle_rate, "drop_rate": drop_rate,
+            "retry_after": retry_after, "seed": seed,
+        }
+
+
+class StubState:
+    """Per-path attempt numbers and response counters shared by handler threads"""
+
+    def __init__(self, profile: FaultProfile):
+        self.profile = profile
+        self.lock = threading.Lock()
+        self.attempts = defaultdict(int)
+        self.responses = defaultdict(int)
+        self.bytes_sent = 0
+
+    def next_attempt(self, path) -> int:
+        with self.lock:
+            self.attempts[path] += 1
+            return self.attempts[path]
+
+    def count(self, outcome, sent=0):
+        with self.lock:
+            self.responses[outcome] += 1
+            self.bytes_sent += sent
+
+    def summary(self):
+        with self.lock:
+            return {"responses": dict(self.responses), "bytes_sent": self.bytes_sent}
+
+
+def article_page(title: str, size: int) -> bytes:
+    """HTML page whose first paragraph summarizes the title, padded to about size bytes"""
+    head = (f"<!DOCTYPE html><html><head><title>{title} - Wikipedia</title></head><body>"
+            f"<h1>{title}</h1><p><b>{title}</b> is a synthetic article<sup>[1]</sup> "
+            f"served by the BlueMarble wiki stub.</p>")
+    tail = "</body></html>"
+    padding = max(0, size - len(head) - len(tail))
+    paragraphs = (FILLER * (padding // len(FILLER) + 1))[:padding]
+    return (head + paragraphs + tail).encode("utf-8")
+
+
+class WikiStubHandler(BaseHTTPRequestHandler):
+    """Serves /wiki/<Title> through the fault profile; anything else is a 404"""
+
+    state = None
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.state.count(status, len(body))
+
+    def do_GET(self):
+        path = self.path.split("?")[0]
+        if not path.startswith("/wiki/"):
+            self._send(404, b"not found")
+            return
+
+        profile = self.state.profile
+        attempt = self.state.next_attempt(path)
+        rng = random.Random(f"{profile.seed}:{path}:{attempt}")
+        time.sleep(max(0.0, profile.latency(rng)) / 1000)
+
+        draw = rng.random()
+        if draw < profile.drop_rate:
+            self.state.count("dropped")
+            self.close_connection = True
+            return
+        draw -= profile.drop_rate
+        if draw < profile.throttle_rate:
+            self._send(429, b"too many requests", {"Retry-After": str(profile.retry_after)})
+            return
+        draw -= profile.throttle_rate
+        if draw < profile.error_rate:
+            self._send(503, b"service unavailable")
+            return
+
+        title = path[len("/wiki/"):].replace("_", " ")
+        self._send(200, article_page(title, int(max(0.0, profile.payload(rng)))))
+
+
+def make_server(profile: FaultProfile, host="127.0.0.1", port=0):
+    """Create a stub server; port=0 picks a free port (see server.server_address)"""
+    state = StubState(profile)
+    handler = type("BoundWikiStubHandler", (WikiStubHandler,), {"state": state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.state = state
+    return server
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser):
+    """Fault profile options, shared with wiki-load"""
+    parser.add_argument("--latency", default="0",
+                        help="Response latency in ms: N, fixed:N, uniform:A,B, exp:MEAN, lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--payload", default="20000", help="Page size in bytes (same syntax)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of 503 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Share of 429 responses")
+    parser.add_argument("--drop-rate", type=float, default=0.0,
+                        help="Share of connections closed without a response")
+    parser.add_argument("--retry-after", type=int, default=0,
+                        help="Retry-After seconds sent with 429 (default: 0)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the fault draws")
+
+
+def profile_from_args(args) -> FaultProfile:
+    return FaultProfile(args.latency, args.payload, args.error_rate, args.throttle_rate,
+                        args.drop_rate, args.retry_after, args.seed)
+
+
+def main():
+    """Main execution function"""
+    parser = argparse.ArgumentParser(description="Fault-injecting local Wikipedia stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8768)
+    add_profile_arguments(parser)
+    args = parser.parse_args()
+
+    try:
+        profile = profile_from_args(args)
+    except ValueError as e:
+        parser.error(str(e))
+    server = make_server(profile, args.host, args.port)
+    host, port = server.server_address
+    print(f"Wiki stub listening on http://{host}:{port}/wiki/<Title>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        summary = server.state.summary()
+        print()
+        print(f"Responses: {summary['responses']}, {summary['bytes_sent']} bytes sent")
+
+
+if __name__ == "__main__":
+    main()